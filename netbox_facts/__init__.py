@@ -30,6 +30,25 @@ class FactsConfig(PluginConfig):
         "global_napalm_args": {},
         "valid_interfaces_re": ".*",
         "job_timeout": 1800,
+        "max_workers": 1,
+        "connection_race_stagger": 2,
+        "max_sessions_per_site": None,
+        "max_sessions_per_platform": None,
+        "adaptive_concurrency": True,
+        "slow_connect_threshold": 10,
+        "reachability_failure_threshold": 3,
+        "reachability_backoff_base": 900,
+        "reachability_backoff_max": 86400,
+        "reachability_probe_timeout": 2,
+        "async_engine": False,
+        "async_max_sessions": 100,
+        "report_slowest_devices": 10,
+        "entry_batch_size": 1000,
+        "entry_ingestion": "orm",
+        "bulk_reconciliation": False,
+        "last_seen_changelog": False,
+        "oui_index_ttl": 300,
+        "neighbor_chunk_size": 5000,
     }
 
     def ready(self):
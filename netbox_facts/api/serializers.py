@@ -115,6 +115,7 @@ class CollectionPlanSerializer(NetBoxModelSerializer):
             "detect_only",
             "description",
             "collector_type",
+            "extra_collector_types",
             "comments",
             "devices",
             "device_status",
@@ -129,6 +130,8 @@ class CollectionPlanSerializer(NetBoxModelSerializer):
             "tenants",
             "napalm_driver",
             "napalm_args",
+            "max_workers",
+            "shard_size",
             "tags",
             "custom_fields",
             "created",
@@ -185,6 +188,7 @@ class FactsReportSerializer(serializers.ModelSerializer):
             "status",
             "summary",
             "error_message",
+            "timings",
             "entry_count",
             "created",
             "completed_at",
@@ -2,6 +2,7 @@
 Creates API endpoint URLs for the plugin.
 """
 
+from django.urls import path
 from netbox.api.routers import NetBoxRouter
 
 from . import views
@@ -28,4 +29,7 @@ router.register(
     views.FactsReportViewSet,
 )
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("metrics/", views.MetricsView.as_view(), name="metrics"),
+    *router.urls,
+]
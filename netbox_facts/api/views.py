@@ -1,11 +1,14 @@
 from django.db.models import Count
+from django.http import HttpResponse
+from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.viewsets import NetBoxModelViewSet
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
+from rest_framework.views import APIView
 
-from .. import filtersets, models
+from .. import filtersets, metrics, models
 from ..exceptions import OperationNotSupported
 from ..helpers.applier import apply_entries, skip_entries
 from .serializers import (
@@ -126,3 +129,18 @@ class FactsReportViewSet(NetBoxModelViewSet):
             )
         count = skip_entries(report, entry_pks)
         return Response({"skipped": count})
+
+
+class MetricsView(APIView):
+    """
+    Exposes collection and apply metrics in the Prometheus text format.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def get_view_name(self):
+        return "Metrics"
+
+    def get(self, request):
+        body, content_type = metrics.render()
+        return HttpResponse(body, content_type=content_type)
@@ -35,14 +35,21 @@ class ConnectionTargetChoices(ChoiceSet):
     TARGET_OOB = "oob"
     TARGET_PRIMARY_THEN_OOB = "primary_then_oob"
     TARGET_OOB_THEN_PRIMARY = "oob_then_primary"
+    TARGET_PRIMARY_RACE_OOB = "primary_race_oob"
+    TARGET_OOB_RACE_PRIMARY = "oob_race_primary"
 
     CHOICES = [
         (TARGET_PRIMARY, _("Primary IP"), "blue"),
         (TARGET_OOB, _("OOB IP"), "purple"),
         (TARGET_PRIMARY_THEN_OOB, _("Primary IP, then OOB"), "cyan"),
         (TARGET_OOB_THEN_PRIMARY, _("OOB IP, then Primary"), "teal"),
+        (TARGET_PRIMARY_RACE_OOB, _("Primary IP, racing OOB"), "indigo"),
+        (TARGET_OOB_RACE_PRIMARY, _("OOB IP, racing Primary"), "green"),
     ]
 
+    # Targets that start the fallback attempt in parallel after a short stagger
+    RACING_TARGETS = (TARGET_PRIMARY_RACE_OOB, TARGET_OOB_RACE_PRIMARY)
+
 
 class CollectorStatusChoices(ChoiceSet):
     NEW = "new"
@@ -185,6 +185,12 @@ class CollectorForm(NetBoxModelForm):
         label=_("Devices"), queryset=Device.objects.all(), required=False, selector=True
     )
     device_status = MultipleChoiceField(choices=DeviceStatusChoices, required=False, label=_("Device Statuses"))
+    extra_collector_types = MultipleChoiceField(
+        choices=CollectionTypeChoices,
+        required=False,
+        label=_("Additional collector types"),
+        help_text=_("Run these collectors too, over the same device session"),
+    )
     device_types = DynamicModelMultipleChoiceField(
         label=_("Device types"), queryset=DeviceType.objects.all(), required=False, selector=True
     )
@@ -227,6 +233,7 @@ class CollectorForm(NetBoxModelForm):
             "name",
             "priority",
             "collector_type",
+            "extra_collector_types",
             "description",
             "enabled",
             "detect_only",
@@ -252,7 +259,9 @@ class CollectorForm(NetBoxModelForm):
             "interval",
             name=_("Scheduling"),
         ),
-        FieldSet("napalm_driver", "napalm_args", "connection_target", name=_("Runtime settings")),
+        FieldSet(
+            "napalm_driver", "napalm_args", "connection_target", "max_workers", "shard_size", name=_("Runtime settings")
+        ),
     )
 
     class Meta:
@@ -261,6 +270,7 @@ class CollectorForm(NetBoxModelForm):
             "name",
             "priority",
             "collector_type",
+            "extra_collector_types",
             "description",
             "enabled",
             "detect_only",
@@ -282,6 +292,8 @@ class CollectorForm(NetBoxModelForm):
             "napalm_driver",
             "napalm_args",
             "connection_target",
+            "max_workers",
+            "shard_size",
         )
 
     def __init__(self, *args, **kwargs):  # pylint: disable=no-member
@@ -291,9 +303,10 @@ class CollectorForm(NetBoxModelForm):
                 CollectionTypeChoices.TYPE_BGP,
                 CollectionTypeChoices.TYPE_OSPF,
             }
-            self.fields["collector_type"].choices = [
-                c for c in self.fields["collector_type"].choices if c[0] not in routing_types
-            ]
+            for field_name in ("collector_type", "extra_collector_types"):
+                self.fields[field_name].choices = [
+                    c for c in self.fields[field_name].choices if c[0] not in routing_types
+                ]
         now = local_now().strftime("%Y-%m-%d %H:%M:%S %Z")
         self.fields["scheduled_at"].help_text += _(" (current server time: <strong>{now}</strong>)").format(now=now)
 
@@ -2,6 +2,8 @@
 
 import ipaddress
 import logging
+import time
+from collections import Counter
 
 from dcim.models.device_components import Interface, InventoryItem, ModuleBay
 from dcim.models.devices import Device
@@ -14,6 +16,7 @@ from extras.models.models import JournalEntry
 from ipam.models.ip import IPAddress, Prefix
 from ipam.models.vrfs import VRF
 
+from netbox_facts import metrics
 from netbox_facts.choices import (
     CollectionTypeChoices,
     EntryActionChoices,
@@ -43,7 +46,9 @@ def apply_entries(report, entry_pks):
     entries = report.entries.filter(pk__in=entry_pks, status=EntryStatusChoices.STATUS_PENDING)
     applied = 0
     failed = 0
+    processed = Counter()
     now = timezone.now()
+    started = time.monotonic()
 
     with transaction.atomic():
         for entry in entries:
@@ -53,6 +58,7 @@ def apply_entries(report, entry_pks):
                 entry.error_message = f"No apply handler for collector type '{entry.collector_type}'"
                 entry.save(update_fields=["status", "error_message"])
                 failed += 1
+                processed[entry.collector_type, entry.status] += 1
                 continue
 
             try:
@@ -68,8 +74,13 @@ def apply_entries(report, entry_pks):
                 entry.save(update_fields=["status", "error_message"])
                 failed += 1
                 logger.warning("Failed to apply entry %s: %s", entry.pk, exc)
+            processed[entry.collector_type, entry.status] += 1
 
         _update_report_status(report)
+
+    for (collector_type, status), count in processed.items():
+        metrics.ENTRIES_APPLIED.labels(collector_type=collector_type, status=status).inc(count)
+    metrics.APPLY_DURATION.observe(time.monotonic() - started)
     return applied, failed
 
 
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import ipaddress
 import re
-from collections.abc import Generator
-from itertools import groupby
-from typing import TYPE_CHECKING, Any
+import socket
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import chain, islice, zip_longest
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import django.core.exceptions
 import django.db
+from asgiref.sync import async_to_sync, sync_to_async
 from dcim.models.device_components import Interface, InventoryItem, ModuleBay
 from dcim.models.devices import Device
 from dcim.models.modules import Module, ModuleType
@@ -30,19 +41,31 @@ from napalm.base.exceptions import (
 )
 from netbox.plugins.utils import get_plugin_config
 
+from netbox_facts import metrics
 from netbox_facts.choices import (
     CollectionTypeChoices,
+    ConnectionTargetChoices,
     EntryActionChoices,
     EntryStatusChoices,
     ReportStatusChoices,
 )
 from netbox_facts.constants import AUTO_D_TAG
 from netbox_facts.exceptions import CollectionError
+from netbox_facts.helpers.entry_buffer import EntryBuffer
+from netbox_facts.helpers.governor import ConcurrencyGovernor
 from netbox_facts.helpers.napalm import (
     get_network_instances_by_interface,
     parse_network_instances,
 )
 from netbox_facts.helpers.netbox import (
+    bulk_get_asns,
+    bulk_get_ips,
+    bulk_get_macs,
+    bulk_get_or_create_asns,
+    bulk_get_or_create_ips,
+    bulk_get_or_create_macs,
+    bulk_journal,
+    bulk_resolve_vrfs,
     create_module,
     detect_interface_type,
     duplicate_object_warning,
@@ -50,13 +73,19 @@ from netbox_facts.helpers.netbox import (
     get_connection_ips,
     get_or_create_ip,
     get_or_create_mac,
+    ip_key,
+    mac_key,
     resolve_device_by_name,
     resolve_napalm_interfaces_ip_addresses,
     resolve_napalm_network_instances,
     resolve_vrf,
+    touch_last_seen,
 )
-from netbox_facts.models.mac import MACAddress
+from netbox_facts.helpers.prefixes import PrefixIndex, SubnetMatcher, addresses_to_ints, int_to_address
+from netbox_facts.models.mac import MACAddress, MACAddressInterfaceRelation, MACAddressIPAddressRelation
+from netbox_facts.models.reachability import DeviceReachability
 from netbox_facts.napalm.junos import EnhancedJunOSDriver
+from netbox_facts.napalm.junos_async import HAS_ASYNCSSH, AsyncNetconfSession, ReplayDevice
 
 if TYPE_CHECKING:
     from netbox_facts.models.collection_plan import CollectionPlan
@@ -71,15 +100,105 @@ except ImportError:
     HAS_NETBOX_ROUTING = False
 
 
+# Driver getters whose RPCs the asyncio engine prefetches for each collector.
+ASYNC_ENGINE_GETTERS = {
+    CollectionTypeChoices.TYPE_ARP: ("get_arp_table", "get_network_instances", "get_interfaces_ip"),
+    CollectionTypeChoices.TYPE_NDP: ("get_ipv6_neighbors_table", "get_network_instances", "get_interfaces_ip"),
+    CollectionTypeChoices.TYPE_INTERFACES: ("get_interfaces",),
+    CollectionTypeChoices.TYPE_INVENTORY: ("get_facts", "get_chassis_inventory"),
+}
+
+
+@dataclass
+class DeviceContext:
+    """State scoped to the device currently being collected by a worker thread."""
+
+    device: Device | None = None
+    log_prefix: str = ""
+    collector_type: str = ""
+    seen_ips: set = field(default_factory=set)
+    # MACAddress PKs whose last_seen is written when the device is done
+    touched_macs: set = field(default_factory=set)
+    bgp_routing_data: dict | None = None
+    # Seconds spent per phase, plus per driver call under "calls"
+    timings: dict = field(default_factory=dict)
+    # True while reconciling replies prefetched by the asyncio engine, when
+    # driver calls only parse cached XML.
+    replaying: bool = False
+    # Report entries waiting to be written
+    entries: EntryBuffer = field(default_factory=EntryBuffer)
+    # VC interfaces by device PK, then name, for the running collector method
+    interfaces: dict = field(default_factory=dict)
+    # MACAddress objects (None if missing) by mac_key(), for the running collector method
+    macs: dict = field(default_factory=dict)
+    # Interface names already reported missing from NetBox, for the running ARP/NDP table
+    missing_interfaces: set = field(default_factory=set)
+
+
+class NeighborFact(NamedTuple):
+    """An ARP/NDP entry resolved against NetBox, awaiting reconciliation."""
+
+    mac: str
+    interface: Interface
+    address: str
+    vrf: VRF | None
+    ip_address: IPAddress | None
+    mac_entry: FactsReportEntry | None
+    ip_entry: FactsReportEntry | None
+
+
+class InterfaceIPFact(NamedTuple):
+    """An IP address configured on a logical interface, awaiting reconciliation."""
+
+    interface: Interface
+    address: str
+    network: ipaddress.IPv4Network | ipaddress.IPv6Network
+    vrf: VRF | None
+
+
+class BGPPeerFact(NamedTuple):
+    """A BGP peer of a device, awaiting resolution of its IP address and ASN."""
+
+    vrf_name: str
+    vrf: VRF | None
+    as_number: str
+    peer: dict
+    remote_address: str
+    address: str
+
+
+def flushes_entries(method):
+    """Write the report entries buffered by a collector method once it returns.
+
+    The interfaces and MAC addresses it looked up are dropped too, so the
+    next collector sees changes made in between.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_entries()
+            self._ctx.interfaces.clear()
+            self._ctx.macs.clear()
+
+    return wrapper
+
+
 class NapalmCollector:
     """Class to run collection jobs."""
 
     # TODO Implement live status updates
     # https://github.com/netbox-community/netbox/compare/develop...JCWasmx86:netbox:progress_in_scripts
 
-    def __init__(self, plan) -> None:
+    def __init__(self, plan, device_ids=None, report=None) -> None:
         self.plan: CollectionPlan = plan
-        self._collector_type = plan.collector_type
+        # Device-scoped state lives in a per-thread DeviceContext so that
+        # concurrent workers in execute() don't clobber each other.
+        self._local = threading.local()
+        self._collector_types: list[str] = plan.get_collector_types()
+        self._collector_type = self._collector_types[0]
         self._napalm_args = plan.get_napalm_args()
         self._napalm_driver: type[NetworkDriver] | None = None
         # Per-plan username/password override global defaults
@@ -97,12 +216,13 @@ class NapalmCollector:
         if napalm_timeout and "timeout" not in self._napalm_args:
             self._napalm_args["timeout"] = napalm_timeout
         self._devices = Device.objects.none()
-        self._current_device: Device | None = None
-        self._log_prefix = ""
+        self._max_workers: int = plan.get_max_workers()
+        self._governor = self._build_governor(self._max_workers)
+        # Per-device phase timings for the report, keyed by device ID
+        self.device_timings: dict[str, dict] = {}
         self._now = timezone.now()
-        self._report: FactsReport | None = None
+        self._report: FactsReport | None = report
         self._detect_only: bool = getattr(plan, "detect_only", False)
-        self._seen_ips: set = set()
 
         # Get the NAPALM driver
         try:
@@ -110,8 +230,69 @@ class NapalmCollector:
         except (ModuleImportError, ModuleNotFoundError) as exc:
             raise CollectionError(f"There was an error initializing the napalm driver: {exc}") from exc
 
-        # Get the devices to collect from
+        # Get the devices to collect from, optionally narrowed to one shard
         self._devices = plan.get_devices_queryset()
+        if device_ids is not None:
+            self._devices = self._devices.filter(pk__in=device_ids)
+
+    @property
+    def _ctx(self) -> DeviceContext:
+        """Return the DeviceContext of the calling thread, creating it if needed."""
+        ctx = getattr(self._local, "ctx", None)
+        if ctx is None:
+            ctx = self._local.ctx = DeviceContext()
+        return ctx
+
+    @property
+    def _collector_type(self) -> str:
+        """The collector type currently running in this thread."""
+        return self._ctx.collector_type
+
+    @_collector_type.setter
+    def _collector_type(self, value: str):
+        self._ctx.collector_type = value
+
+    @property
+    def _current_device(self) -> Device | None:
+        return self._ctx.device
+
+    @_current_device.setter
+    def _current_device(self, value: Device | None):
+        self._ctx.device = value
+
+    @property
+    def _log_prefix(self) -> str:
+        return self._ctx.log_prefix
+
+    @_log_prefix.setter
+    def _log_prefix(self, value: str):
+        self._ctx.log_prefix = value
+
+    @property
+    def _seen_ips(self) -> set:
+        return self._ctx.seen_ips
+
+    @_seen_ips.setter
+    def _seen_ips(self, value: set):
+        self._ctx.seen_ips = value
+
+    @property
+    def _bgp_routing_data(self) -> dict | None:
+        return self._ctx.bgp_routing_data
+
+    @_bgp_routing_data.setter
+    def _bgp_routing_data(self, value: dict | None):
+        self._ctx.bgp_routing_data = value
+
+    @staticmethod
+    def _build_governor(global_limit: int) -> ConcurrencyGovernor:
+        """Return a ConcurrencyGovernor for *global_limit* concurrent sessions."""
+        return ConcurrencyGovernor(
+            global_limit,
+            site_limit=get_plugin_config("netbox_facts", "max_sessions_per_site"),
+            platform_limit=get_plugin_config("netbox_facts", "max_sessions_per_platform"),
+            adaptive=get_plugin_config("netbox_facts", "adaptive_concurrency", True),
+        )
 
     def _should_apply(self) -> bool:
         """Return True if mutations should be performed (detect_only is False)."""
@@ -133,6 +314,45 @@ class NapalmCollector:
                 rendered.append(str(part))
         return " on ".join(rendered)
 
+    def _add_timing(self, phase: str, seconds: float, call: str | None = None, ctx: DeviceContext | None = None):
+        """Add *seconds* to *phase* of the current device, and to *call* if given."""
+        timings = (ctx or self._ctx).timings
+        timings[phase] = timings.get(phase, 0.0) + seconds
+        if call:
+            calls = timings.setdefault("calls", {})
+            calls[call] = calls.get(call, 0.0) + seconds
+
+    @contextmanager
+    def _timed(self, phase: str, call: str | None = None):
+        """Time the enclosed block as *phase* of the current device."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._add_timing(phase, time.monotonic() - started, call)
+
+    @contextmanager
+    def _timed_driver_call(self, label: str):
+        """Time a driver getter: an RPC on a live session, only parsing when replaying."""
+        replaying = self._ctx.replaying
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            seconds = time.monotonic() - started
+            self._add_timing("parse" if replaying else "rpc", seconds, label)
+            if not replaying:
+                metrics.RPC_DURATION.labels(call=label).observe(seconds)
+
+    def _store_device_timings(self, ctx: DeviceContext):
+        """Keep the rounded timings of *ctx*'s device for the report."""
+        if ctx.device is None or not ctx.timings:
+            return
+        timings = {phase: round(value, 3) for phase, value in ctx.timings.items() if phase != "calls"}
+        timings.setdefault("total", round(sum(timings.values()), 3))
+        timings["calls"] = {call: round(value, 3) for call, value in ctx.timings.get("calls", {}).items()}
+        self.device_timings[str(ctx.device.pk)] = {"name": str(ctx.device), **timings}
+
     def _record_entry(
         self,
         action: str,
@@ -143,7 +363,11 @@ class NapalmCollector:
         object_instance=None,
         object_repr: str = "",
     ) -> FactsReportEntry | None:
-        """Create a FactsReportEntry. Returns the entry or None if no report."""
+        """Buffer a new FactsReportEntry. Returns the entry or None if no report.
+
+        The entry is written by :meth:`_flush_entries`, so it has no primary
+        key until then.
+        """
         if self._report is None:
             return None
 
@@ -155,7 +379,7 @@ class NapalmCollector:
             ct = ContentType.objects.get_for_model(object_instance)
             obj_id = object_instance.pk
 
-        entry = FactsReportEntry.objects.create(
+        entry = FactsReportEntry(
             report=self._report,
             action=action,
             status=EntryStatusChoices.STATUS_PENDING,
@@ -167,6 +391,9 @@ class NapalmCollector:
             detected_values=detected_values,
             current_values=current_values or {},
         )
+        with self._timed("entries"):
+            self._ctx.entries.add(entry)
+        metrics.REPORT_ENTRIES.labels(collector_type=collector_type, action=action).inc()
         return entry
 
     def _mark_entry_applied(self, entry, object_instance=None, object_repr=None):
@@ -175,50 +402,121 @@ class NapalmCollector:
             return
         entry.status = EntryStatusChoices.STATUS_APPLIED
         entry.applied_at = timezone.now()
-        update_fields = ["status", "applied_at"]
         if object_instance is not None and hasattr(object_instance, "pk") and object_instance.pk:
             entry.object_type = ContentType.objects.get_for_model(object_instance)
             entry.object_id = object_instance.pk
-            update_fields.extend(["object_type", "object_id"])
         if object_repr is not None:
             entry.object_repr = object_repr
-            update_fields.append("object_repr")
-        entry.save(update_fields=update_fields)
+        with self._timed("entries"):
+            self._ctx.entries.changed(entry)
+
+    def _flush_entries(self):
+        """Write the report entries buffered for the current device."""
+        with self._timed("entries"):
+            self._ctx.entries.flush()
 
     def _get_network_instances(self, driver: NetworkDriver) -> Generator[tuple[str, dict], None, None]:
         """Get network instances organized by interface from a device."""
-        return get_network_instances_by_interface(
-            resolve_napalm_network_instances(parse_network_instances(driver.get_network_instances()))
-        )
+        with self._timed_driver_call("network instances"):
+            instances = driver.get_network_instances()
+        return get_network_instances_by_interface(resolve_napalm_network_instances(parse_network_instances(instances)))
 
     def _ip_neighbors(
         self,
         driver: NetworkDriver | EnhancedJunOSDriver,
-        table: Generator[dict[str, Any], None, None],
+        table: Iterable[dict[str, Any]],
     ):
         """Manage IPv4 and IPv6 neighbors from a device."""
         # Shuffles the network instances into a dict with interface names as keys
         network_instances = dict(self._get_network_instances(driver))
 
-        interfaces_ip = dict(resolve_napalm_interfaces_ip_addresses(driver.get_interfaces_ip(), network_instances))
-        table_as_list = list(table)
+        with self._timed_driver_call("interface IP data"):
+            raw_interfaces_ip = driver.get_interfaces_ip()
+        interfaces_ip = dict(resolve_napalm_interfaces_ip_addresses(raw_interfaces_ip, network_instances))
+        # One query for the prefixes of every interface subnet, checked in memory per neighbor
+        prefix_index = PrefixIndex.covering(
+            data["ip_interface_object"].network for addresses in interfaces_ip.values() for data in addresses.values()
+        )
+
+        # Built on first use, once per interface for the whole table
+        @functools.cache
+        def subnet_matcher(interface_name):
+            return self._subnet_matcher(interface_name, interfaces_ip.get(interface_name, {}), prefix_index)
+
+        # Consume the table in chunks so large tables are never held in memory whole
+        seen_ips = set()  # Track (cidr_str, vrf_id) for stale detection
+        self._ctx.missing_interfaces.clear()
+        chunk_size = get_plugin_config("netbox_facts", "neighbor_chunk_size", 5000)
+        table = iter(table)
+        while chunk := list(islice(table, chunk_size)):
+            self._ip_neighbors_chunk(chunk, subnet_matcher, seen_ips)
+
+        # Detect stale IPs: previously discovered IPs on this device
+        # that are no longer present in the current ARP/NDP table.
+        # Filter by IP family so ARP only flags v4, NDP only flags v6.
+        if self._current_device and seen_ips:
+            ip_family = 6 if self._collector_type == CollectionTypeChoices.TYPE_NDP else 4
+            device_macs = MACAddress.objects.filter(interfaces__in=self._current_device.vc_interfaces()).distinct()
+            known_ips = (
+                IPAddress.objects.filter(mac_addresses__in=device_macs)
+                .filter(tags__name=AUTO_D_TAG, address__family=ip_family)
+                .select_related("vrf")
+                .distinct()
+            )
+            for ip_obj in known_ips:
+                key = (str(ip_obj.address), ip_obj.vrf_id)
+                if key not in seen_ips:
+                    self._record_entry(
+                        action=EntryActionChoices.ACTION_STALE,
+                        collector_type=self._collector_type,
+                        device=self._current_device,
+                        detected_values={},
+                        current_values={
+                            "ip": str(ip_obj.address),
+                            "vrf": str(ip_obj.vrf) if ip_obj.vrf else None,
+                        },
+                        object_instance=ip_obj,
+                        object_repr=self._object_repr(ip_obj),
+                    )
+                    self._log_info(f"IP {ip_obj.address} not seen in current table — flagged as stale.")
+
+    def _subnet_matcher(self, interface_name, interface_ip_data, prefix_index) -> SubnetMatcher:
+        """Return a matcher of the interface subnets to ``(IP data, has NetBox prefix)`` pairs."""
+        subnets = []
+        for data in interface_ip_data.values():
+            if data.get("netbox_vrf", False) is False:
+                self._log_warning(
+                    f"Could not find a VRF named `{data.get('routing_instance_name')}`"
+                    + f" in NetBox for interface `{interface_name}`."
+                )
+                continue
+            network = data["ip_interface_object"].network
+            subnets.append((network, (data, prefix_index.contains(network, data["netbox_vrf"]))))
+        return SubnetMatcher(subnets)
+
+    def _ip_neighbors_chunk(self, chunk: list[dict], subnet_matcher, seen_ips: set):
+        """Record and apply one chunk of an ARP/NDP table.
+
+        Incomplete and unreachable entries are dropped, the rest bucketed by
+        interface, whatever the order of the table. Existing MACs and IPs are
+        fetched for the chunk only.
+        """
+        # Skip incomplete and unreachable entries
+        table_as_list = [entry for entry in chunk if entry["mac"] and entry.get("state", "") != "unreachable"]
+
+        # Convert every address once for the chunk, dropping malformed ones
+        address_ints, malformed = addresses_to_ints(entry["ip"] for entry in table_as_list)
+        for address in malformed:
+            self._log_warning(f"Invalid IP address `{address}`. Skipping.")
+        if malformed:
+            table_as_list = [entry for entry in table_as_list if entry["ip"] in address_ints]
 
-        # Pre-fetch existing MACs in bulk to avoid N+1 queries
-        all_macs = {entry["mac"] for entry in table_as_list if entry["mac"] and entry.get("state", "") != "unreachable"}
-        existing_macs_by_addr = {}
-        if all_macs:
-            for mac_obj in MACAddress.objects.filter(mac_address__in=all_macs):
-                key = str(mac_obj.mac_address).replace(":", "").upper()
-                existing_macs_by_addr[key] = mac_obj
+        # Pre-fetch existing MACs in bulk to avoid N+1 queries, keeping only this chunk's
+        self._ctx.macs.clear()
+        self._prefetch_macs(entry["mac"] for entry in table_as_list)
 
         # Pre-fetch existing IPs in bulk to avoid N+1 queries
-        all_raw_ips = list(
-            {
-                entry["ip"]
-                for entry in table_as_list
-                if entry["ip"] and entry["mac"] and entry.get("state", "") != "unreachable"
-            }
-        )
+        all_raw_ips = list({entry["ip"] for entry in table_as_list if entry["ip"]})
         existing_ips_map = {}  # (cidr_str, vrf_id) -> IPAddress
         if all_raw_ips:
             for ip_obj in (
@@ -235,20 +533,25 @@ class NapalmCollector:
                 key = (str(ip_obj.address), ip_obj.vrf_id)
                 existing_ips_map[key] = ip_obj
 
-        seen_ips = set()  # Track (cidr_str, vrf_id) for stale detection
+        neighbors: list[NeighborFact] = []
+
+        by_interface: dict[str, list[dict]] = {}
+        for entry in table_as_list:
+            by_interface.setdefault(entry["interface"], []).append(entry)
 
-        for interface_name, arp_data in groupby(table_as_list, key=lambda x: x["interface"]):
+        for interface_name, arp_data in by_interface.items():
             # Skip interfaces that don't match the configured regex
             if not self._interfaces_re.match(interface_name):
                 continue
 
             # Get the matching interface from NetBox or skip this interface if it doesn't exist
             try:
-                netbox_interface = self._current_device.vc_interfaces().get(  # pylint: disable=no-member # type: ignore
-                    name=interface_name
-                )
+                netbox_interface = self._get_interface(self._current_device, interface_name)
             except Interface.DoesNotExist:  # pylint: disable=no-member
-                arp_data = list(arp_data)
+                # Warn once per table, not once per chunk
+                if interface_name in self._ctx.missing_interfaces:
+                    continue
+                self._ctx.missing_interfaces.add(interface_name)
                 message = f"Could not find interface `{interface_name}` in NetBox for "
 
                 if len(arp_data) > 5:
@@ -259,45 +562,21 @@ class NapalmCollector:
                 self._log_warning(message)
                 continue
 
-            # Get the IP information for this interface
-            interface_ip_data = interfaces_ip.get(interface_name, {})
+            # Match the whole group to the interface subnets in one pass
+            values = [address_ints[arp_entry["ip"]] for arp_entry in arp_data]
+            matches = subnet_matcher(interface_name).match_all(values)
 
             # Iterate over ARP entries for this interface
-            for arp_entry in arp_data:
-                if arp_entry["mac"] == "":
-                    # Skip incomplete ARP entries
-                    continue
-                if arp_entry.get("state", "") == "unreachable":
-                    # Skip unreachable ARP entries
-                    continue
-
-                # Build a proper ip_interface_object from the IP and prefix length
-                ip_interface_object = None
-                routing_instance = None
-                netbox_prefix_qs = Prefix.objects.none()
-                for data in interface_ip_data.values():
-                    routing_instance = data.get("netbox_vrf", False)
-
-                    if routing_instance is False:
-                        self._log_warning(
-                            f"Could not find a VRF named `{data.get('routing_instance_name')}`"
-                            + f" in NetBox for interface `{interface_name}`."
-                        )
-                        continue
-
-                    if arp_entry["ip"] in data["ip_interface_object"].network:
-                        ip_interface_object = ipaddress.ip_interface(f"{arp_entry['ip']}/{data['prefix_length']}")
-                        routing_instance = data.get("netbox_vrf")
-                        netbox_prefix_qs = data.get("netbox_prefixes")
-                        break
-                if ip_interface_object is None:
+            for arp_entry, (version, value), match in zip(arp_data, values, matches, strict=True):
+                if match is None:
                     self._log_warning(
                         f"Could not determine prefix length for `{arp_entry['ip']}` "
                         f"on interface `{interface_name}`. Skipping."
                     )
                     continue
-
-                if not netbox_prefix_qs.exists():
+                data, has_prefix = match
+                routing_instance = data["netbox_vrf"]
+                if not has_prefix:
                     message = (
                         f"Could not find a NetBox prefix for `{arp_entry['ip']}` " + f"on interface `{interface_name}`"
                     )
@@ -305,17 +584,18 @@ class NapalmCollector:
                         message + "." if routing_instance is None else message + f" in VRF `{routing_instance}`."
                     )
                     continue
+                cidr = f"{int_to_address(version, value)}/{data['prefix_length']}"
 
                 # Determine action for MAC (using pre-fetched bulk data)
-                mac_cache_key = arp_entry["mac"].replace(":", "").upper()
-                existing_mac = existing_macs_by_addr.get(mac_cache_key)
+                try:
+                    existing_mac = self._lookup_mac(arp_entry["mac"])
+                except ValueError:
+                    self._log_warning(f"Invalid MAC address `{arp_entry['mac']}` for `{arp_entry['ip']}`. Skipping.")
+                    continue
                 mac_action = EntryActionChoices.ACTION_CONFIRMED if existing_mac else EntryActionChoices.ACTION_NEW
 
                 # Determine action for IP (using pre-fetched bulk data)
-                ip_cache_key = (
-                    str(ip_interface_object),
-                    routing_instance.pk if routing_instance else None,
-                )
+                ip_cache_key = (cidr, routing_instance.pk if routing_instance else None)
                 existing_ip = existing_ips_map.get(ip_cache_key)
                 ip_action = EntryActionChoices.ACTION_CONFIRMED if existing_ip else EntryActionChoices.ACTION_NEW
                 seen_ips.add(ip_cache_key)
@@ -323,7 +603,7 @@ class NapalmCollector:
                 vrf_name = str(routing_instance) if routing_instance else None
                 detected = {
                     "mac": arp_entry["mac"],
-                    "ip": str(ip_interface_object),
+                    "ip": cidr,
                     "interface": interface_name,
                     "vrf": vrf_name,
                 }
@@ -345,119 +625,212 @@ class NapalmCollector:
                     device=self._current_device,
                     detected_values=detected,
                     object_instance=existing_ip,
-                    object_repr=self._object_repr(existing_ip) if existing_ip else f"IPAddress {ip_interface_object}",
+                    object_repr=self._object_repr(existing_ip) if existing_ip else f"IPAddress {cidr}",
                 )
 
                 if self._should_apply():
-                    try:
-                        netbox_mac, created = get_or_create_mac(arp_entry["mac"])
-                    except MACAddress.MultipleObjectsReturned:
-                        self._log_warning(duplicate_object_warning("MAC", arp_entry["mac"]))
-                        continue
-                    if created:
-                        self._log_success(
-                            f"Succesfully created MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}."
-                        )
-                    else:
-                        self._log_info(
-                            f"Found existing MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}."
+                    neighbors.append(
+                        NeighborFact(
+                            arp_entry["mac"],
+                            netbox_interface,
+                            cidr,
+                            routing_instance,
+                            existing_ip,
+                            mac_entry,
+                            ip_entry,
                         )
+                    )
 
-                    netbox_mac.interfaces.add(netbox_interface)
+        if neighbors and get_plugin_config("netbox_facts", "bulk_reconciliation", False):
+            self._reconcile_neighbors_in_bulk(neighbors)
+        elif neighbors:
+            self._reconcile_neighbors(neighbors)
 
-                    # Get or create an IPAddress for this entry
-                    try:
-                        netbox_address, created = get_or_create_ip(
-                            str(ip_interface_object),
-                            vrf=routing_instance,
-                            description=f"Automatically discovered on {self._now}",
-                        )
-                    except IPAddress.MultipleObjectsReturned:
-                        self._log_warning(duplicate_object_warning("IP", ip_interface_object))
-                        continue
-                    if created:
-                        JournalEntry.objects.create(
-                            created=self._now,
-                            assigned_object=netbox_address,
-                            kind=JournalEntryKindChoices.KIND_INFO,
-                            comments=(
-                                f"Discovered by {self._current_device} with MAC"
-                                + f" {get_absolute_url_markdown(netbox_mac, bold=True)}"
-                                + f" on interface {get_absolute_url_markdown(netbox_interface, bold=True)} via"
-                                + f" {self.plan.get_collector_type_display()} collection."  # type: ignore
-                            ),
-                        )
-                        self._log_success(
-                            f"Succesfully created IP address {get_absolute_url_markdown(netbox_address, bold=True)}."
-                        )
-                    else:
-                        self._log_info(
-                            f"Found existing IP address {get_absolute_url_markdown(netbox_address, bold=True)}."
-                        )
+    def _create_neighbor_ips(self, neighbors: list[NeighborFact]):
+        """Create the missing IP addresses of *neighbors* with :func:`bulk_get_or_create_ips`."""
+        return bulk_get_or_create_ips(
+            [(neighbor.address, neighbor.vrf) for neighbor in neighbors if neighbor.ip_address is None],
+            description=f"Automatically discovered on {self._now}",
+        )
+
+    def _neighbor_ip(self, neighbor: NeighborFact, ips: dict, duplicate_ips: set) -> IPAddress | None:
+        """Return the IPAddress of *neighbor*, or None after warning if it matches several."""
+        if neighbor.ip_address is not None:
+            return neighbor.ip_address
+        key = ip_key(neighbor.address, neighbor.vrf)
+        if key in duplicate_ips:
+            self._log_warning(duplicate_object_warning("IP", neighbor.address))
+            return None
+        return ips[key]
 
-                    # Add the IPAddress to the MACAddress
-                    netbox_mac.ip_addresses.add(netbox_address)
+    def _reconcile_neighbors(self, neighbors: list[NeighborFact]):
+        """Apply ARP/NDP entries, saving each MAC address so its changes are change-logged.
 
-                    # Update the last seen timestamp
-                    netbox_mac.last_seen = self._now
-                    netbox_mac.save()
+        Missing IP addresses are created, tagged and journaled in bulk for
+        the whole chunk first.
+        """
+        ips, created_ips, duplicate_ips = self._create_neighbor_ips(neighbors)
+        journal = {}
+        for neighbor in neighbors:
+            try:
+                netbox_mac, created = get_or_create_mac(neighbor.mac)
+            except MACAddress.MultipleObjectsReturned:
+                self._log_warning(duplicate_object_warning("MAC", neighbor.mac))
+                continue
+            if created:
+                self._log_success(
+                    f"Succesfully created MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}."
+                )
+            else:
+                self._log_info(f"Found existing MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}.")
+
+            netbox_mac.interfaces.add(neighbor.interface)
+
+            netbox_address = self._neighbor_ip(neighbor, ips, duplicate_ips)
+            if netbox_address is None:
+                continue
+            key = (str(netbox_address.address), netbox_address.vrf_id)
+            if neighbor.ip_address is None and key in created_ips:
+                if key not in journal:
+                    journal[key] = (netbox_address, self._neighbor_journal_comments(netbox_mac, neighbor.interface))
                     self._log_success(
-                        f"Succesfully updated {get_absolute_url_markdown(netbox_mac, bold=True)} found on "
-                        + f"{get_absolute_url_markdown(netbox_interface, bold=True)} with IP address"
-                        + get_absolute_url_markdown(netbox_address, bold=True)
-                        + "."
+                        f"Succesfully created IP address {get_absolute_url_markdown(netbox_address, bold=True)}."
                     )
+            else:
+                self._log_info(f"Found existing IP address {get_absolute_url_markdown(netbox_address, bold=True)}.")
+
+            # Add the IPAddress to the MACAddress
+            netbox_mac.ip_addresses.add(netbox_address)
+
+            # Update the last seen timestamp
+            self._save_or_touch_mac(netbox_mac)
+            self._log_success(
+                f"Succesfully updated {get_absolute_url_markdown(netbox_mac, bold=True)} found on "
+                + f"{get_absolute_url_markdown(neighbor.interface, bold=True)} with IP address"
+                + get_absolute_url_markdown(netbox_address, bold=True)
+                + "."
+            )
 
-                    # Mark entries as applied with correct object references
-                    self._mark_entry_applied(mac_entry, netbox_mac, object_repr=self._object_repr(netbox_mac))
-                    self._mark_entry_applied(ip_entry, netbox_address, object_repr=self._object_repr(netbox_address))
-        # Detect stale IPs: previously discovered IPs on this device
-        # that are no longer present in the current ARP/NDP table.
-        # Filter by IP family so ARP only flags v4, NDP only flags v6.
-        if self._current_device and seen_ips:
-            ip_family = 6 if self._collector_type == CollectionTypeChoices.TYPE_NDP else 4
-            device_macs = MACAddress.objects.filter(interfaces__in=self._current_device.vc_interfaces()).distinct()
-            known_ips = (
-                IPAddress.objects.filter(mac_addresses__in=device_macs)
-                .filter(tags__name=AUTO_D_TAG, address__family=ip_family)
-                .select_related("vrf")
-                .distinct()
+            # Mark entries as applied with correct object references
+            self._mark_entry_applied(neighbor.mac_entry, netbox_mac, object_repr=self._object_repr(netbox_mac))
+            self._mark_entry_applied(neighbor.ip_entry, netbox_address, object_repr=self._object_repr(netbox_address))
+
+        if journal:
+            bulk_journal(journal.values())
+
+    def _save_or_touch_mac(self, netbox_mac: MACAddress, **changes):
+        """Set *changes* on *netbox_mac* and mark it as seen.
+
+        The MAC is only saved, and so change-logged, when *changes* differ
+        from its current values or it was never seen before. Otherwise its
+        ``last_seen`` is queued for :meth:`_flush_mac_touches` at the end of
+        the device.
+        """
+        if netbox_mac.last_seen is None or any(getattr(netbox_mac, name) != value for name, value in changes.items()):
+            for name, value in changes.items():
+                setattr(netbox_mac, name, value)
+            netbox_mac.last_seen = self._now
+            netbox_mac.save()
+        else:
+            self._ctx.touched_macs.add(netbox_mac.pk)
+
+    def _flush_mac_touches(self):
+        """Write ``last_seen`` of the MACs the current device saw without changing them."""
+        ctx = self._ctx
+        if ctx.touched_macs:
+            touch_last_seen(
+                ctx.touched_macs,
+                self._now,
+                changelog=get_plugin_config("netbox_facts", "last_seen_changelog", False),
             )
-            for ip_obj in known_ips:
-                key = (str(ip_obj.address), ip_obj.vrf_id)
-                if key not in seen_ips:
-                    self._record_entry(
-                        action=EntryActionChoices.ACTION_STALE,
-                        collector_type=self._collector_type,
-                        device=self._current_device,
-                        detected_values={},
-                        current_values={
-                            "ip": str(ip_obj.address),
-                            "vrf": str(ip_obj.vrf) if ip_obj.vrf else None,
-                        },
-                        object_instance=ip_obj,
-                        object_repr=self._object_repr(ip_obj),
-                    )
-                    self._log_info(f"IP {ip_obj.address} not seen in current table — flagged as stale.")
+            ctx.touched_macs = set()
+
+    def _neighbor_journal_comments(self, netbox_mac, netbox_interface) -> str:
+        """Return the journal comments of an IP address created from an ARP/NDP entry."""
+        return (
+            f"Discovered by {self._current_device} with MAC"
+            + f" {get_absolute_url_markdown(netbox_mac, bold=True)}"
+            + f" on interface {get_absolute_url_markdown(netbox_interface, bold=True)} via"
+            + f" {self._collector_type_display()} collection."
+        )
+
+    def _reconcile_neighbors_in_bulk(self, neighbors: list[NeighborFact]):
+        """Apply ARP/NDP entries with set-based statements instead of per-entry saves.
+
+        Missing MAC addresses are inserted in bulk and change-logged,
+        interface and IP assignments are bulk-inserted into the through
+        tables, and ``last_seen`` is set with a single UPDATE. Existing MAC
+        addresses are not saved one by one, so their changes are not
+        change-logged.
+        Missing IP addresses are created, tagged and journaled in bulk.
+        """
+        macs, created_macs = bulk_get_or_create_macs({neighbor.mac for neighbor in neighbors})
+        if created_macs:
+            self._log_success(f"Succesfully created {len(created_macs)} MAC addresses.")
+
+        ips, created_ips, duplicate_ips = self._create_neighbor_ips(neighbors)
+
+        interface_links = set()
+        ip_links = set()
+        journal = {}
+        applied = []
+        for neighbor in neighbors:
+            netbox_mac = macs[neighbor.mac]
+            netbox_address = self._neighbor_ip(neighbor, ips, duplicate_ips)
+            if netbox_address is None:
+                continue
+            key = (str(netbox_address.address), netbox_address.vrf_id)
+            if neighbor.ip_address is None and key in created_ips and key not in journal:
+                journal[key] = (netbox_address, self._neighbor_journal_comments(netbox_mac, neighbor.interface))
+            interface_links.add((netbox_mac.pk, neighbor.interface.pk))
+            ip_links.add((netbox_mac.pk, netbox_address.pk))
+            applied.append((neighbor, netbox_mac, netbox_address))
+
+        if journal:
+            bulk_journal(journal.values())
+            self._log_success(f"Succesfully created {len(journal)} IP addresses.")
+
+        MACAddressInterfaceRelation.objects.bulk_create(
+            [MACAddressInterfaceRelation(mac_address_id=mac, interface_id=iface) for mac, iface in interface_links],
+            ignore_conflicts=True,
+        )
+        MACAddressIPAddressRelation.objects.bulk_create(
+            [MACAddressIPAddressRelation(mac_address_id=mac, ip_address_id=ip) for mac, ip in ip_links],
+            ignore_conflicts=True,
+        )
+        MACAddress.objects.filter(pk__in={mac for mac, _ in interface_links}).update(
+            last_seen=self._now, last_updated=self._now
+        )
+        self._log_success(
+            f"Succesfully updated {len(macs)} MAC addresses with {len(interface_links)} interface"
+            f" and {len(ip_links)} IP address assignments."
+        )
+
+        for neighbor, netbox_mac, netbox_address in applied:
+            self._mark_entry_applied(neighbor.mac_entry, netbox_mac, object_repr=self._object_repr(netbox_mac))
+            self._mark_entry_applied(neighbor.ip_entry, netbox_address, object_repr=self._object_repr(netbox_address))
 
+    @flushes_entries
     def arp(self, driver: NetworkDriver | EnhancedJunOSDriver):
         """Collect ARP table data from a device."""
-        arp_table = self._napalm_rpc(driver.get_arp_table, "ARP data")
+        arp_table = self._napalm_rpc(driver.get_arp_table, "ARP data", stream=True)
         if arp_table is None:
             return
 
         self._ip_neighbors(driver, arp_table)  # type: ignore
         self._log_success("ARP collection completed")
 
+    @flushes_entries
     def ndp(self, driver: NetworkDriver | EnhancedJunOSDriver):
         """Collect NDP data from devices."""
-        ndp_table = self._napalm_rpc(driver.get_ipv6_neighbors_table, "NDP data")
+        ndp_table = self._napalm_rpc(driver.get_ipv6_neighbors_table, "NDP data", stream=True)
         if ndp_table is None:
             return
 
         self._ip_neighbors(driver, ndp_table)  # type: ignore
         self._log_success("IPv6 Neighbor Discovery collection completed")
 
+    @flushes_entries
     def inventory(self, driver: NetworkDriver):
         """Collect inventory data from a device using get_facts()."""
         facts = self._napalm_rpc(driver.get_facts, "inventory data")
@@ -804,6 +1177,65 @@ class NapalmCollector:
             if installed is not None:
                 modules_by_name[name] = installed
 
+    def _device_interfaces(self, device) -> dict:
+        """Return the VC interfaces of *device* by name, loading them with one query on first use.
+
+        Names shared by several VC members map to None.
+        """
+        interfaces = self._ctx.interfaces.get(device.pk)
+        if interfaces is None:
+            interfaces = self._ctx.interfaces[device.pk] = {}
+            for iface in device.vc_interfaces():
+                interfaces[iface.name] = None if iface.name in interfaces else iface
+        return interfaces
+
+    def _get_interface(self, device, name) -> Interface:
+        """Look up an interface on a device, like ``device.vc_interfaces().get(name=name)``.
+
+        Served from :meth:`_device_interfaces`; raises ``Interface.DoesNotExist``
+        or ``Interface.MultipleObjectsReturned`` as the query would.
+        """
+        interfaces = self._device_interfaces(device)
+        if name not in interfaces:
+            raise Interface.DoesNotExist(f"Interface `{name}` not found on {device}.")
+        if interfaces[name] is None:
+            raise Interface.MultipleObjectsReturned(f"Several interfaces named `{name}` on {device}.")
+        return interfaces[name]
+
+    def _prefetch_macs(self, mac_addrs):
+        """Load the MACAddress objects of *mac_addrs* for :meth:`_lookup_mac`.
+
+        Addresses already looked up are skipped and the rest fetched with
+        :func:`bulk_get_macs`; invalid addresses are ignored.
+        """
+        keys = set()
+        for mac_addr in mac_addrs:
+            try:
+                key = mac_key(mac_addr)
+            except ValueError:
+                continue
+            if key not in self._ctx.macs:
+                keys.add(key)
+        if keys:
+            found = bulk_get_macs(keys)
+            self._ctx.macs.update({key: found.get(key) for key in keys})
+
+    def _lookup_mac(self, mac_addr) -> MACAddress | None:
+        """Return the MACAddress of *mac_addr*, like ``MACAddress.objects.filter(mac_address=...).first()``.
+
+        Served from the objects loaded by :meth:`_prefetch_macs`; an address
+        that was not prefetched is fetched on its own. Raises ValueError if
+        *mac_addr* is not a MAC address.
+        """
+        key = mac_key(mac_addr)
+        if key not in self._ctx.macs:
+            self._prefetch_macs([key])
+        return self._ctx.macs[key]
+
+    def _remember_mac(self, netbox_mac: MACAddress):
+        """Make later :meth:`_lookup_mac` calls return *netbox_mac*, after it was created or fetched."""
+        self._ctx.macs[mac_key(netbox_mac.mac_address)] = netbox_mac
+
     def _get_or_create_interface(self, device, name, iface_data=None):
         """Look up an interface on a device, creating it if missing.
 
@@ -812,14 +1244,14 @@ class NapalmCollector:
         Sub-interfaces (containing '.') get their parent set to the physical interface.
         """
         try:
-            return device.vc_interfaces().get(name=name)
+            return self._get_interface(device, name)
         except Interface.DoesNotExist:
             iface_type = detect_interface_type(name)
             kwargs = {"device": device, "name": name, "type": iface_type}
             if "." in name:
                 parent_name = name.rsplit(".", 1)[0]
                 try:
-                    kwargs["parent"] = device.vc_interfaces().get(name=parent_name)
+                    kwargs["parent"] = self._get_interface(device, parent_name)
                 except Interface.DoesNotExist:
                     pass
             if iface_data:
@@ -831,9 +1263,11 @@ class NapalmCollector:
                     kwargs["mtu"] = iface_data["mtu"]
             nb_iface = Interface.objects.create(**kwargs)
             nb_iface.tags.add(AUTO_D_TAG)
+            self._device_interfaces(device)[name] = nb_iface
             self._log_success(f"Auto-created interface `{name}` (type={iface_type}) on {device}.")
             return nb_iface
 
+    @flushes_entries
     def interfaces(self, driver: NetworkDriver):
         """Collect interface data from a device using get_interfaces()."""
         self._seen_ips = set()
@@ -842,11 +1276,15 @@ class NapalmCollector:
         # causes mismatches because Junos treats '.' as a literal dot while
         # Python regex treats it as "any character".
         try:
-            ifaces = driver.get_interfaces()
+            with self._timed_driver_call("interface data"):
+                ifaces = driver.get_interfaces()
         except (CommandErrorException, CommandTimeoutException, ConnectionException) as exc:
             self._log_failure(f"Failed to retrieve interface data: {exc}")
+            if isinstance(exc, CommandTimeoutException):
+                self._record_congestion()
             return
         device = self._current_device
+        self._prefetch_macs(iface_data.get("mac_address") or "" for iface_data in ifaces.values())
 
         for iface_name, iface_data in ifaces.items():
             # Skip interfaces that don't match the configured regex
@@ -893,9 +1331,9 @@ class NapalmCollector:
                 "is_up": iface_data.get("is_up"),
             }
 
-            # Validate MAC address format before querying
+            # Validate MAC address format before looking it up
             try:
-                existing_mac = MACAddress.objects.filter(mac_address=mac_addr).first()
+                existing_mac = self._lookup_mac(mac_addr)
             except (django.core.exceptions.ValidationError, ValueError):
                 self._log_warning(f"Invalid MAC address `{mac_addr}` on interface `{iface_name}`. Skipping.")
                 continue
@@ -920,14 +1358,16 @@ class NapalmCollector:
                 except (django.core.exceptions.ValidationError, ValueError) as exc:
                     self._log_warning(f"Could not create MAC `{mac_addr}` for `{iface_name}`: {exc}")
                     continue
+                self._remember_mac(netbox_mac)
 
                 if created:
                     self._log_success(f"Created MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}.")
 
-                netbox_mac.device_interface = nb_iface
-                netbox_mac.discovery_method = CollectionTypeChoices.TYPE_INTERFACES
-                netbox_mac.last_seen = self._now
-                netbox_mac.save()
+                self._save_or_touch_mac(
+                    netbox_mac,
+                    device_interface_id=nb_iface.pk,
+                    discovery_method=CollectionTypeChoices.TYPE_INTERFACES,
+                )
                 self._mark_entry_applied(iface_entry, netbox_mac, object_repr=self._object_repr(netbox_mac))
 
         # --- Process logical interfaces (LAG, IPs, VRFs) ---
@@ -942,6 +1382,7 @@ class NapalmCollector:
 
     def _interfaces_logical(self, device, ifaces):
         """Process logical interfaces from enhanced driver data (LAG, IPs, VRFs)."""
+        ip_facts: list[InterfaceIPFact] = []
         for iface_name, iface_data in ifaces.items():
             if not self._interfaces_re.match(iface_name):
                 continue
@@ -1046,9 +1487,9 @@ class NapalmCollector:
                                 f"{local_ip}/{ip_obj.max_prefixlen}",
                                 strict=False,
                             )
-                        cidr = f"{local_ip}/{net.prefixlen}"
+                        ip_facts.append(InterfaceIPFact(nb_li, f"{local_ip}/{net.prefixlen}", net, netbox_vrf))
 
-                        self._record_ip_entry(device, nb_li, cidr, net, netbox_vrf)
+        self._record_ip_entries(device, ip_facts)
 
     def _interfaces_ip_generic(self, device, driver):
         """Collect IPs/VRFs using standard NAPALM get_interfaces_ip()."""
@@ -1057,6 +1498,7 @@ class NapalmCollector:
             return
 
         network_instances = dict(self._get_network_instances(driver))
+        ip_facts: list[InterfaceIPFact] = []
 
         for iface_name, family_data in interfaces_ip.items():
             nb_li = self._get_or_create_interface(device, iface_name)
@@ -1076,7 +1518,9 @@ class NapalmCollector:
                     except ValueError:
                         continue
 
-                    self._record_ip_entry(device, nb_li, cidr, net, netbox_vrf)
+                    ip_facts.append(InterfaceIPFact(nb_li, cidr, net, netbox_vrf))
+
+        self._record_ip_entries(device, ip_facts)
 
     def _detect_stale_ips(self, device):
         """Detect auto-discovered IPs on a device that weren't seen in this run."""
@@ -1111,49 +1555,61 @@ class NapalmCollector:
                 ip.save()
                 self._mark_entry_applied(entry, ip)
 
-    def _record_ip_entry(self, device, nb_li, cidr, net, netbox_vrf):
-        """Record and optionally apply a single IP address entry."""
-        li_name = nb_li.name
-        vrf_name = netbox_vrf.name if netbox_vrf else None
+    def _record_ip_entries(self, device, ip_facts: list[InterfaceIPFact]):
+        """Record and optionally apply the IP addresses of a device's logical interfaces.
 
-        existing_ip = IPAddress.objects.filter(address=cidr, vrf=netbox_vrf).first()
-        if not existing_ip:
-            action = EntryActionChoices.ACTION_NEW
-        elif (
-            existing_ip.assigned_object is not None
-            and existing_ip.assigned_object != nb_li
-            and existing_ip.tags.filter(name=AUTO_D_TAG).exists()
-        ):
-            action = EntryActionChoices.ACTION_CHANGED
-        else:
-            action = EntryActionChoices.ACTION_CONFIRMED
-        detected = {
-            "logical_interface": li_name,
-            "ip_address": cidr,
-            "vrf": vrf_name,
-            "prefix": str(net),
-        }
-        current_values = None
-        if action == EntryActionChoices.ACTION_CHANGED and existing_ip:
-            current_values = {
-                "assigned_object": str(existing_ip.assigned_object),
-            }
-        entry = self._record_entry(
-            action=action,
-            collector_type=self._collector_type,
-            device=device,
-            detected_values=detected,
-            current_values=current_values,
-            object_instance=existing_ip or nb_li,
-            object_repr=self._object_repr(existing_ip, nb_li)
-            if existing_ip
-            else f"IPAddress {cidr} on {get_absolute_url_markdown(nb_li)}",
+        Existing IP addresses are looked up, and missing ones created, in
+        bulk for the whole device. Prefixes are still created one by one.
+        """
+        existing_ips, _ = bulk_get_ips((fact.address, fact.vrf) for fact in ip_facts)
+        auto_discovered = set(
+            IPAddress.objects.filter(pk__in=[ip.pk for ip in existing_ips.values()], tags__name=AUTO_D_TAG).values_list(
+                "pk", flat=True
+            )
         )
+        interface_type = ContentType.objects.get_for_model(Interface)
 
-        vrf_id = netbox_vrf.pk if netbox_vrf else None
-        self._seen_ips.add((cidr, vrf_id))
+        def assigned_elsewhere(ip, nb_li):
+            return ip.assigned_object_id is not None and (
+                ip.assigned_object_type_id != interface_type.pk or ip.assigned_object_id != nb_li.pk
+            )
 
-        if self._should_apply():
+        pending = []
+        for nb_li, cidr, net, netbox_vrf in ip_facts:
+            key = ip_key(cidr, netbox_vrf)
+            existing_ip = existing_ips.get(key)
+            if not existing_ip:
+                action = EntryActionChoices.ACTION_NEW
+            elif assigned_elsewhere(existing_ip, nb_li) and existing_ip.pk in auto_discovered:
+                action = EntryActionChoices.ACTION_CHANGED
+            else:
+                action = EntryActionChoices.ACTION_CONFIRMED
+            detected = {
+                "logical_interface": nb_li.name,
+                "ip_address": cidr,
+                "vrf": netbox_vrf.name if netbox_vrf else None,
+                "prefix": str(net),
+            }
+            current_values = None
+            if action == EntryActionChoices.ACTION_CHANGED:
+                current_values = {
+                    "assigned_object": str(existing_ip.assigned_object),
+                }
+            entry = self._record_entry(
+                action=action,
+                collector_type=self._collector_type,
+                device=device,
+                detected_values=detected,
+                current_values=current_values,
+                object_instance=existing_ip or nb_li,
+                object_repr=self._object_repr(existing_ip, nb_li)
+                if existing_ip
+                else f"IPAddress {cidr} on {get_absolute_url_markdown(nb_li)}",
+            )
+            self._seen_ips.add((cidr, netbox_vrf.pk if netbox_vrf else None))
+
+            if not self._should_apply():
+                continue
             # Create prefix (skip host routes)
             if net.num_addresses > 1:
                 try:
@@ -1166,30 +1622,39 @@ class NapalmCollector:
                     )
                 except Prefix.MultipleObjectsReturned:
                     self._log_warning(duplicate_object_warning("Prefix", net))
-                    return
+                    continue
                 if prefix_created:
                     nb_prefix.tags.add(AUTO_D_TAG)
-            # Create/get IPAddress
-            try:
-                nb_ip, created = get_or_create_ip(
-                    cidr,
-                    vrf=netbox_vrf,
-                    assigned_object=nb_li,
-                    description=f"Discovered on {device} ({self._now.date()})",
-                )
-            except IPAddress.MultipleObjectsReturned:
+            pending.append((key, nb_li, cidr, netbox_vrf, entry))
+
+        if not pending:
+            return
+        # Missing IPs are assigned to the first interface they were found on
+        assignments = {}
+        for key, nb_li, _cidr, _vrf, _entry in pending:
+            assignments.setdefault(key, {"assigned_object": nb_li})
+        ips, created_ips, duplicate_ips = bulk_get_or_create_ips(
+            [(cidr, netbox_vrf) for _key, _li, cidr, netbox_vrf, _entry in pending],
+            overrides=assignments,
+            description=f"Discovered on {device} ({self._now.date()})",
+        )
+        auto_discovered.update(ips[key].pk for key in created_ips)
+
+        logged = set()
+        for key, nb_li, cidr, _vrf, entry in pending:
+            if key in duplicate_ips:
                 self._log_warning(duplicate_object_warning("IP", cidr))
-                return
-            if created:
-                self._log_success(f"Created IP `{cidr}` on `{li_name}`")
-            elif nb_ip.assigned_object is None:
-                nb_ip.assigned_object = nb_li
-                nb_ip.save()
-            elif nb_ip.assigned_object != nb_li and nb_ip.tags.filter(name=AUTO_D_TAG).exists():
+                continue
+            nb_ip = ips[key]
+            if key in created_ips and key not in logged:
+                logged.add(key)
+                self._log_success(f"Created IP `{cidr}` on `{nb_li.name}`")
+            elif nb_ip.assigned_object_id is None or (assigned_elsewhere(nb_ip, nb_li) and nb_ip.pk in auto_discovered):
                 nb_ip.assigned_object = nb_li
                 nb_ip.save()
             self._mark_entry_applied(entry, nb_ip, object_repr=self._object_repr(nb_ip, nb_li))
 
+    @flushes_entries
     def lldp(self, driver: NetworkDriver):
         """Collect LLDP data from a device using get_lldp_neighbors_detail()."""
         from dcim.choices import LinkStatusChoices
@@ -1203,7 +1668,7 @@ class NapalmCollector:
         for local_iface_name, neighbors in lldp_data.items():
             # Get local interface from NetBox
             try:
-                local_iface = device.vc_interfaces().get(name=local_iface_name)
+                local_iface = self._get_interface(device, local_iface_name)
             except Interface.DoesNotExist:
                 self._log_warning(f"Could not find local interface `{local_iface_name}` in NetBox. Skipping.")
                 continue
@@ -1240,7 +1705,7 @@ class NapalmCollector:
 
                 # Look up the remote interface
                 try:
-                    remote_iface = remote_device.vc_interfaces().get(name=remote_port)
+                    remote_iface = self._get_interface(remote_device, remote_port)
                 except Interface.DoesNotExist:
                     self._log_warning(
                         f"Could not find remote interface `{remote_port}` on `{remote_system_name}`. Skipping."
@@ -1314,12 +1779,14 @@ class NapalmCollector:
 
         self._log_success("LLDP collection completed")
 
+    @flushes_entries
     def ethernet_switching(self, driver: NetworkDriver):
         """Collect ethernet switching data from a device using get_mac_address_table()."""
         mac_table = self._napalm_rpc(driver.get_mac_address_table, "MAC address table")
         if mac_table is None:
             return
         device = self._current_device
+        self._prefetch_macs(entry.get("mac", "") for entry in mac_table)
 
         for entry in mac_table:
             mac_addr = entry.get("mac", "")
@@ -1335,7 +1802,7 @@ class NapalmCollector:
 
             # Get the matching interface from NetBox or skip
             try:
-                nb_iface = device.vc_interfaces().get(name=iface_name)
+                nb_iface = self._get_interface(device, iface_name)
             except Interface.DoesNotExist:
                 self._log_warning(f"Could not find interface `{iface_name}` in NetBox. Skipping.")
                 continue
@@ -1343,7 +1810,11 @@ class NapalmCollector:
                 self._log_warning(duplicate_object_warning("interface", iface_name))
                 continue
 
-            existing_mac = MACAddress.objects.filter(mac_address=mac_addr).first()
+            try:
+                existing_mac = self._lookup_mac(mac_addr)
+            except (django.core.exceptions.ValidationError, ValueError):
+                self._log_warning(f"Invalid MAC address `{mac_addr}` on interface `{iface_name}`. Skipping.")
+                continue
             action = EntryActionChoices.ACTION_CONFIRMED if existing_mac else EntryActionChoices.ACTION_NEW
             detected = {
                 "mac": mac_addr,
@@ -1366,13 +1837,12 @@ class NapalmCollector:
                 except MACAddress.MultipleObjectsReturned:
                     self._log_warning(duplicate_object_warning("MAC", mac_addr))
                     continue
+                self._remember_mac(netbox_mac)
                 if created:
                     self._log_success(f"Created MAC address {get_absolute_url_markdown(netbox_mac, bold=True)}.")
 
                 netbox_mac.interfaces.add(nb_iface)
-                netbox_mac.discovery_method = CollectionTypeChoices.TYPE_L2
-                netbox_mac.last_seen = self._now
-                netbox_mac.save()
+                self._save_or_touch_mac(netbox_mac, discovery_method=CollectionTypeChoices.TYPE_L2)
                 self._mark_entry_applied(l2_entry, netbox_mac, object_repr=self._object_repr(netbox_mac))
 
         self._log_success("Ethernet switching collection completed")
@@ -1403,6 +1873,7 @@ class NapalmCollector:
             f"{method_name} is not implemented for driver '{driver_name}'. Supported drivers: {supported}"
         )
 
+    @flushes_entries
     def l2_circuits(self, driver: NetworkDriver):
         """Collect L2 circuit data. Dispatches to vendor-specific implementation."""
         impl = self._get_vendor_method("l2_circuits")
@@ -1438,6 +1909,7 @@ class NapalmCollector:
             self._mark_entry_applied(l2c_entry, self._current_device)
         self._log_success("L2 circuit collection completed")
 
+    @flushes_entries
     def evpn(self, driver: NetworkDriver):
         """Collect EVPN data. Dispatches to vendor-specific implementation."""
         impl = self._get_vendor_method("evpn")
@@ -1455,11 +1927,13 @@ class NapalmCollector:
             return
 
         mac_pattern = re.compile(r"([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})")
-        for line in raw.strip().split("\n"):
+        lines = raw.strip().split("\n")
+        self._prefetch_macs(match.group(1) for line in lines if (match := mac_pattern.search(line)))
+        for line in lines:
             match = mac_pattern.search(line)
             if match:
                 mac_str = match.group(1)
-                existing_mac = MACAddress.objects.filter(mac_address=mac_str).first()
+                existing_mac = self._lookup_mac(mac_str)
                 action = EntryActionChoices.ACTION_CONFIRMED if existing_mac else EntryActionChoices.ACTION_NEW
                 detected = {"mac": mac_str}
 
@@ -1478,9 +1952,8 @@ class NapalmCollector:
                     except MACAddress.MultipleObjectsReturned:
                         self._log_warning(duplicate_object_warning("MAC", mac_str))
                         continue
-                    netbox_mac.discovery_method = CollectionTypeChoices.TYPE_EVPN
-                    netbox_mac.last_seen = self._now
-                    netbox_mac.save()
+                    self._remember_mac(netbox_mac)
+                    self._save_or_touch_mac(netbox_mac, discovery_method=CollectionTypeChoices.TYPE_EVPN)
 
                     if created:
                         self._log_success(f"Created EVPN MAC {get_absolute_url_markdown(netbox_mac, bold=True)}.")
@@ -1495,22 +1968,27 @@ class NapalmCollector:
             )
         self._log_success("EVPN collection completed")
 
+    @flushes_entries
     def bgp(self, driver: NetworkDriver):
-        """Collect BGP data from a device using get_bgp_neighbors_detail()."""
-        from ipam.models import ASN, RIR
+        """Collect BGP data from a device using get_bgp_neighbors_detail().
 
+        VRFs, peer IPs and, when applying, ASNs are resolved for all peers
+        with a few set-based queries before any peer is processed.
+        """
         bgp_data = self._napalm_rpc(driver.get_bgp_neighbors_detail, "BGP data")
         if bgp_data is None:
             return
         device = self._current_device
         self._bgp_routing_data = {"local_as": None, "vrfs": {}}
 
+        vrfs, duplicate_vrfs = bulk_resolve_vrfs(bgp_data)
+        peers = []
         for vrf_name, peers_by_as in bgp_data.items():
             # Resolve VRF (empty string or "global" means no VRF)
-            nb_vrf = None
-            try:
-                nb_vrf = resolve_vrf(vrf_name)
-            except VRF.DoesNotExist:
+            if vrf_name in duplicate_vrfs:
+                self._log_warning(duplicate_object_warning("VRF", vrf_name) + " Skipping peers in this VRF.")
+                continue
+            if vrf_name not in vrfs:
                 self._log_warning(f"Could not find VRF `{vrf_name}` in NetBox. Skipping peers in this VRF.")
                 self._record_entry(
                     action=EntryActionChoices.ACTION_NEW,
@@ -1520,12 +1998,10 @@ class NapalmCollector:
                     object_repr=f"VRF {vrf_name}",
                 )
                 continue
-            except VRF.MultipleObjectsReturned:
-                self._log_warning(duplicate_object_warning("VRF", vrf_name) + " Skipping peers in this VRF.")
-                continue
+            nb_vrf = vrfs[vrf_name]
 
-            for as_number, peers in peers_by_as.items():
-                for peer in peers:
+            for as_number, as_peers in peers_by_as.items():
+                for peer in as_peers:
                     remote_address = peer.get("remote_address", "")
                     if not remote_address:
                         continue
@@ -1543,76 +2019,79 @@ class NapalmCollector:
                     except ValueError:
                         self._log_warning(f"Invalid IP address `{remote_address}`. Skipping.")
                         continue
+                    peers.append(BGPPeerFact(vrf_name, nb_vrf, as_number, peer, remote_address, ip_str))
+
+        existing_ips, _ = bulk_get_ips((peer.address, peer.vrf) for peer in peers)
+        if self._should_apply() and peers:
+            # ASNs need an RIR; missing ones are created in the first one
+            asns, uncreated_asns = bulk_get_or_create_asns(peer.as_number for peer in peers)
+            for as_number in sorted(uncreated_asns):
+                self._log_warning(f"No RIR exists in NetBox. Cannot create ASN {as_number}.")
+            descriptions = {}
+            for peer in peers:
+                descriptions.setdefault(
+                    ip_key(peer.address, peer.vrf),
+                    {"description": f"BGP peer AS{peer.as_number} discovered on {self._now}"},
+                )
+            ips, created_ips, duplicate_ips = bulk_get_or_create_ips(
+                [(peer.address, peer.vrf) for peer in peers], overrides=descriptions
+            )
 
-                    existing_ip = IPAddress.objects.filter(address=ip_str, vrf=nb_vrf).first()
-                    ip_action = EntryActionChoices.ACTION_CONFIRMED if existing_ip else EntryActionChoices.ACTION_NEW
-                    detected = {
-                        "remote_address": remote_address,
-                        "remote_as": int(as_number),
-                        "vrf": vrf_name if nb_vrf else None,
-                        "state": "up" if peer.get("up") else "down",
-                    }
-
-                    bgp_entry = self._record_entry(
-                        action=ip_action,
-                        collector_type=self._collector_type,
-                        device=device,
-                        detected_values=detected,
-                        object_instance=existing_ip,
-                        object_repr=f"BGP peer {get_absolute_url_markdown(existing_ip) if existing_ip else remote_address} AS{as_number}",
-                    )
+        journal = {}
+        for vrf_name, nb_vrf, as_number, peer, remote_address, ip_str in peers:
+            key = ip_key(ip_str, nb_vrf)
+            existing_ip = existing_ips.get(key)
+            ip_action = EntryActionChoices.ACTION_CONFIRMED if existing_ip else EntryActionChoices.ACTION_NEW
+            detected = {
+                "remote_address": remote_address,
+                "remote_as": int(as_number),
+                "vrf": vrf_name if nb_vrf else None,
+                "state": "up" if peer.get("up") else "down",
+            }
 
-                    if self._should_apply():
-                        # Try to get or create ASN (requires an RIR)
-                        nb_asn = None
-                        try:
-                            nb_asn, _ = ASN.objects.get_or_create(
-                                asn=int(as_number),
-                                defaults={"rir": RIR.objects.first()},
-                            )
-                        except (RIR.DoesNotExist, TypeError):
-                            self._log_warning(f"No RIR exists in NetBox. Cannot create ASN {as_number}.")
-                        except ASN.MultipleObjectsReturned:
-                            self._log_warning(duplicate_object_warning("ASN", as_number))
+            bgp_entry = self._record_entry(
+                action=ip_action,
+                collector_type=self._collector_type,
+                device=device,
+                detected_values=detected,
+                object_instance=existing_ip,
+                object_repr=f"BGP peer {get_absolute_url_markdown(existing_ip) if existing_ip else remote_address} AS{as_number}",
+            )
 
-                        try:
-                            nb_ip, created = get_or_create_ip(
-                                ip_str,
-                                vrf=nb_vrf,
-                                description=f"BGP peer AS{as_number} discovered on {self._now}",
-                            )
-                        except IPAddress.MultipleObjectsReturned:
-                            self._log_warning(duplicate_object_warning("IP", ip_str))
-                            continue
-                        if created:
-                            JournalEntry.objects.create(
-                                created=self._now,
-                                assigned_object=nb_ip,
-                                kind=JournalEntryKindChoices.KIND_INFO,
-                                comments=(
-                                    f"BGP peer discovered by {get_absolute_url_markdown(device, bold=True)}: "
-                                    f"AS{as_number} remote address `{remote_address}`"
-                                    + (f" in VRF `{vrf_name}`" if nb_vrf else "")
-                                    + "."
-                                ),
-                            )
-                            self._log_success(
-                                f"Created peer IP {get_absolute_url_markdown(nb_ip, bold=True)} (AS{as_number})."
-                            )
-                        else:
-                            self._log_info(f"Found existing peer IP {get_absolute_url_markdown(nb_ip, bold=True)}.")
-                        self._mark_entry_applied(
-                            bgp_entry, nb_ip, object_repr=f"BGP peer {get_absolute_url_markdown(nb_ip)} AS{as_number}"
-                        )
-                        self._bgp_routing_data["vrfs"].setdefault(vrf_name, []).append(
-                            {
-                                "remote_address": remote_address,
-                                "as_number": int(as_number),
-                                "nb_vrf": nb_vrf,
-                                "nb_ip": nb_ip,
-                                "nb_asn": nb_asn,
-                            }
-                        )
+            if self._should_apply():
+                nb_asn = asns.get(int(as_number))
+                if key in duplicate_ips:
+                    self._log_warning(duplicate_object_warning("IP", ip_str))
+                    continue
+                nb_ip = ips[key]
+                if key in created_ips:
+                    journal.setdefault(
+                        key,
+                        (
+                            nb_ip,
+                            f"BGP peer discovered by {get_absolute_url_markdown(device, bold=True)}: "
+                            f"AS{as_number} remote address `{remote_address}`"
+                            + (f" in VRF `{vrf_name}`" if nb_vrf else "")
+                            + ".",
+                        ),
+                    )
+                    self._log_success(f"Created peer IP {get_absolute_url_markdown(nb_ip, bold=True)} (AS{as_number}).")
+                else:
+                    self._log_info(f"Found existing peer IP {get_absolute_url_markdown(nb_ip, bold=True)}.")
+                self._mark_entry_applied(
+                    bgp_entry, nb_ip, object_repr=f"BGP peer {get_absolute_url_markdown(nb_ip)} AS{as_number}"
+                )
+                self._bgp_routing_data["vrfs"].setdefault(vrf_name, []).append(
+                    {
+                        "remote_address": remote_address,
+                        "as_number": int(as_number),
+                        "nb_vrf": nb_vrf,
+                        "nb_ip": nb_ip,
+                        "nb_asn": nb_asn,
+                    }
+                )
+        if journal:
+            bulk_journal(journal.values())
 
         self._bgp_routing_integration()
         self._log_success("BGP collection completed")
@@ -1622,7 +2101,7 @@ class NapalmCollector:
         if not HAS_NETBOX_ROUTING:
             return
 
-        data = getattr(self, "_bgp_routing_data", None)
+        data = self._bgp_routing_data
         if not data or data["local_as"] is None:
             self._log_info("No local AS found in BGP data; skipping routing integration.")
             return
@@ -1634,20 +2113,19 @@ class NapalmCollector:
             return
 
         from django.contrib.contenttypes.models import ContentType
-        from ipam.models import ASN, RIR
 
         device = self._current_device
         device_ct = ContentType.objects.get_for_model(device)
 
-        # Get-or-create local ASN
-        try:
-            local_asn, _ = ASN.objects.get_or_create(
-                asn=data["local_as"],
-                defaults={"rir": RIR.objects.first()},
-            )
-        except (RIR.DoesNotExist, TypeError):
-            self._log_warning(f"No RIR in NetBox. Cannot create local ASN {data['local_as']}.")
-            return
+        # Get-or-create local ASN; detect-only runs only look it up
+        if self._should_apply():
+            asns, _ = bulk_get_or_create_asns([data["local_as"]])
+            local_asn = asns.get(data["local_as"])
+            if local_asn is None:
+                self._log_warning(f"No RIR in NetBox. Cannot create local ASN {data['local_as']}.")
+                return
+        else:
+            local_asn = bulk_get_asns([data["local_as"]]).get(data["local_as"])
 
         # BGPRouter
         if self._should_apply():
@@ -1658,6 +2136,8 @@ class NapalmCollector:
             )
             if router_created:
                 bgp_router.tags.add(AUTO_D_TAG)
+        elif local_asn is None:
+            bgp_router, router_created = None, True
         else:
             bgp_router = BGPRouter.objects.filter(
                 assigned_object_type=device_ct,
@@ -1753,6 +2233,7 @@ class NapalmCollector:
                     object_repr=f"BGPPeer {peer_data['remote_address']} AS{peer_data['as_number']}",
                 )
 
+    @flushes_entries
     def ospf(self, driver: NetworkDriver):
         """Collect OSPF data. Dispatches to vendor-specific implementation."""
         impl = self._get_vendor_method("ospf")
@@ -1870,87 +2351,555 @@ class NapalmCollector:
             self._log_warning(f"netbox-routing OSPF integration error: {exc}")
 
     def execute(self):
-        """Execute the collection job."""
+        """Execute the collection job.
+
+        When the collector was given an existing report (sharded runs), entries
+        are written into it and finalizing the report is left to its owner.
+        """
         from netbox_facts.models.facts_report import FactsReport
 
         assert self._napalm_driver is not None
 
-        # Create a report for this run
-        self._report = FactsReport.objects.create(
-            collection_plan=self.plan,
-            status=ReportStatusChoices.STATUS_PENDING,
-        )
+        owns_report = self._report is None
+        if owns_report:
+            # Create a report for this run
+            self._report = FactsReport.objects.create(
+                collection_plan=self.plan,
+                status=ReportStatusChoices.STATUS_PENDING,
+            )
 
         try:
-            for device in self._devices:
-                self._current_device = device
-                self._log_prefix = get_absolute_url_markdown(device, bold=True)
-
-                self._log_info(
-                    f"Starting {self.plan.get_collector_type_display()} collection"  # type: ignore
+            if self._use_async_engine():
+                self._execute_async()
+            elif self._max_workers > 1:
+                self._execute_concurrently()
+            else:
+                for device in self._devices:
+                    self._collect_device(device)
+        except Exception as exc:
+            # Safety net: mark the report as failed on unhandled exceptions
+            if owns_report:
+                self._report.finalize(
+                    ReportStatusChoices.STATUS_FAILED, error_message=str(exc), timings=self.device_timings
+                )
+            raise
+        else:
+            # Finalize report on success
+            if owns_report:
+                self._report.finalize(
+                    ReportStatusChoices.STATUS_APPLIED if self._should_apply() else ReportStatusChoices.STATUS_PENDING,
+                    timings=self.device_timings,
                 )
 
-                try:
-                    connection_ips = get_connection_ips(
-                        self._current_device,
-                        self.plan.connection_target,
+    def _execute_concurrently(self):
+        """Collect from up to ``self._max_workers`` devices at once.
+
+        Each task runs in a copy of the caller's context so that NetBox's
+        change logging and event rules (``event_tracking``) still apply.
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="netbox_facts") as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._collect_device_threaded, device)
+                for device in self._interleave_by_site(self._devices)
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _use_async_engine(self) -> bool:
+        """Return True if this run should use the asyncio engine instead of threads."""
+        if not get_plugin_config("netbox_facts", "async_engine", False):
+            return False
+        if not issubclass(self._napalm_driver, EnhancedJunOSDriver):
+            return False
+        if any(collector_type not in ASYNC_ENGINE_GETTERS for collector_type in self._collector_types):
+            return False
+        if not HAS_ASYNCSSH:
+            self.plan.log_warning("The asyncio engine is enabled but asyncssh is not installed; using threads.")
+            return False
+        return True
+
+    def _execute_async(self):
+        """Fetch device data over asyncio NETCONF sessions, then reconcile each device.
+
+        Up to ``async_max_sessions`` devices are fetched at once from the
+        event loop. Reconciliation runs the regular collector method on this
+        thread via ``sync_to_async(thread_sensitive=True)``, so database work
+        stays serialized and inside the caller's ``event_tracking`` context.
+        Connection IPs in backoff are probed from each device's task, so the
+        probes overlap instead of delaying the start of the event loop.
+        """
+        targets = []
+        for device in self._devices:
+            ctx = self._local.ctx = DeviceContext(
+                device=device,
+                log_prefix=get_absolute_url_markdown(device, bold=True),
+            )
+            self._log_info(f"Starting {self.plan.get_collector_types_display()} collection")
+            try:
+                connection_ips = get_connection_ips(device, self.plan.connection_target)
+            except ValueError:
+                self._log_warning("Device has no usable IP address configured. Skipping.")
+                continue
+            targets.append((ctx, *self._backed_off_connection_ips(connection_ips, device)))
+
+        async_to_sync(self._collect_devices_async)(targets)
+
+    async def _collect_devices_async(self, targets):
+        max_sessions = get_plugin_config("netbox_facts", "async_max_sessions", 100)
+        sessions = asyncio.Semaphore(max_sessions)
+        self._governor = self._build_governor(max_sessions)
+        reconcile = sync_to_async(self._reconcile_device, thread_sensitive=True)
+
+        async def collect(ctx, healthy, backed_off):
+            connection_ips = await self._reachable_connection_ips_async(ctx, healthy, backed_off)
+            if not connection_ips:
+                return
+            async with self._governor.async_slot(ctx.device), sessions:
+                driver = await self._fetch_device_async(ctx, connection_ips)
+            if driver is not None:
+                await reconcile(ctx, driver)
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for target in targets:
+                    tasks.create_task(collect(*target))
+        except ExceptionGroup as group:
+            # Surface the first failure as-is, like the threaded path does.
+            raise group.exceptions[0] from None
+
+    async def _fetch_device_async(self, ctx: DeviceContext, connection_ips):
+        """Prefetch the collector's RPCs from one device, returning a replaying driver.
+
+        Runs on the event loop, where the thread-local DeviceContext is shared,
+        so messages are logged with the device's prefix explicitly.
+        """
+        attempts = list(connection_ips)
+        dropped = set()
+        while attempts:
+            ip, label = attempts.pop(0)
+            self.plan.log_info(f"{ctx.log_prefix} Connecting via {label} IP `{ip}`")
+            driver = self._napalm_driver(
+                ip,
+                self._napalm_username,
+                self._napalm_password,
+                optional_args=self._napalm_args,
+            )
+            driver.device = ReplayDevice(ip)
+            started = time.monotonic()
+            connected = False
+            try:
+                async with AsyncNetconfSession(
+                    ip,
+                    self._napalm_username,
+                    self._napalm_password,
+                    port=self._napalm_args.get("port", 22),
+                    timeout=self._napalm_args.get("timeout", 60),
+                    key_file=self._napalm_args.get("key_file"),
+                    known_hosts=self._napalm_args.get("known_hosts"),
+                    verify_host_key=self._napalm_args.get("verify_host_key", True),
+                ) as session:
+                    connected = True
+                    connect_time = time.monotonic() - started
+                    self._add_timing("connect", connect_time, ctx=ctx)
+                    await sync_to_async(DeviceReachability.objects.record_success, thread_sensitive=True)(
+                        ctx.device, ip
                     )
-                except ValueError:
-                    self._log_warning("Device has no usable IP address configured. Skipping.")
+                    getters = dict.fromkeys(
+                        getter
+                        for collector_type in self._collector_types
+                        for getter in ASYNC_ENGINE_GETTERS[collector_type]
+                    )
+                    fetch_started = time.monotonic()
+                    await session.prefetch(driver, getters)
+                    self._add_timing("rpc", time.monotonic() - fetch_started, ctx=ctx)
+                if connect_time > get_plugin_config("netbox_facts", "slow_connect_threshold", 10):
+                    self._log_congestion_async(ctx)
+                else:
+                    self._governor.record_success(ctx.device)
+                return driver
+            except (CommandTimeoutException, ConnectionException) as exc:
+                if connected:
+                    # Dropped after connecting: refetch over a new session to the same IP once
+                    self.plan.log_warning(f"{ctx.log_prefix} Connection lost via {label} IP `{ip}`: {exc}")
+                    if isinstance(exc, CommandTimeoutException):
+                        self._log_congestion_async(ctx)
+                    if ip not in dropped:
+                        dropped.add(ip)
+                        attempts.insert(0, (ip, label))
                     continue
+                self.plan.log_warning(f"{ctx.log_prefix} Connection failed via {label} IP `{ip}`: {exc}")
+                metrics.CONNECTION_FAILURES.labels(plan=self.plan.name, target=label).inc()
+                self._add_timing("connect", time.monotonic() - started, ctx=ctx)
+                if isinstance(exc, CommandTimeoutException):
+                    self._log_congestion_async(ctx)
+                await sync_to_async(DeviceReachability.objects.record_failure, thread_sensitive=True)(
+                    ctx.device, ip, exc
+                )
+
+        self.plan.log_failure(f"{ctx.log_prefix} All connection attempts failed.")
+        self._store_device_timings(ctx)
+        return None
+
+    def _log_congestion_async(self, ctx: DeviceContext):
+        """Record congestion for *ctx*'s device from the event loop."""
+        for dimension, limit in self._governor.record_congestion(ctx.device):
+            self.plan.log_warning(f"{ctx.log_prefix} Lowered the {dimension} session limit to {limit}.")
+
+    def _reconcile_device(self, ctx: DeviceContext, driver):
+        """Run the plan's collector methods against a driver replaying prefetched replies."""
+        self._local.ctx = ctx
+        ctx.replaying = True
+        try:
+            for collector_type in self._collector_types:
+                self._run_collector(collector_type, driver)
+        finally:
+            self._flush_mac_touches()
+            self._store_device_timings(ctx)
+
+    @staticmethod
+    def _interleave_by_site(devices):
+        """Order *devices* round-robin across sites.
+
+        Workers block while a site is at its session limit, so submitting one
+        site's devices back to back would stall the whole pool behind it.
+        """
+        by_site = defaultdict(list)
+        for device in devices:
+            by_site[device.site_id].append(device)
+        return [device for device in chain.from_iterable(zip_longest(*by_site.values())) if device is not None]
+
+    def _record_connect_time(self, seconds: float):
+        """Record the connect latency of the current device and feed it to the concurrency governor."""
+        self._add_timing("connect", seconds)
+        if seconds > get_plugin_config("netbox_facts", "slow_connect_threshold", 10):
+            self._log_info(f"Slow connection ({seconds:.1f}s).")
+            self._record_congestion()
+        else:
+            self._governor.record_success(self._current_device)
+
+    def _record_congestion(self):
+        """Tell the concurrency governor the current device's site or platform is struggling."""
+        for dimension, limit in self._governor.record_congestion(self._current_device):
+            self._log_warning(f"Lowered the {dimension} session limit to {limit}.")
 
-                connected = False
-                for ip, label in connection_ips:
+    def _collect_device_threaded(self, device: Device):
+        """Run _collect_device() in a worker thread, releasing its DB connection afterwards."""
+        try:
+            self._collect_device(device)
+        finally:
+            django.db.connections.close_all()
+
+    def _collect_device(self, device: Device):
+        """Connect to a single device and run the plan's collector against it."""
+        ctx = self._local.ctx = DeviceContext(
+            device=device,
+            log_prefix=get_absolute_url_markdown(device, bold=True),
+        )
+        try:
+            with self._timed("total"):
+                self._connect_and_collect(device)
+        finally:
+            self._flush_mac_touches()
+            self._store_device_timings(ctx)
+
+    def _connect_and_collect(self, device: Device):
+        """Resolve the connection IPs of the current device and collect within the governor's limits."""
+        self._log_info(f"Starting {self.plan.get_collector_types_display()} collection")
+
+        try:
+            connection_ips = get_connection_ips(
+                device,
+                self.plan.connection_target,
+            )
+        except ValueError:
+            self._log_warning("Device has no usable IP address configured. Skipping.")
+            return
+
+        connection_ips = self._reachable_connection_ips(connection_ips)
+        if not connection_ips:
+            return
+
+        with self._governor.slot(device):
+            self._collect_over_session(device, connection_ips)
+
+    def _collect_over_session(self, device: Device, connection_ips):
+        """Open a session to *device* via *connection_ips* and run every collector type."""
+        # Every collector type runs over the same session. If the connection
+        # drops, the next session resumes with the collectors that have not
+        # run yet.
+        pending = list(self._collector_types)
+        attempts = list(connection_ips)
+        dropped = set()
+
+        if self.plan.connection_target in ConnectionTargetChoices.RACING_TARGETS and len(connection_ips) > 1:
+            started = time.monotonic()
+            winner = self._race_connections(connection_ips)
+            if winner is None:
+                self._add_timing("connect", time.monotonic() - started)
+                self._log_failure("All connection attempts failed.")
+                return
+            driver, ip, label = winner
+            self._log_info(f"Connected via {label} IP `{ip}`")
+            self._record_connect_time(time.monotonic() - started)
+            DeviceReachability.objects.record_success(device, ip)
+            try:
+                while pending:
+                    self._run_collector(pending[0], driver)
+                    pending.pop(0)
+                return
+            except ConnectionException as exc:
+                self._log_warning(f"Connection lost via {label} IP `{ip}`: {exc.__cause__ or exc}")
+            finally:
+                self._close_driver(driver)
+            # The IP that won the race is reachable: redial it once, without backing off
+            attempts = [(ip, label)]
+            dropped.add(ip)
+
+        while attempts:
+            ip, label = attempts.pop(0)
+            self._log_info(f"Connecting via {label} IP `{ip}`")
+            started = time.monotonic()
+            connected = False
+            try:
+                with self._napalm_driver(
+                    ip,
+                    self._napalm_username,
+                    self._napalm_password,
+                    optional_args=self._napalm_args,
+                ) as driver:
+                    connected = True
+                    self._record_connect_time(time.monotonic() - started)
+                    DeviceReachability.objects.record_success(device, ip)
+                    while pending:
+                        self._run_collector(pending[0], driver)
+                        pending.pop(0)
+                return
+            except ConnectionException as exc:
+                detail = exc.__cause__ or exc
+                if connected:
+                    # A session dropped after connecting is not a reachability
+                    # failure: resume over a new session to the same IP once.
+                    self._log_warning(f"Connection lost via {label} IP `{ip}`: {detail}")
+                    if not pending:
+                        return
+                    if ip not in dropped:
+                        dropped.add(ip)
+                        attempts.insert(0, (ip, label))
+                    continue
+                self._log_warning(f"Connection failed via {label} IP `{ip}`: {detail}")
+                metrics.CONNECTION_FAILURES.labels(plan=self.plan.name, target=label).inc()
+                self._add_timing("connect", time.monotonic() - started)
+                DeviceReachability.objects.record_failure(device, ip, detail)
+
+        self._log_failure("All connection attempts failed.")
+
+    def _backed_off_connection_ips(self, connection_ips, device: Device):
+        """Split *connection_ips* into healthy ones and those *device* is backing off from.
+
+        Returns the healthy ``(ip, label)`` pairs and the backed-off ones as
+        ``(ip, label, record)`` triples, both in their original order.
+        """
+        backed_off = DeviceReachability.objects.backed_off(device, self._now)
+        if not backed_off:
+            return connection_ips, []
+        healthy = [(ip, label) for ip, label in connection_ips if ip not in backed_off]
+        return healthy, [(ip, label, backed_off[ip]) for ip, label in connection_ips if ip in backed_off]
+
+    @staticmethod
+    def _probe_message(ip: str, label: str, record: DeviceReachability, answered: bool) -> str:
+        """Describe the probe outcome for a backed-off connection IP."""
+        if answered:
+            return f"{label} IP `{ip}` answered a probe after {record.failure_count} failures. Retrying."
+        return (
+            f"Skipping {label} IP `{ip}`: unreachable for {record.failure_count} attempts, "
+            f"next attempt after {record.next_attempt:%Y-%m-%d %H:%M %Z}."
+        )
+
+    def _reachable_connection_ips(self, connection_ips):
+        """Drop connection IPs the current device is backing off from.
+
+        IPs in backoff get a quick TCP probe on the NAPALM port instead; those
+        that answer are kept, after the healthy ones. Logs and returns an empty
+        list when nothing is left to dial.
+        """
+        healthy, backed_off = self._backed_off_connection_ips(connection_ips, self._current_device)
+        if not backed_off:
+            return healthy
+
+        revived = []
+        for ip, label, record in backed_off:
+            answered = self._probe(ip)
+            self._log_info(self._probe_message(ip, label, record, answered))
+            if answered:
+                revived.append((ip, label))
+
+        if not healthy and not revived:
+            self._log_warning("All connection IPs are backing off after repeated failures. Skipping.")
+        return healthy + revived
+
+    async def _reachable_connection_ips_async(self, ctx: DeviceContext, healthy, backed_off):
+        """Probe *backed_off* IPs concurrently from the event loop, like :meth:`_reachable_connection_ips`."""
+        if not backed_off:
+            return healthy
+
+        answers = await asyncio.gather(*(self._probe_async(ip) for ip, _label, _record in backed_off))
+        revived = []
+        for (ip, label, record), answered in zip(backed_off, answers, strict=True):
+            self.plan.log_info(f"{ctx.log_prefix} {self._probe_message(ip, label, record, answered)}")
+            if answered:
+                revived.append((ip, label))
+
+        if not healthy and not revived:
+            self.plan.log_warning(
+                f"{ctx.log_prefix} All connection IPs are backing off after repeated failures. Skipping."
+            )
+        return healthy + revived
+
+    def _probe(self, ip: str) -> bool:
+        """Return True if a TCP connection to the NAPALM port of *ip* succeeds quickly."""
+        port = self._napalm_args.get("port", 22)
+        timeout = get_plugin_config("netbox_facts", "reachability_probe_timeout", 2)
+        try:
+            with socket.create_connection((ip, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    async def _probe_async(self, ip: str) -> bool:
+        """Asyncio counterpart of :meth:`_probe`."""
+        port = self._napalm_args.get("port", 22)
+        timeout = get_plugin_config("netbox_facts", "reachability_probe_timeout", 2)
+        try:
+            _reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    def _open_driver(self, ip: str):
+        """Instantiate the NAPALM driver for *ip* and open its session."""
+        driver = self._napalm_driver(
+            ip,
+            self._napalm_username,
+            self._napalm_password,
+            optional_args=self._napalm_args,
+        )
+        driver.open()
+        return driver
+
+    @staticmethod
+    def _close_driver(driver):
+        """Close a NAPALM session, ignoring errors from an already dead connection."""
+        try:
+            driver.close()
+        except Exception:  # noqa: S110
+            pass
+
+    @classmethod
+    def _close_late_driver(cls, future):
+        """Done-callback closing sessions that connected after the race was decided."""
+        if not future.cancelled() and future.exception() is None:
+            cls._close_driver(future.result())
+
+    def _race_connections(self, connection_ips):
+        """Open sessions to *connection_ips* with staggered starts and keep the first to connect.
+
+        The next candidate starts when the previous one fails or has not
+        connected after ``connection_race_stagger`` seconds. Returns a
+        ``(driver, ip, label)`` tuple, or None if every attempt failed.
+        Sessions that connect after the winner are closed in the background.
+        """
+        stagger = get_plugin_config("netbox_facts", "connection_race_stagger", 2)
+        executor = ThreadPoolExecutor(max_workers=len(connection_ips), thread_name_prefix="netbox_facts_connect")
+        candidates = list(connection_ips)
+        attempts = {}
+        winner = None
+        try:
+            while winner is None and (candidates or attempts):
+                if candidates:
+                    ip, label = candidates.pop(0)
                     self._log_info(f"Connecting via {label} IP `{ip}`")
+                    attempts[executor.submit(self._open_driver, ip)] = (ip, label)
+                done, _ = wait(attempts, timeout=stagger if candidates else None, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ip, label = attempts.pop(future)
                     try:
-                        with self._napalm_driver(
-                            ip,
-                            self._napalm_username,
-                            self._napalm_password,
-                            optional_args=self._napalm_args,
-                        ) as driver:
-                            # Lookup the collection method and call it
-                            getattr(self, self._collector_type)(driver)
-                        connected = True
-                        break
-                    except AttributeError as exc:
-                        raise NotImplementedError from exc
+                        driver = future.result()
                     except ConnectionException as exc:
                         detail = exc.__cause__ or exc
                         self._log_warning(f"Connection failed via {label} IP `{ip}`: {detail}")
-
-                if not connected:
-                    self._log_failure("All connection attempts failed.")
-        except Exception as exc:
-            # Safety net: mark the report as failed on unhandled exceptions
-            self._report.update_summary()
-            self._report.completed_at = timezone.now()
-            self._report.status = ReportStatusChoices.STATUS_FAILED
-            self._report.error_message = str(exc)[:2000]
-            self._report.save(update_fields=["completed_at", "status", "error_message"])
-            raise
-        else:
-            # Finalize report on success
-            self._report.update_summary()
-            self._report.completed_at = timezone.now()
-            self._report.status = (
-                ReportStatusChoices.STATUS_APPLIED if self._should_apply() else ReportStatusChoices.STATUS_PENDING
-            )
-            self._report.save(update_fields=["completed_at", "status"])
+                        metrics.CONNECTION_FAILURES.labels(plan=self.plan.name, target=label).inc()
+                        DeviceReachability.objects.record_failure(self._current_device, ip, detail)
+                        continue
+                    if winner is None:
+                        winner = (driver, ip, label)
+                    else:
+                        self._close_driver(driver)
+        finally:
+            for future in attempts:
+                future.add_done_callback(self._close_late_driver)
+            executor.shutdown(wait=False)
+        return winner
+
+    def _collector_type_display(self) -> str:
+        """Return the display label of the collector type currently running."""
+        labels = dict(self.plan._meta.get_field("collector_type").flatchoices)
+        return str(labels.get(self._collector_type, self._collector_type))
+
+    def _run_collector(self, collector_type: str, driver):
+        """Look up the collection method for *collector_type* and call it."""
+        self._collector_type = collector_type
+        try:
+            method = getattr(self, collector_type)
+        except AttributeError as exc:
+            raise NotImplementedError from exc
+
+        # Time not spent in driver calls or on report entries is reconciliation
+        # against the NetBox database.
+        timings = self._ctx.timings
+        nested = ("rpc", "parse", "entries")
+        nested_before = sum(timings.get(phase, 0.0) for phase in nested)
+        started = time.monotonic()
+        try:
+            method(driver)
+            metrics.DEVICES_COLLECTED.labels(plan=self.plan.name, collector_type=collector_type).inc()
+        finally:
+            nested_time = sum(timings.get(phase, 0.0) for phase in nested) - nested_before
+            self._add_timing("reconcile", time.monotonic() - started - nested_time)
 
     def _log_debug(self, message):
         """Log a message at DEBUG level."""
         self.plan.log_debug(f"{self._log_prefix} {message}".strip())
 
-    def _napalm_rpc(self, call, label, *args, **kwargs):
+    def _napalm_rpc(self, call, label, *args, stream=False, **kwargs):
         """Execute a NAPALM RPC call with standard error handling.
 
-        Returns the call result, or None if the call failed.
+        Returns the call result, or None if the call failed. Generator
+        results are drained into a list, unless *stream* is set: then only
+        their first entry, which runs the RPC, is read here and the rest is
+        left for the caller to iterate over.
         """
         try:
-            return call(*args, **kwargs)
+            with self._timed_driver_call(label):
+                result = call(*args, **kwargs)
+                # Run generator getters here, so their RPCs are not billed
+                # to the reconciliation that iterates over them.
+                if isinstance(result, Generator):
+                    if stream:
+                        first = next(result, None)
+                        result = chain([] if first is None else [first], result)
+                    else:
+                        result = list(result)
+            return result
         except (CommandErrorException, CommandTimeoutException, ConnectionException) as exc:
             self._log_failure(f"Failed to retrieve {label}: {exc}")
+            if isinstance(exc, CommandTimeoutException):
+                self._record_congestion()
             return None
         except NotImplementedError:
             self._log_info(f"Driver does not support {label}, skipping.")
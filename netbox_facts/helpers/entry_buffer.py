@@ -0,0 +1,98 @@
+"""Batched writes of FactsReportEntry rows."""
+
+from __future__ import annotations
+
+from django.db import connections, router, transaction
+from netbox.plugins.utils import get_plugin_config
+
+# Fields a collector may change on an entry after recording it.
+APPLIED_FIELDS = ("status", "applied_at", "object_type", "object_id", "object_repr")
+
+# Values of the entry_ingestion plugin setting
+INGESTION_ORM = "orm"
+INGESTION_COPY = "copy"
+
+
+def copy_entries(entries: list, connection):
+    """Insert *entries* with PostgreSQL ``COPY FROM STDIN``.
+
+    Primary keys are drawn from the table's sequence in one query first, so
+    the entries can still be updated afterwards. Rows are streamed to the
+    server one at a time, each JSON value serialized as its row is written.
+    """
+    from netbox_facts.models.facts_report import FactsReportEntry
+
+    opts = FactsReportEntry._meta
+    fields = opts.concrete_fields
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in fields)
+
+    with transaction.atomic(using=connection.alias, savepoint=False), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+            [opts.db_table, opts.pk.column, len(entries)],
+        )
+        for entry, (pk,) in zip(entries, cursor.fetchall(), strict=True):
+            entry.pk = pk
+
+        with cursor.cursor.copy(f"COPY {quote_name(opts.db_table)} ({columns}) FROM STDIN") as copy:
+            for entry in entries:
+                copy.write_row([field.get_db_prep_save(field.pre_save(entry, True), connection) for field in fields])
+
+    for entry in entries:
+        entry._state.adding = False
+        entry._state.db = connection.alias
+
+
+class EntryBuffer:
+    """Accumulate report entries in memory and write them in batches.
+
+    Entries are created once ``batch_size`` of them are waiting, or on
+    :meth:`flush`, with ``bulk_create`` or, when *ingestion* is
+    :data:`INGESTION_COPY` and the database is PostgreSQL, with
+    :func:`copy_entries`. An entry marked applied while still buffered is
+    simply written in its applied state; one that was already written is
+    queued for a ``bulk_update`` of :data:`APPLIED_FIELDS`.
+    """
+
+    def __init__(self, batch_size: int | None = None, ingestion: str | None = None):
+        self.batch_size: int = batch_size or get_plugin_config("netbox_facts", "entry_batch_size", 1000)
+        self.ingestion: str = ingestion or get_plugin_config("netbox_facts", "entry_ingestion", INGESTION_ORM)
+        self._new: list = []
+        self._changed: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._new) + len(self._changed)
+
+    def add(self, entry):
+        """Queue *entry* for creation.
+
+        A full buffer is flushed before *entry* joins it, so the entry most
+        recently recorded stays in memory for the collector to mark applied.
+        """
+        if len(self._new) >= self.batch_size:
+            self.flush()
+        self._new.append(entry)
+
+    def changed(self, entry):
+        """Note that *entry* changed after it was queued."""
+        if entry.pk is None:
+            return
+        self._changed[entry.pk] = entry
+        if len(self._changed) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every queued entry."""
+        from netbox_facts.models.facts_report import FactsReportEntry
+
+        if self._new:
+            new, self._new = self._new, []
+            connection = connections[router.db_for_write(FactsReportEntry)]
+            if self.ingestion == INGESTION_COPY and connection.vendor == "postgresql":
+                copy_entries(new, connection)
+            else:
+                FactsReportEntry.objects.bulk_create(new, batch_size=self.batch_size)
+        if self._changed:
+            changed, self._changed = list(self._changed.values()), {}
+            FactsReportEntry.objects.bulk_update(changed, APPLIED_FIELDS, batch_size=self.batch_size)
@@ -0,0 +1,121 @@
+"""Adaptive concurrency limits for device sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+GLOBAL = "global"
+SITE = "site"
+PLATFORM = "platform"
+
+
+class ConcurrencyGovernor:
+    """Limit in-flight device sessions globally, per site and per platform.
+
+    Each site and platform has its own limit, capped by the configured
+    maximum or, when unset, by the global limit. Limits follow AIMD: a
+    congestion signal (slow connect, command timeout) halves the limits of
+    the device's site and platform, and every clean session adds back
+    roughly one slot per window of sessions. The global limit is fixed.
+    """
+
+    # Minimum seconds between two decreases of the same limit, so one burst
+    # of timeouts from sessions started together only counts once.
+    DECREASE_COOLDOWN = 10.0
+
+    def __init__(
+        self,
+        global_limit: int,
+        site_limit: int | None = None,
+        platform_limit: int | None = None,
+        adaptive: bool = True,
+    ):
+        self._ceilings = {
+            GLOBAL: global_limit,
+            SITE: min(site_limit or global_limit, global_limit),
+            PLATFORM: min(platform_limit or global_limit, global_limit),
+        }
+        self._adaptive = adaptive
+        self._limits: dict[tuple, float] = {}
+        self._in_flight: dict[tuple, int] = {}
+        self._last_decrease: dict[tuple, float] = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def keys(device) -> tuple[tuple, ...]:
+        """Return the limit keys a session to *device* counts against."""
+        return (GLOBAL, None), (SITE, device.site_id), (PLATFORM, device.platform_id)
+
+    def limit(self, key: tuple) -> int:
+        """Return the current whole-session limit of *key*."""
+        return max(1, int(self._limits.get(key, self._ceilings[key[0]])))
+
+    def try_acquire(self, device) -> bool:
+        """Take a slot for *device* if every limit it counts against has room."""
+        keys = self.keys(device)
+        with self._cond:
+            if any(self._in_flight.get(key, 0) >= self.limit(key) for key in keys):
+                return False
+            for key in keys:
+                self._in_flight[key] = self._in_flight.get(key, 0) + 1
+            return True
+
+    def release(self, device) -> None:
+        """Give back the slot taken for *device*."""
+        with self._cond:
+            for key in self.keys(device):
+                self._in_flight[key] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, device):
+        """Block the calling thread until *device* may open a session."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.try_acquire(device))
+        try:
+            yield
+        finally:
+            self.release(device)
+
+    @asynccontextmanager
+    async def async_slot(self, device, poll_interval: float = 0.05):
+        """Wait on the event loop until *device* may open a session."""
+        while not self.try_acquire(device):
+            await asyncio.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            self.release(device)
+
+    def record_success(self, device) -> None:
+        """Additively raise the site and platform limits of *device* after a clean session."""
+        if not self._adaptive:
+            return
+        with self._cond:
+            for key in self.keys(device)[1:]:
+                current = self._limits.get(key, self._ceilings[key[0]])
+                self._limits[key] = min(self._ceilings[key[0]], current + 1 / current)
+            self._cond.notify_all()
+
+    def record_congestion(self, device) -> list[tuple[str, int]]:
+        """Halve the site and platform limits of *device*.
+
+        Returns ``(dimension, new_limit)`` for each limit that was lowered.
+        """
+        if not self._adaptive:
+            return []
+        lowered = []
+        now = time.monotonic()
+        with self._cond:
+            for key in self.keys(device)[1:]:
+                if now - self._last_decrease.get(key, float("-inf")) < self.DECREASE_COOLDOWN:
+                    continue
+                before = self.limit(key)
+                self._limits[key] = max(1.0, self._limits.get(key, self._ceilings[key[0]]) / 2)
+                self._last_decrease[key] = now
+                if self.limit(key) < before:
+                    lowered.append((key[0], self.limit(key)))
+        return lowered
@@ -1,16 +1,33 @@
 """NetBox helper functions"""
 
+import functools
 import ipaddress
+import operator
 from collections.abc import Generator
 from typing import Any
 
+from dcim.fields import mac_unix_expanded_uppercase
 from dcim.models.device_components import Interface
-from dcim.models.devices import Device
-from ipam.models import IPAddress
+from dcim.models.devices import Device, Manufacturer
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, router, transaction
+from django.db.models import Case, CharField, Func, Q, Value, When
+from django.db.models.signals import post_save
+from django.utils.text import slugify
+from extras.choices import JournalEntryKindChoices
+from extras.models import JournalEntry, Tag, TaggedItem
+from ipam.models import ASN, RIR, IPAddress
 from ipam.models.ip import Prefix
 from ipam.models.vrfs import VRF
+from netaddr import EUI, AddrFormatError, IPNetwork
 
 from netbox_facts.constants import AUTO_D_TAG
+from netbox_facts.helpers.oui import mac_prefix, oui_index, prefix_eui, prefix_range
+
+# MACAddress rows updated per statement by touch_last_seen()
+LAST_SEEN_BATCH_SIZE = 5000
+# MAC addresses looked up per mac_address__in query
+MAC_LOOKUP_BATCH_SIZE = 5000
 
 
 def get_absolute_url_markdown(instance: Any, code=False, bold=False) -> str:
@@ -55,9 +72,9 @@ def get_connection_ips(instance: Device, target: str) -> list[tuple[str, str]]:
         candidates = [primary]
     elif target == ConnectionTargetChoices.TARGET_OOB:
         candidates = [oob]
-    elif target == ConnectionTargetChoices.TARGET_PRIMARY_THEN_OOB:
+    elif target in (ConnectionTargetChoices.TARGET_PRIMARY_THEN_OOB, ConnectionTargetChoices.TARGET_PRIMARY_RACE_OOB):
         candidates = [primary, oob]
-    elif target == ConnectionTargetChoices.TARGET_OOB_THEN_PRIMARY:
+    elif target in (ConnectionTargetChoices.TARGET_OOB_THEN_PRIMARY, ConnectionTargetChoices.TARGET_OOB_RACE_PRIMARY):
         candidates = [oob, primary]
     else:
         candidates = [primary]
@@ -197,6 +214,44 @@ def duplicate_object_warning(label, value):
     return f"Duplicate {label} `{value}` objects in NetBox \u2014 manual cleanup required. Skipping."
 
 
+def mac_key(mac_addr) -> int:
+    """Return the integer value of *mac_addr*, whatever its notation.
+
+    Raises ValueError if *mac_addr* is not a MAC address.
+    """
+    try:
+        return int(EUI(mac_addr, version=48))
+    except (AddrFormatError, TypeError) as exc:
+        raise ValueError(f"Invalid MAC address `{mac_addr}`.") from exc
+
+
+def bulk_get_macs(mac_addrs):
+    """Return the existing MACAddress objects of *mac_addrs*, keyed by :func:`mac_key`.
+
+    Looked up with ``mac_address__in`` queries of ``MAC_LOOKUP_BATCH_SIZE``
+    addresses. Invalid addresses are ignored. When an address has several
+    objects, the oldest is returned, as ``.first()`` would.
+    """
+    from netbox_facts.models.mac import MACAddress
+
+    keys = set()
+    for mac_addr in mac_addrs:
+        try:
+            keys.add(mac_key(mac_addr))
+        except ValueError:
+            continue
+    keys = sorted(keys)
+    macs = {}
+    for start in range(0, len(keys), MAC_LOOKUP_BATCH_SIZE):
+        batch = [
+            EUI(key, version=48, dialect=mac_unix_expanded_uppercase)
+            for key in keys[start : start + MAC_LOOKUP_BATCH_SIZE]
+        ]
+        for mac in MACAddress.objects.filter(mac_address__in=batch).order_by("pk"):
+            macs.setdefault(int(mac.mac_address), mac)
+    return macs
+
+
 def get_or_create_mac(mac_addr):
     """Get or create a MACAddress, tagging with AUTO_D_TAG if created.
 
@@ -210,6 +265,296 @@ def get_or_create_mac(mac_addr):
     return netbox_mac, created
 
 
+def send_created_signals(objects, batch=False):
+    """Send ``post_save`` for objects inserted with ``bulk_create``.
+
+    NetBox records change logs, updates its search cache and queues event
+    rules from ``post_save``, which ``bulk_create`` does not send. With
+    *batch*, the plugin's own receivers skip the objects: the caller then
+    does their work once for all of them.
+    """
+    for obj in objects:
+        post_save.send(
+            sender=type(obj),
+            instance=obj,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=obj._state.db,
+            batch=batch,
+        )
+
+
+def bulk_insert_new(model, objects):
+    """Insert *objects* with one ``bulk_create`` and return those this call inserted.
+
+    If another worker inserted some of the rows meanwhile, the insert fails
+    on a unique constraint; the objects are then inserted one by one,
+    skipping the conflicting ones. Unlike ``ignore_conflicts``, this leaves
+    the primary keys set, so callers can tell which rows they created.
+    """
+    try:
+        with transaction.atomic(using=router.db_for_write(model)):
+            return model.objects.bulk_create(objects)
+    except IntegrityError:
+        pass
+    created = []
+    for obj in objects:
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                created.extend(model.objects.bulk_create([obj]))
+        except IntegrityError:
+            continue
+    return created
+
+
+def bulk_journal(entries, kind=JournalEntryKindChoices.KIND_INFO):
+    """Write a JournalEntry for each ``(object, comments)`` pair with one ``bulk_create``."""
+    journal_entries = JournalEntry.objects.bulk_create(
+        [JournalEntry(assigned_object=obj, kind=kind, comments=comments) for obj, comments in entries]
+    )
+    send_created_signals(journal_entries)
+    return journal_entries
+
+
+def bulk_tag_auto_discovered(model, pks):
+    """Tag the *model* objects with primary keys *pks* with AUTO_D_TAG in one insert."""
+    if not pks:
+        return
+    tag, _ = Tag.objects.get_or_create(name=AUTO_D_TAG, defaults={"slug": slugify(AUTO_D_TAG)})
+    content_type = ContentType.objects.get_for_model(model)
+    TaggedItem.objects.bulk_create(
+        [TaggedItem(tag=tag, content_type=content_type, object_id=pk) for pk in pks],
+        ignore_conflicts=True,
+    )
+
+
+def bulk_resolve_vendors(macs):
+    """Return the MACVendor of every OUI among *macs*, keyed by :func:`mac_prefix`.
+
+    Known prefixes come from the :data:`~netbox_facts.helpers.oui.oui_index`.
+    The remaining OUIs are named from netaddr's registry, matched to a
+    Manufacturer by name, as ``handle_mac_change`` does, and created with
+    :func:`bulk_insert_new`. Only the vendors this call inserted are
+    signalled, and existing MACs of those vendors are assigned to them with
+    one UPDATE. OUIs netaddr does not know are left out.
+    """
+    from netbox_facts.models.mac import MACAddress, MACVendor
+
+    prefixes = {mac_prefix(mac) for mac in macs}
+    if not prefixes:
+        return {}
+
+    vendors = oui_index.vendors(prefixes)
+    names = {}
+    for prefix in prefixes - vendors.keys():
+        if (name := oui_index.registry_name(prefix)) is not None:
+            names[prefix] = name
+    if not names:
+        return vendors
+
+    manufacturers = {
+        manufacturer.name: manufacturer for manufacturer in Manufacturer.objects.filter(name__in=names.values())
+    }
+    for vendor in MACVendor.objects.filter(vendor_name__in=names.values()).exclude(manufacturer=None):
+        manufacturers.setdefault(vendor.vendor_name, vendor.manufacturer)
+    created = bulk_insert_new(
+        MACVendor,
+        [
+            MACVendor(mac_prefix=prefix_eui(prefix), vendor_name=name, manufacturer=manufacturers.get(name))
+            for prefix, name in names.items()
+        ],
+    )
+    vendors.update((int(vendor.mac_prefix), vendor) for vendor in created)
+    if raced := names.keys() - vendors.keys():
+        # Inserted by another worker meanwhile, which signals them itself
+        raced_vendors = MACVendor.objects.filter(mac_prefix__in=[prefix_eui(prefix) for prefix in raced])
+        vendors.update((int(vendor.mac_prefix), vendor) for vendor in raced_vendors)
+    if not created:
+        return vendors
+    # Instead of the MACVendor receivers reloading the index and updating
+    # the MACs of each vendor, invalidate once and update all MACs at once.
+    send_created_signals(created, batch=True)
+    oui_index.invalidate()
+    ranges = [(vendor, Q(mac_address__range=prefix_range(mac_prefix(vendor.mac_prefix)))) for vendor in created]
+    MACAddress.objects.filter(functools.reduce(operator.or_, (condition for _, condition in ranges))).exclude(
+        vendor__in=created
+    ).update(vendor=Case(*(When(condition, then=Value(vendor.pk)) for vendor, condition in ranges)))
+    return vendors
+
+
+def bulk_assign_vendors(macs):
+    """Set the vendor of the saved MACAddress objects *macs* from their OUI.
+
+    Vendors come from :func:`bulk_resolve_vendors` and are written with one
+    UPDATE per vendor, so ``handle_mac_change`` does not run for each MAC.
+    MACs whose vendor already matches are left alone; fetch *macs* with
+    ``select_related("vendor")`` to check that without a query per MAC.
+    """
+    from netbox_facts.models.mac import MACAddress
+
+    stale = [
+        mac for mac in macs if mac.vendor_id is None or mac_prefix(mac.vendor.mac_prefix) != mac_prefix(mac.mac_address)
+    ]
+    vendors = bulk_resolve_vendors([mac.mac_address for mac in stale])
+    by_vendor = {}
+    for mac in stale:
+        vendor = vendors.get(mac_prefix(mac.mac_address))
+        if vendor is not None:
+            mac.vendor = vendor
+            by_vendor.setdefault(vendor, []).append(mac.pk)
+    for vendor, pks in by_vendor.items():
+        MACAddress.objects.filter(pk__in=pks).update(vendor=vendor)
+
+
+def bulk_get_or_create_macs(mac_addrs):
+    """Get or create the MACAddress objects of *mac_addrs* in a fixed number of queries.
+
+    Missing addresses are inserted with :func:`bulk_insert_new`, with their
+    vendor from :func:`bulk_resolve_vendors`, and tagged with AUTO_D_TAG.
+    This bypasses ``MACAddress.save()``; ``post_save`` is sent for the
+    inserted addresses afterwards, so they are change-logged. Existing
+    addresses without a vendor are given one by :func:`bulk_assign_vendors`.
+    Returns ``(macs, created)``: MACAddress objects keyed by the addresses as
+    given, and the set of addresses this call created.
+    """
+    from netbox_facts.models.mac import MACAddress
+
+    euis = {mac_addr: EUI(mac_addr, version=48, dialect=mac_unix_expanded_uppercase) for mac_addr in mac_addrs}
+    if not euis:
+        return {}, set()
+    existing = {int(mac.mac_address) for mac in MACAddress.objects.filter(mac_address__in=euis.values())}
+
+    missing = {int(eui): eui for eui in euis.values() if int(eui) not in existing}
+    inserted = []
+    if missing:
+        vendors = bulk_resolve_vendors(missing)
+        inserted = bulk_insert_new(
+            MACAddress,
+            [MACAddress(mac_address=eui, vendor=vendors.get(mac_prefix(value))) for value, eui in missing.items()],
+        )
+    inserted_values = {int(mac.mac_address) for mac in inserted}
+
+    by_value = {int(mac.mac_address): mac for mac in MACAddress.objects.filter(mac_address__in=euis.values())}
+    bulk_assign_vendors(
+        [mac for value, mac in by_value.items() if mac.vendor_id is None and value not in inserted_values]
+    )
+    bulk_tag_auto_discovered(MACAddress, [mac.pk for mac in inserted])
+    # The vendors are set already, so handle_mac_change skips the batch
+    send_created_signals(inserted, batch=True)
+    macs = {mac_addr: by_value[int(eui)] for mac_addr, eui in euis.items() if int(eui) in by_value}
+    created = {mac_addr for mac_addr, eui in euis.items() if int(eui) in inserted_values}
+    return macs, created
+
+
+def ip_key(address, vrf=None) -> tuple[str, int | None]:
+    """Return the ``(address, vrf_id)`` key the bulk IP helpers use for *address* in *vrf*."""
+    return str(IPNetwork(address)), vrf.pk if vrf else None
+
+
+def bulk_get_ips(addresses):
+    """Look up the IPAddress objects of ``(address, vrf)`` pairs with one query.
+
+    Returns ``(ips, duplicates)``: IPAddress objects keyed by :func:`ip_key`
+    and the set of keys matching several objects. For those keys the oldest
+    object is returned, as ``.first()`` would.
+    """
+    keys = {ip_key(address, vrf) for address, vrf in addresses}
+    ips = {}
+    duplicates = set()
+    if not keys:
+        return ips, duplicates
+
+    hosts = {str(IPNetwork(address).ip) for address, _ in keys}
+    for ip in (
+        IPAddress.objects.annotate(_host=Func("address", function="HOST", output_field=CharField()))
+        .filter(_host__in=hosts)
+        .select_related("vrf")
+        .order_by("pk")
+    ):
+        key = (str(ip.address), ip.vrf_id)
+        if key not in keys:
+            continue
+        if key in ips:
+            duplicates.add(key)
+            continue
+        ips[key] = ip
+    return ips, duplicates
+
+
+def bulk_get_or_create_ips(addresses, overrides=None, **defaults):
+    """Get or create IPAddress objects for ``(address, vrf)`` pairs in a fixed number of queries.
+
+    Missing addresses are created with *defaults*, updated with the fields
+    *overrides* holds for their key, if any, in one ``bulk_create``,
+    tagged with AUTO_D_TAG in one insert, then passed to
+    :func:`send_created_signals` so they are change-logged as usual.
+
+    Returns ``(ips, created, duplicates)``: IPAddress objects keyed by
+    :func:`ip_key`, the set of keys that were created, and the set of keys
+    matching several existing IPAddress objects, which are left out.
+    """
+    vrfs = {ip_key(address, vrf): vrf for address, vrf in addresses}
+    if not vrfs:
+        return {}, set(), set()
+
+    ips, duplicates = bulk_get_ips((address, vrf) for (address, _), vrf in vrfs.items())
+    for key in duplicates:
+        del ips[key]
+
+    overrides = overrides or {}
+    missing = [
+        IPAddress(address=IPNetwork(address), vrf=vrf, **{**defaults, **overrides.get((address, vrf_id), {})})
+        for (address, vrf_id), vrf in vrfs.items()
+        if (address, vrf_id) not in ips and (address, vrf_id) not in duplicates
+    ]
+    if not missing:
+        return ips, set(), duplicates
+
+    created_ips = IPAddress.objects.bulk_create(missing)
+    bulk_tag_auto_discovered(IPAddress, [ip.pk for ip in created_ips])
+    created_ips = (
+        IPAddress.objects.filter(pk__in=[ip.pk for ip in created_ips]).select_related("vrf").prefetch_related("tags")
+    )
+    send_created_signals(created_ips)
+    created = set()
+    for ip in created_ips:
+        key = (str(ip.address), ip.vrf_id)
+        ips[key] = ip
+        created.add(key)
+    return ips, created, duplicates
+
+
+def touch_last_seen(pks, now, changelog=False):
+    """Set ``last_seen`` of the MACAddress objects *pks* to *now*, one UPDATE per batch.
+
+    Pure sightings are not change-logged and skip the MACAddress signals,
+    unless *changelog* is set: the MACs are then loaded and ``post_save`` is
+    sent for each, as if they had been saved.
+    """
+    from netbox_facts.models.mac import MACAddress
+
+    pks = sorted(pks)
+    for start in range(0, len(pks), LAST_SEEN_BATCH_SIZE):
+        batch = pks[start : start + LAST_SEEN_BATCH_SIZE]
+        macs = []
+        if changelog:
+            macs = list(MACAddress.objects.filter(pk__in=batch).prefetch_related("tags"))
+            for mac in macs:
+                mac.snapshot()
+                mac.last_seen = now
+        MACAddress.objects.filter(pk__in=batch).update(last_seen=now)
+        for mac in macs:
+            post_save.send(
+                sender=MACAddress,
+                instance=mac,
+                created=False,
+                update_fields={"last_seen"},
+                raw=False,
+                using=mac._state.db,
+            )
+
+
 def get_or_create_ip(address, vrf=None, **defaults):
     """Get or create an IPAddress, tagging with AUTO_D_TAG if created.
 
@@ -235,6 +580,67 @@ def resolve_vrf(name):
     return VRF.objects.get(name=name)
 
 
+def bulk_resolve_vrfs(names):
+    """Resolve VRF *names* as :func:`resolve_vrf` does, with one query.
+
+    Returns ``(vrfs, duplicates)``: the VRF of each resolved name, None for
+    empty/global/default names, and the set of names matching several VRFs.
+    Names matching no VRF are in neither.
+    """
+    vrfs = {}
+    lookup = set()
+    for name in names:
+        if not name or name.lower() in ("global", "default"):
+            vrfs[name] = None
+        else:
+            lookup.add(name)
+
+    duplicates = set()
+    for vrf in VRF.objects.filter(name__in=lookup) if lookup else ():
+        if vrf.name in vrfs:
+            duplicates.add(vrf.name)
+        vrfs[vrf.name] = vrf
+    for name in duplicates:
+        del vrfs[name]
+    return vrfs, duplicates
+
+
+def bulk_get_asns(numbers):
+    """Look up the ASN objects of AS *numbers* with one query, keyed by number."""
+    numbers = {int(number) for number in numbers}
+    if not numbers:
+        return {}
+    return {asn.asn: asn for asn in ASN.objects.filter(asn__in=numbers)}
+
+
+def bulk_get_or_create_asns(numbers):
+    """Get or create the ASN objects of AS *numbers* in a fixed number of queries.
+
+    Missing ASNs are created with :func:`bulk_insert_new`, all assigned to
+    the first RIR as ``ASN.objects.get_or_create()`` callers here always
+    did. Only those this call created are passed to
+    :func:`send_created_signals`. Returns ``(asns,
+    uncreated)``: ASN objects keyed by number, and the set of numbers that
+    could not be created because NetBox has no RIR.
+    """
+    numbers = {int(number) for number in numbers}
+    if not numbers:
+        return {}, set()
+    asns = bulk_get_asns(numbers)
+    missing = numbers - asns.keys()
+    if not missing:
+        return asns, set()
+
+    rir = RIR.objects.first()
+    if rir is None:
+        return asns, missing
+    created = bulk_insert_new(ASN, [ASN(asn=number, rir=rir) for number in sorted(missing)])
+    send_created_signals(ASN.objects.filter(pk__in=[asn.pk for asn in created]))
+    # Includes the ASNs another worker inserted meanwhile
+    asns.update((asn.asn, asn) for asn in ASN.objects.filter(asn__in=missing))
+    return asns, missing - asns.keys()
+
+
 def create_module(device, module_bay, module_type, serial):
     """Create a Module with adopt/disable-replication flags, tagged with AUTO_D_TAG."""
     from dcim.models.modules import Module
@@ -0,0 +1,152 @@
+"""Process-wide index of MAC vendor prefixes."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import re
+import threading
+import time
+
+from dcim.fields import mac_unix_expanded_uppercase
+from django.db import router, transaction
+from netaddr import EUI, NotRegisteredError
+from netbox.plugins.utils import get_plugin_config
+
+
+def mac_prefix(mac) -> int:
+    """Return the integer OUI prefix of *mac*, as stored in ``MACVendor.mac_prefix``."""
+    return int(mac) & ~0x0000FFFFFF
+
+
+def prefix_eui(prefix: int) -> EUI:
+    """Return the EUI of the integer OUI *prefix*, for ``MACVendor.mac_prefix`` lookups."""
+    return EUI(prefix, version=48, dialect=mac_unix_expanded_uppercase)
+
+
+def prefix_range(prefix: int) -> tuple[EUI, EUI]:
+    """Return the first and last MAC address of the integer OUI *prefix*.
+
+    ``mac_address__range=prefix_range(prefix)`` selects the MACs of a vendor
+    with a range scan of the ``macaddr`` index, which a text prefix match
+    cannot use.
+    """
+    return prefix_eui(prefix), prefix_eui(prefix | 0xFFFFFF)
+
+
+# "00000C     (base 16)\t\tCisco Systems, Inc" lines of the IEEE oui.txt
+OUI_TXT_LINE = re.compile(r"^\s*([0-9A-Fa-f]{6})\s+\(base 16\)\s*(.*?)\s*$")
+
+
+def parse_oui_registry(lines):
+    """Yield ``(prefix, organisation)`` for each MA-L assignment in an IEEE registry file.
+
+    *lines* is an iterable of text lines in either the ``oui.txt`` format,
+    as bundled with netaddr, or the ``oui.csv`` format published by the IEEE.
+    Assignments without an organisation name are skipped.
+    """
+    lines = iter(lines)
+    first = next(lines, "")
+    if first.startswith("Registry,Assignment,"):
+        for row in csv.reader(lines):
+            if len(row) >= 3 and row[0] == "MA-L" and row[2].strip():
+                yield int(row[1], 16) << 24, row[2].strip()
+        return
+    for line in itertools.chain([first], lines):
+        if (match := OUI_TXT_LINE.match(line)) and match.group(2):
+            yield int(match.group(1), 16) << 24, match.group(2)
+
+
+class OUIIndex:
+    """Map 24-bit OUI prefixes to MACVendor rows and IEEE registry names.
+
+    The vendor map is loaded from ``MACVendor`` with one query on first use
+    and kept until :meth:`invalidate`, which the ``MACVendor`` signals call,
+    or until it is older than the ``oui_index_ttl`` setting, so changes made
+    by other processes are picked up too. Lookups inside a transaction are
+    served from the map as well, unless that transaction has itself written
+    vendors: its lookups then query ``MACVendor`` until it commits, so the
+    map never holds rows that could still be rolled back.
+
+    Registry names never change while the process runs and are cached for
+    good, misses included.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vendors: dict | None = None
+        self._loaded_at = 0.0
+        self._names: dict[int, str | None] = {}
+        # Set while this thread's transaction has written vendors
+        self._local = threading.local()
+
+    def invalidate(self):
+        """Drop the vendor map; the next lookup reloads it.
+
+        Inside a transaction the map is dropped once the transaction commits.
+        """
+        from netbox_facts.models.mac import MACVendor
+
+        if not self._in_transaction():
+            self._drop()
+            return
+        self._local.pending = True
+        transaction.on_commit(self._drop, using=router.db_for_write(MACVendor))
+
+    def _drop(self):
+        self._local.pending = False
+        with self._lock:
+            self._vendors = None
+
+    @staticmethod
+    def _in_transaction() -> bool:
+        from netbox_facts.models.mac import MACVendor
+
+        return transaction.get_connection(router.db_for_read(MACVendor)).in_atomic_block
+
+    def _cached_vendors(self) -> dict | None:
+        from netbox_facts.models.mac import MACVendor
+
+        if not self._in_transaction():
+            # A transaction that wrote vendors but rolled back leaves the flag set
+            self._local.pending = False
+        elif getattr(self._local, "pending", False):
+            return None
+        ttl = get_plugin_config("netbox_facts", "oui_index_ttl", 300)
+        with self._lock:
+            if self._vendors is None or time.monotonic() - self._loaded_at > ttl:
+                self._vendors = {int(vendor.mac_prefix): vendor for vendor in MACVendor.objects.all()}
+                self._loaded_at = time.monotonic()
+            return self._vendors
+
+    def vendors(self, prefixes) -> dict:
+        """Return the MACVendor of each known prefix of *prefixes*, keyed by prefix."""
+        from netbox_facts.models.mac import MACVendor
+
+        vendors = self._cached_vendors()
+        if vendors is None:
+            return {
+                int(vendor.mac_prefix): vendor
+                for vendor in MACVendor.objects.filter(mac_prefix__in=[prefix_eui(prefix) for prefix in prefixes])
+            }
+        return {prefix: vendors[prefix] for prefix in prefixes if prefix in vendors}
+
+    def vendor(self, prefix: int):
+        """Return the MACVendor of *prefix*, or None."""
+        return self.vendors([prefix]).get(prefix)
+
+    def registry_name(self, prefix: int) -> str | None:
+        """Return the IEEE registry organisation of *prefix*, or None if it is not registered."""
+        try:
+            return self._names[prefix]
+        except KeyError:
+            pass
+        try:
+            name = prefix_eui(prefix).oui.registration().org
+        except NotRegisteredError:
+            name = None
+        self._names[prefix] = name
+        return name
+
+
+oui_index = OUIIndex()
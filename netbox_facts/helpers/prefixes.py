@@ -0,0 +1,156 @@
+"""In-memory containment checks against NetBox prefixes."""
+
+from __future__ import annotations
+
+import functools
+import ipaddress
+import operator
+import socket
+from typing import Any
+
+from django.db.models import Q
+from ipam.models.ip import Prefix
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class PrefixIndex:
+    """Answer "is there a NetBox prefix containing this network?" without a query per network.
+
+    Prefixes are stored per ``(IP version, VRF PK)`` as one set of network
+    addresses per prefix length, the levels of a binary trie. A lookup masks
+    the network to each length present, shortest first, and checks the
+    set, so its cost grows with the number of distinct prefix lengths
+    rather than the number of prefixes.
+    """
+
+    def __init__(self, prefixes=()):
+        # (version, vrf_id) -> {prefix length: {network address as int}}
+        self._levels: dict[tuple, dict[int, set[int]]] = {}
+        for prefix, vrf_id in prefixes:
+            self.add(prefix, vrf_id)
+
+    @classmethod
+    def covering(cls, networks) -> PrefixIndex:
+        """Load the prefixes, in any VRF, containing or equal to one of *networks*, with one query."""
+        networks = {ipaddress.ip_network(network, strict=False) for network in networks}
+        if not networks:
+            return cls()
+        query = functools.reduce(operator.or_, (Q(prefix__net_contains_or_equals=str(network)) for network in networks))
+        return cls(Prefix.objects.filter(query).values_list("prefix", "vrf_id"))
+
+    def add(self, prefix, vrf_id: int | None):
+        """Index *prefix* (anything ``ipaddress.ip_network`` accepts) in the VRF with PK *vrf_id*."""
+        network = ipaddress.ip_network(str(prefix), strict=False)
+        levels = self._levels.setdefault((network.version, vrf_id), {})
+        levels.setdefault(network.prefixlen, set()).add(int(network.network_address))
+
+    def _contains(self, network: IPNetwork, vrf_id: int | None) -> bool:
+        levels = self._levels.get((network.version, vrf_id))
+        if not levels:
+            return False
+        address = int(network.network_address)
+        bits = network.max_prefixlen
+        for length in sorted(levels):
+            if length > network.prefixlen:
+                break
+            mask = ((1 << length) - 1) << (bits - length)
+            if address & mask in levels[length]:
+                return True
+        return False
+
+    def contains(self, network, vrf=None) -> bool:
+        """Return whether a prefix contains or equals *network*.
+
+        With a *vrf* (VRF or PK), only prefixes of that VRF count. Without
+        one, prefixes of any VRF count, as the unfiltered
+        ``prefix__net_contains_or_equals`` query did.
+        """
+        network = ipaddress.ip_network(network, strict=False)
+        if vrf is not None:
+            return self._contains(network, getattr(vrf, "pk", vrf))
+        return any(self._contains(network, vrf_id) for version, vrf_id in self._levels if version == network.version)
+
+
+_FAMILIES = {4: (socket.AF_INET, 4), 6: (socket.AF_INET6, 16)}
+
+
+def address_to_int(address) -> tuple[int, int]:
+    """Return ``(version, integer value)`` of an IP address given as a string or ``ipaddress`` object.
+
+    Strings are parsed with ``inet_pton``, ignoring any IPv6 zone index,
+    instead of building an ``ipaddress`` object. Raises ValueError if
+    *address* is malformed.
+    """
+    if isinstance(address, ipaddress.IPv4Address | ipaddress.IPv6Address):
+        return address.version, int(address)
+    text = str(address).partition("%")[0]
+    version = 6 if ":" in text else 4
+    try:
+        return version, int.from_bytes(socket.inet_pton(_FAMILIES[version][0], text))
+    except OSError:
+        raise ValueError(f"{address!r} is not a valid IP address") from None
+
+
+def addresses_to_ints(addresses) -> tuple[dict[Any, tuple[int, int]], list]:
+    """Convert each distinct address of *addresses* once with :func:`address_to_int`.
+
+    Returns the ``(version, integer value)`` pairs keyed by address, and
+    the malformed addresses, which are left out.
+    """
+    converted = {}
+    malformed = []
+    for address in dict.fromkeys(addresses):
+        try:
+            converted[address] = address_to_int(address)
+        except ValueError:
+            malformed.append(address)
+    return converted, malformed
+
+
+def int_to_address(version: int, value: int) -> str:
+    """Return the text form of the IP address *value*, the inverse of :func:`address_to_int`."""
+    family, size = _FAMILIES[version]
+    return socket.inet_ntop(family, value.to_bytes(size))
+
+
+class SubnetMatcher:
+    """Find which of an interface's subnets each of a batch of addresses belongs to.
+
+    The subnets are kept as integers, one ``{network address: value}`` dict
+    per IP version and prefix length, longest first. Matching an address
+    masks it once per distinct length, so an interface with many secondary
+    addresses costs no more than one with a single subnet of each length,
+    and no ``ipaddress`` network is built per address.
+    """
+
+    def __init__(self, subnets):
+        """Index *subnets*, an iterable of ``(network, value)`` pairs; the first value wins for duplicate networks."""
+        levels: dict[tuple[int, int], dict[int, Any]] = {}
+        for network, value in subnets:
+            network = ipaddress.ip_network(network, strict=False)
+            levels.setdefault((network.version, network.prefixlen), {}).setdefault(int(network.network_address), value)
+        # version -> [(mask, {network address: value})], longest prefix first
+        self._levels: dict[int, list[tuple[int, dict]]] = {}
+        for (version, length), networks in sorted(levels.items(), key=lambda item: -item[0][1]):
+            bits = 32 if version == 4 else 128
+            mask = ((1 << length) - 1) << (bits - length)
+            self._levels.setdefault(version, []).append((mask, networks))
+
+    def _match(self, version: int, value: int):
+        for mask, networks in self._levels.get(version, ()):
+            if (found := networks.get(value & mask)) is not None:
+                return found
+        return None
+
+    def match(self, address):
+        """Return the value of the longest subnet containing *address*, or None."""
+        return self._match(*address_to_int(address))
+
+    def match_all(self, values) -> list:
+        """Return :meth:`match` of each ``(version, integer value)`` pair of *values*, in order.
+
+        The pairs are those :func:`address_to_int` returns, so a batch can be
+        converted once with :func:`addresses_to_ints` and matched as is.
+        """
+        return [self._match(version, value) for version, value in values]
@@ -4,6 +4,7 @@ from django.db import DatabaseError
 from netbox.jobs import JobRunner
 from netbox.plugins.utils import get_plugin_config
 
+from netbox_facts import metrics
 from netbox_facts.choices import CollectorStatusChoices
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,7 @@ class CollectionJobRunner(JobRunner):
         from netbox_facts.models import CollectionPlan
         from netbox_facts.models.facts_report import FactsReport
 
+        metrics.observe_queue_wait(self.job)
         plan = CollectionPlan.objects.get(pk=self.job.object_id)
         try:
             plan.run(request=request)
@@ -61,3 +63,67 @@ class CollectionJobRunner(JobRunner):
                     plan.pk,
                     exc_info=True,
                 )
+
+
+class CollectionShardJobRunner(JobRunner):
+    """JobRunner for one device shard of a sharded collection run.
+
+    Shard jobs are enqueued by ``CollectionPlan.run`` when the plan has a
+    ``shard_size`` set. They are not attached to the plan object so they do
+    not show up as separate runs; their log is merged by the parent job.
+    """
+
+    class Meta:
+        name = "Facts Collection Shard"
+
+    @classmethod
+    def enqueue(cls, *args, **kwargs):
+        """Enqueue a shard job with the default job timeout."""
+        if "job_timeout" not in kwargs:
+            kwargs["job_timeout"] = get_plugin_config("netbox_facts", "job_timeout", 1800)
+        return super().enqueue(*args, **kwargs)
+
+    def run(self, plan_id, report_id, device_ids, request=None, *args, **kwargs):
+        """Collect from the devices in this shard into the parent's report."""
+        from netbox_facts.models import CollectionPlan
+        from netbox_facts.models.facts_report import FactsReport
+
+        metrics.observe_queue_wait(self.job)
+        plan = CollectionPlan.objects.get(pk=plan_id)
+        report = FactsReport.objects.get(pk=report_id)
+        timings = {}
+        try:
+            plan.run_shard(report, device_ids, request=request, timings=timings)
+        finally:
+            self.job.data = {
+                "log": list(plan.log),
+                "timings": timings,
+            }
+
+
+class CollectionFinalizeJobRunner(JobRunner):
+    """JobRunner completing a sharded collection run.
+
+    Enqueued by ``CollectionPlan.run`` with an RQ dependency on every shard
+    job, so it starts once the last shard has finished or failed, without a
+    worker waiting for the shards. It is attached to the plan and holds the
+    merged log of the run.
+    """
+
+    class Meta:
+        name = "Facts Collection Finalize"
+
+    def run(self, report_id, shard_job_ids, *args, **kwargs):
+        """Merge the shards into the report and set the plan's final status."""
+        from netbox_facts.models import CollectionPlan
+        from netbox_facts.models.facts_report import FactsReport
+
+        # Not observed as queue wait: the job is deferred while the shards run
+        plan = CollectionPlan.objects.get(pk=self.job.object_id)
+        report = FactsReport.objects.get(pk=report_id)
+        try:
+            plan.finish_sharded_run(report, shard_job_ids)
+        finally:
+            self.job.data = {
+                "log": list(plan.log),
+            }
@@ -0,0 +1,28 @@
+"""Management command to clear device reachability backoff records."""
+
+from django.core.management.base import BaseCommand
+
+from netbox_facts.models import DeviceReachability
+
+
+class Command(BaseCommand):
+    help = "Clear connection failure backoff so devices are dialled again on the next run."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--device",
+            action="append",
+            default=[],
+            help="Only clear records of the device with this name (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        records = DeviceReachability.objects.all()
+        if options["device"]:
+            records = records.filter(device__name__in=options["device"])
+
+        deleted, _ = records.delete()
+        if deleted:
+            self.stdout.write(self.style.SUCCESS(f"Cleared {deleted} reachability record(s)."))
+        else:
+            self.stdout.write("No reachability records found.")
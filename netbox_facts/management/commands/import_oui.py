@@ -0,0 +1,94 @@
+"""Management command to load the IEEE OUI registry into MACVendor."""
+
+from dcim.models import Manufacturer
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Exists, Func, OuterRef, Subquery
+from netaddr.eui import ieee
+
+from netbox_facts.fields import MACPrefixField
+from netbox_facts.helpers.oui import oui_index, parse_oui_registry, prefix_eui
+from netbox_facts.models import MACAddress, MACVendor
+
+VENDOR_NAME_LENGTH = MACVendor._meta.get_field("vendor_name").max_length
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or update MAC vendor prefixes from an IEEE OUI registry file, then point every "
+        "MAC address at the vendor of its prefix."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            help="IEEE MA-L registry in oui.txt or oui.csv format (default: the registry bundled with netaddr).",
+        )
+        parser.add_argument(
+            "--link-manufacturers",
+            action="store_true",
+            help="Link vendors without a manufacturer to the Manufacturer of the same name.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Vendor rows written per statement (default: 5000).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["file"] or ieee.OUI_REGISTRY_PATH
+        try:
+            with open(path, encoding="utf-8", errors="replace") as registry:
+                names = dict(parse_oui_registry(registry))
+        except OSError as exc:
+            raise CommandError(f"Could not read {path}: {exc}") from exc
+        if not names:
+            raise CommandError(f"No OUI assignments found in {path}.")
+
+        with transaction.atomic():
+            vendors = self._upsert_vendors(names, options["batch_size"])
+            linked = self._link_manufacturers(names) if options["link_manufacturers"] else 0
+            repointed = self._repoint_mac_addresses()
+        oui_index.invalidate()
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {vendors} MAC vendor prefix(es) from {path}."))
+        if options["link_manufacturers"]:
+            self.stdout.write(f"Linked {linked} vendor prefix(es) to a manufacturer.")
+        self.stdout.write(f"Updated the vendor of {repointed} MAC address(es).")
+
+    def _upsert_vendors(self, names, batch_size):
+        """Insert or rename the vendor of every prefix in *names*, bypassing MACVendor signals."""
+        vendors = [
+            MACVendor(mac_prefix=prefix_eui(prefix), vendor_name=name[:VENDOR_NAME_LENGTH])
+            for prefix, name in names.items()
+        ]
+        MACVendor.objects.bulk_create(
+            vendors,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["mac_prefix"],
+            update_fields=["vendor_name", "last_updated"],
+        )
+        return len(vendors)
+
+    def _link_manufacturers(self, names):
+        """Set the manufacturer of imported vendors that have none, one UPDATE per matching manufacturer."""
+        vendor_names = {name[:VENDOR_NAME_LENGTH] for name in names.values()}
+        linked = 0
+        for manufacturer in Manufacturer.objects.filter(name__in=vendor_names):
+            linked += MACVendor.objects.filter(manufacturer=None, vendor_name=manufacturer.name).update(
+                manufacturer=manufacturer
+            )
+        return linked
+
+    def _repoint_mac_addresses(self):
+        """Point each MAC address at the vendor of its prefix, in one UPDATE."""
+        prefix_vendor = MACVendor.objects.filter(
+            mac_prefix=Func(OuterRef("mac_address"), function="trunc", output_field=MACPrefixField())
+        ).values("pk")[:1]
+        return (
+            MACAddress.objects.filter(Exists(prefix_vendor))
+            .exclude(vendor=Subquery(prefix_vendor))
+            .update(vendor=Subquery(prefix_vendor))
+        )
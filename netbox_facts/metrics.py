@@ -0,0 +1,96 @@
+"""Prometheus metrics for collection and apply throughput.
+
+Metrics are recorded by the process doing the work, usually an RQ worker,
+and served from the web process by the ``metrics/`` API endpoint. As with
+NetBox's own ``/metrics`` behind several gunicorn workers, set
+``PROMETHEUS_MULTIPROC_DIR`` to a directory shared by NetBox and its RQ
+workers so the endpoint aggregates every process. Without it, the endpoint
+only reports what its own process recorded.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+__all__ = (
+    "APPLY_DURATION",
+    "CONNECTION_FAILURES",
+    "DEVICES_COLLECTED",
+    "ENTRIES_APPLIED",
+    "JOB_QUEUE_WAIT",
+    "REGISTRY",
+    "REPORT_ENTRIES",
+    "RPC_DURATION",
+    "observe_queue_wait",
+    "render",
+)
+
+REGISTRY = CollectorRegistry()
+
+DEVICES_COLLECTED = Counter(
+    "netbox_facts_devices_collected",
+    "Devices a collector ran against, by plan and collector type.",
+    ["plan", "collector_type"],
+    registry=REGISTRY,
+)
+CONNECTION_FAILURES = Counter(
+    "netbox_facts_connection_failures",
+    "Failed device connection attempts, by plan and connection IP kind (primary or oob).",
+    ["plan", "target"],
+    registry=REGISTRY,
+)
+RPC_DURATION = Histogram(
+    "netbox_facts_rpc_duration_seconds",
+    "Latency of device calls: NAPALM getters, or NETCONF RPCs on the asyncio engine.",
+    ["call"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+    registry=REGISTRY,
+)
+REPORT_ENTRIES = Counter(
+    "netbox_facts_report_entries",
+    "FactsReportEntry rows written by collectors, by collector type and action.",
+    ["collector_type", "action"],
+    registry=REGISTRY,
+)
+ENTRIES_APPLIED = Counter(
+    "netbox_facts_entries_applied",
+    "Report entries processed by apply_entries(), by collector type and resulting status.",
+    ["collector_type", "status"],
+    registry=REGISTRY,
+)
+APPLY_DURATION = Histogram(
+    "netbox_facts_apply_duration_seconds",
+    "Wall time of apply_entries() calls.",
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300),
+    registry=REGISTRY,
+)
+JOB_QUEUE_WAIT = Histogram(
+    "netbox_facts_job_queue_wait_seconds",
+    "Time collection jobs spent queued between enqueue and start.",
+    ["job"],
+    buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600),
+    registry=REGISTRY,
+)
+
+
+def observe_queue_wait(job) -> None:
+    """Record how long *job* waited in its queue before starting."""
+    if job.created and job.started:
+        JOB_QUEUE_WAIT.labels(job=job.name).observe(max((job.started - job.created).total_seconds(), 0))
+
+
+def render() -> tuple[bytes, str]:
+    """Return the metrics in the Prometheus text format, with their content type."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,26 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_facts", "0026_remove_factsreport_comments_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collectionplan",
+            name="max_workers",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                null=True,
+                validators=[django.core.validators.MinValueValidator(1)],
+                verbose_name="Max workers",
+                help_text=(
+                    "Number of devices collected concurrently. "
+                    "Leave blank to use the plugin-wide <code>max_workers</code> setting."
+                ),
+            ),
+        ),
+    ]
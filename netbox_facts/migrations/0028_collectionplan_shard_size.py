@@ -0,0 +1,26 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_facts", "0027_collectionplan_max_workers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collectionplan",
+            name="shard_size",
+            field=models.PositiveIntegerField(
+                blank=True,
+                null=True,
+                validators=[django.core.validators.MinValueValidator(1)],
+                verbose_name="Shard size",
+                help_text=(
+                    "Split runs covering more devices than this into child jobs of this many devices each, "
+                    "spread across all RQ workers on the plan's queue. Leave blank to run in a single job."
+                ),
+            ),
+        ),
+    ]
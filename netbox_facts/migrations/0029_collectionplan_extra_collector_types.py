@@ -0,0 +1,27 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_facts", "0028_collectionplan_shard_size"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="collectionplan",
+            name="extra_collector_types",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=50),
+                blank=True,
+                default=list,
+                size=None,
+                verbose_name="Additional collector types",
+                help_text=(
+                    "Collector types run after the primary one, in order, over the same device session. "
+                    "All results go into one report."
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dcim", "0001_squashed"),
+        ("netbox_facts", "0029_collectionplan_extra_collector_types"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeviceReachability",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(auto_created=True, primary_key=True, serialize=False),
+                ),
+                ("ip_address", models.GenericIPAddressField(verbose_name="IP address")),
+                ("failure_count", models.PositiveIntegerField(default=0, verbose_name="Consecutive failures")),
+                ("last_failure", models.DateTimeField(blank=True, null=True, verbose_name="Last failure")),
+                ("last_error", models.CharField(blank=True, max_length=500, verbose_name="Last error")),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        blank=True,
+                        null=True,
+                        help_text="Runs before this time skip the IP unless a quick TCP probe succeeds",
+                        verbose_name="Next attempt",
+                    ),
+                ),
+                (
+                    "device",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.device",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Device Reachability",
+                "verbose_name_plural": "Device Reachability",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("device", "ip_address"),
+                        name="netbox_facts_devicereachability_unique_device_ip",
+                    )
+                ],
+            },
+        ),
+    ]
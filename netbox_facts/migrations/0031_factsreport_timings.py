@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_facts", "0030_devicereachability"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="factsreport",
+            name="timings",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Seconds spent per phase: {phases, devices: {id: {name, total, connect, ..., calls}}}",
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@ from .mac import (
     MACAddressIPAddressRelation,
     MACVendor,
 )
+from .reachability import DeviceReachability
 
 __all__ = [
     "MACAddress",
@@ -15,4 +16,5 @@ __all__ = [
     "MACAddressIPAddressRelation",
     "FactsReport",
     "FactsReportEntry",
+    "DeviceReachability",
 ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from itertools import batched
 from typing import Any
 
 from core.choices import JobStatusChoices
@@ -14,6 +15,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
@@ -28,13 +30,14 @@ from netbox.plugins.utils import get_plugin_config
 from utilities.querysets import RestrictedQuerySet
 from utilities.request import copy_safe_request
 
-from netbox_facts.exceptions import OperationNotSupported
+from netbox_facts.exceptions import CollectionFailed, OperationNotSupported
 
 from ..choices import (
     CollectionTypeChoices,
     CollectorPriorityChoices,
     CollectorStatusChoices,
     ConnectionTargetChoices,
+    ReportStatusChoices,
 )
 from ..helpers import NapalmCollector
 
@@ -76,6 +79,16 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
     tags = models.ManyToManyField(to="extras.Tag", related_name="+", blank=True)
 
     collector_type = models.CharField(_("Collector Type"), max_length=50, choices=CollectionTypeChoices)
+    extra_collector_types = ArrayField(
+        models.CharField(max_length=50, choices=CollectionTypeChoices),
+        blank=True,
+        default=list,
+        verbose_name=_("Additional collector types"),
+        help_text=_(
+            "Collector types run after the primary one, in order, over the same device session. "
+            "All results go into one report."
+        ),
+    )
 
     napalm_driver = models.CharField(
         max_length=50,
@@ -117,7 +130,31 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
         default=ConnectionTargetChoices.TARGET_PRIMARY,
         help_text=_(
             "Which IP address to use when connecting to devices. "
-            '"Both" options try the first, then fall back to the second on connection failure.'
+            '"Then" options try the first, then fall back to the second on connection failure. '
+            '"Racing" options also start the second attempt if the first has not connected after a short delay, '
+            "and keep whichever connects first."
+        ),
+    )
+
+    max_workers = models.PositiveSmallIntegerField(
+        verbose_name=_("Max workers"),
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1)],
+        help_text=_(
+            "Number of devices collected concurrently. "
+            "Leave blank to use the plugin-wide <code>max_workers</code> setting."
+        ),
+    )
+
+    shard_size = models.PositiveIntegerField(
+        verbose_name=_("Shard size"),
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1)],
+        help_text=_(
+            "Split runs covering more devices than this into child jobs of this many devices each, "
+            "spread across all RQ workers on the plan's queue. Leave blank to run in a single job."
         ),
     )
 
@@ -152,11 +189,14 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
         "tenant_groups",
         "tenants",
         "tags",
+        "extra_collector_types",
         "napalm_driver",
         "napalm_args",
         "interval",
         "detect_only",
         "connection_target",
+        "max_workers",
+        "shard_size",
     )
 
     class Meta:
@@ -209,20 +249,25 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
                 CollectionPlan.objects.filter(pk=self.pk).update(status=self.status)
 
     def get_current_job(self):
-        """Return the current job for the collectionplan."""
-        if self.pk and self.last_run:
-            object_type = ContentType.objects.get_for_model(  # type: ignore
-                self, for_concrete_model=False
-            )
-            try:
-                self.current_job = (
-                    Job.objects.filter(object_id=self.pk, object_type=object_type)
-                    .filter(started__gte=self.last_run)
-                    .exclude(status__in=JobStatusChoices.TERMINAL_STATE_CHOICES)
-                    .last()
-                )
-            except Job.DoesNotExist:  # pylint: disable=no-member
-                pass
+        """Return the current job for the collectionplan.
+
+        The finalizer job of a sharded run counts as current while it waits
+        for the shards, so the plan is not taken for stalled.
+        """
+        from netbox_facts.jobs import CollectionFinalizeJobRunner
+
+        if not self.pk:
+            return self.current_job
+        object_type = ContentType.objects.get_for_model(  # type: ignore
+            self, for_concrete_model=False
+        )
+        jobs = Job.objects.filter(object_id=self.pk, object_type=object_type).exclude(
+            status__in=JobStatusChoices.TERMINAL_STATE_CHOICES
+        )
+        if self.last_run:
+            self.current_job = jobs.filter(started__gte=self.last_run).last()
+        if self.current_job is None:
+            self.current_job = jobs.filter(name=CollectionFinalizeJobRunner.name).last()
         return self.current_job
 
     def get_absolute_url(self):
@@ -233,6 +278,15 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
         """Return the color of the collector type."""
         return CollectionTypeChoices.colors.get(self.collector_type)  # type: ignore # pylint: disable=no-member
 
+    def get_collector_types(self) -> list[str]:
+        """Return the collector types to run on each device, primary first, without duplicates."""
+        return list(dict.fromkeys([self.collector_type, *(self.extra_collector_types or [])]))
+
+    def get_collector_types_display(self) -> str:
+        """Return the display labels of all collector types, in run order."""
+        labels = dict(self._meta.get_field("collector_type").flatchoices)
+        return ", ".join(str(labels.get(value, value)) for value in self.get_collector_types())
+
     def get_status_color(self):
         """Return the color of the collector status."""
         return CollectorStatusChoices.colors.get(self.status)  # type: ignore # pylint: disable=no-member
@@ -277,6 +331,19 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
         napalm_args.update(self.napalm_args if self.napalm_args else {})
         return napalm_args
 
+    def get_max_workers(self) -> int:
+        """Return the number of devices to collect from concurrently."""
+        return max(self.max_workers or get_plugin_config("netbox_facts", "max_workers", 1) or 1, 1)
+
+    def get_device_shards(self) -> list[tuple[int, ...]] | None:
+        """Return device PK batches for a sharded run, or None if the run fits in one job."""
+        if not self.shard_size:
+            return None
+        device_ids = list(self.get_devices_queryset().order_by("pk").values_list("pk", flat=True))
+        if len(device_ids) <= self.shard_size:
+            return None
+        return list(batched(device_ids, self.shard_size))
+
     def get_napalm_driver(self) -> type[NetworkDriver]:
         """Return a NAPALM driver instance."""
         try:
@@ -328,6 +395,12 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
 
         # Create a new NapalmCollector instance
         try:
+            shards = self.get_device_shards()
+            if shards:
+                # The finalizer job completes the run once every shard is done
+                self._run_sharded(shards, request=request)
+                return
+
             runner = NapalmCollector(self)
 
             if request:
@@ -346,6 +419,100 @@ class CollectionPlan(NetBoxModel, EventRulesMixin, JobsMixin):
 
     run.alters_data = True
 
+    def _run_sharded(self, shards, request=None):
+        """Fan the run out to one child job per device shard.
+
+        Child jobs write their entries into a single FactsReport owned by this
+        run. A finalizer job, enqueued with an RQ dependency on every child,
+        merges their results once the last one has finished or failed (see
+        :meth:`finish_sharded_run`). No worker waits for the children in the
+        meantime; the plan stays WORKING until the finalizer is done.
+        """
+        from rq.job import Dependency
+
+        from netbox_facts.jobs import CollectionFinalizeJobRunner, CollectionShardJobRunner
+        from netbox_facts.models.facts_report import FactsReport
+
+        report = FactsReport.objects.create(
+            collection_plan=self,
+            status=ReportStatusChoices.STATUS_PENDING,
+        )
+        user = request.user if request is not None else self.run_as
+        child_jobs = [
+            CollectionShardJobRunner.enqueue(
+                user=user,
+                queue_name=self.priority,
+                plan_id=self.pk,
+                report_id=report.pk,
+                device_ids=list(device_ids),
+                request=request,
+            )
+            for device_ids in shards
+        ]
+        CollectionFinalizeJobRunner.enqueue(
+            instance=self,
+            user=user,
+            queue_name=self.priority,
+            report_id=report.pk,
+            shard_job_ids=[job.pk for job in child_jobs],
+            depends_on=Dependency(jobs=[str(job.job_id) for job in child_jobs], allow_failure=True),
+        )
+        self.log_info(f"Dispatched {len(shards)} device shards of up to {self.shard_size} devices each.")
+
+    def finish_sharded_run(self, report, shard_job_ids):
+        """Merge the shard jobs *shard_job_ids* into *report* and complete the run.
+
+        Shard logs and device timings are folded into this plan's log and the
+        report. If any shard did not complete, the report and the run are
+        marked failed and CollectionFailed is raised.
+        """
+        failed = []
+        timings = {}
+        jobs = list(Job.objects.filter(pk__in=shard_job_ids).order_by("pk"))
+        for job in jobs:
+            self.log.extend((job.data or {}).get("log", []))
+            timings.update((job.data or {}).get("timings", {}))
+            if job.status != JobStatusChoices.STATUS_COMPLETED:
+                failed.append(f"job #{job.pk} ({job.get_status_display()})")
+        failed.extend(f"job #{pk} (deleted)" for pk in sorted(set(shard_job_ids) - {job.pk for job in jobs}))
+
+        if failed:
+            message = f"{len(failed)} of {len(shard_job_ids)} device shards did not complete: " + ", ".join(failed)
+            self.log_failure(message)
+            report.finalize(ReportStatusChoices.STATUS_FAILED, error_message=message, timings=timings)
+            CollectionPlan.objects.filter(pk=self.pk).update(status=CollectorStatusChoices.FAILED)
+            raise CollectionFailed(message)
+
+        report.finalize(
+            ReportStatusChoices.STATUS_PENDING if self.detect_only else ReportStatusChoices.STATUS_APPLIED,
+            timings=timings,
+        )
+        self.status = CollectorStatusChoices.COMPLETED
+        self.last_run = timezone.now()
+        CollectionPlan.objects.filter(pk=self.pk).update(status=self.status, last_run=self.last_run)
+
+    finish_sharded_run.alters_data = True
+
+    def run_shard(self, report, device_ids, request=None, timings=None):
+        """Collect from one device shard of a sharded run into the parent's report.
+
+        *timings*, if given, is updated with the shard's per-device timings,
+        even when collection fails part way.
+        """
+        runner = NapalmCollector(self, device_ids=device_ids, report=report)
+
+        try:
+            if request:
+                with event_tracking(request):
+                    runner.execute()
+            else:
+                runner.execute()
+        finally:
+            if timings is not None:
+                timings.update(runner.device_timings)
+
+    run_shard.alters_data = True
+
     def _log(self, level, message):
         """Append a timestamped log entry."""
         self.log.append(
@@ -5,8 +5,10 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from netbox.models import BaseModel
+from netbox.plugins.utils import get_plugin_config
 
 from ..choices import (
     CollectionTypeChoices,
@@ -54,6 +56,11 @@ class FactsReport(BaseModel):
         default="",
         help_text=_("Error details when the collection failed."),
     )
+    timings = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("Seconds spent per phase: {phases, devices: {id: {name, total, connect, ..., calls}}}"),
+    )
     created = models.DateTimeField(auto_now_add=True, blank=True, null=True)
     last_updated = models.DateTimeField(auto_now=True, blank=True, null=True)
 
@@ -89,6 +96,38 @@ class FactsReport(BaseModel):
             self.summary[row["action"]] = row["count"]
         self.save(update_fields=["summary"])
 
+    def finalize(self, status, error_message=None, timings=None):
+        """Refresh the summary and close the report with the given status.
+
+        *timings* maps device IDs to the per-phase seconds recorded by the
+        collector; they are stored with a per-phase rollup across devices.
+        """
+        self.update_summary()
+        self.completed_at = timezone.now()
+        self.status = status
+        update_fields = ["completed_at", "status"]
+        if error_message is not None:
+            self.error_message = str(error_message)[:2000]
+            update_fields.append("error_message")
+        if timings is not None:
+            phases = {}
+            for device_timings in timings.values():
+                for phase, seconds in device_timings.items():
+                    if isinstance(seconds, int | float):
+                        phases[phase] = round(phases.get(phase, 0.0) + seconds, 3)
+            self.timings = {"phases": phases, "devices": timings}
+            update_fields.append("timings")
+        self.save(update_fields=update_fields)
+
+    def get_slowest_devices(self):
+        """Return ``(device_id, timings)`` of the slowest devices, slowest first.
+
+        The number of devices is set by the ``report_slowest_devices`` plugin setting.
+        """
+        count = get_plugin_config("netbox_facts", "report_slowest_devices", 10)
+        devices = (self.timings or {}).get("devices", {})
+        return sorted(devices.items(), key=lambda item: item[1].get("total", 0), reverse=True)[:count]
+
 
 class FactsReportEntry(models.Model):
     """A single detected fact within a FactsReport."""
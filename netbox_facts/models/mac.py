@@ -4,7 +4,7 @@ from dcim.fields import MACAddressField, mac_unix_expanded_uppercase
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
-from netaddr import EUI, NotRegisteredError
+from netaddr import EUI
 from netbox.models import NetBoxModel
 from taggit.managers import TaggableManager
 from utilities.querysets import RestrictedQuerySet
@@ -107,14 +107,11 @@ class MACAddress(NetBoxModel):
     @property
     def vendor_name_from_mac_address(self) -> str | None:
         """Return the vendor name from the MAC Address."""
-        try:
-            if not hasattr(self.mac_address, "oui"):
-                self.refresh_from_db()
-            return (
-                self.mac_address.oui.registration().org  # pylint: disable=no-member # type: ignore
-            )
-        except NotRegisteredError:
-            return None
+        from netbox_facts.helpers.oui import mac_prefix, oui_index
+
+        if not hasattr(self.mac_address, "oui"):
+            self.refresh_from_db()
+        return oui_index.registry_name(mac_prefix(self.mac_address))
 
     def save(self, *args, **kwargs):
         if isinstance(self.mac_address, str):
@@ -169,9 +166,16 @@ class MACVendorManager(models.Manager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
     def get_by_mac_address(self, mac):
-        """Return the MACVendor object matching the MAC Address first 6 bytes."""
-        clean_mac = EUI(int(mac) & ~0x0000FFFFFF, version=48, dialect=mac_unix_expanded_uppercase)
-        return self.get(mac_prefix=clean_mac)
+        """Return the MACVendor object matching the MAC Address first 6 bytes.
+
+        Lookups go through the :data:`~netbox_facts.helpers.oui.oui_index`.
+        """
+        from netbox_facts.helpers.oui import mac_prefix, oui_index
+
+        vendor = oui_index.vendor(mac_prefix(mac))
+        if vendor is None:
+            raise self.model.DoesNotExist(f"No MAC vendor for {mac}")
+        return vendor
 
 
 class MACVendor(NetBoxModel):
@@ -0,0 +1,83 @@
+"""Device reachability backoff records."""
+
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from netbox.plugins.utils import get_plugin_config
+
+__all__ = ["DeviceReachability"]
+
+
+class DeviceReachabilityManager(models.Manager):
+    """Manager for the DeviceReachability model."""
+
+    def backed_off(self, device, now=None) -> dict[str, "DeviceReachability"]:
+        """Return the records of *device* whose backoff has not expired, keyed by IP."""
+        now = now or timezone.now()
+        return {record.ip_address: record for record in self.filter(device=device, next_attempt__gt=now)}
+
+    def record_failure(self, device, ip_address, error, now=None) -> "DeviceReachability":
+        """Count a failed connection and push ``next_attempt`` out exponentially.
+
+        Backoff starts once ``reachability_failure_threshold`` consecutive
+        failures are recorded, at ``reachability_backoff_base`` seconds and
+        doubling on each further failure up to ``reachability_backoff_max``.
+        The record is locked while it is updated, so concurrent failures of
+        the same device and IP are all counted.
+        """
+        now = now or timezone.now()
+        threshold = get_plugin_config("netbox_facts", "reachability_failure_threshold", 3)
+        base = get_plugin_config("netbox_facts", "reachability_backoff_base", 900)
+        cap = get_plugin_config("netbox_facts", "reachability_backoff_max", 86400)
+
+        with transaction.atomic(using=self.db):
+            record, _ = self.select_for_update().get_or_create(device=device, ip_address=ip_address)
+            record.failure_count += 1
+            record.last_failure = now
+            record.last_error = str(error)[:500]
+            if base and record.failure_count >= threshold:
+                delay = min(base * 2 ** (record.failure_count - threshold), cap)
+                record.next_attempt = now + timedelta(seconds=delay)
+            record.save()
+        return record
+
+    def record_success(self, device, ip_address) -> None:
+        """Forget past failures of *device* via *ip_address*."""
+        self.filter(device=device, ip_address=ip_address).delete()
+
+
+class DeviceReachability(models.Model):
+    """Consecutive connection failures of a device via one connection IP."""
+
+    device = models.ForeignKey(
+        to="dcim.Device",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    ip_address = models.GenericIPAddressField(_("IP address"))
+    failure_count = models.PositiveIntegerField(_("Consecutive failures"), default=0)
+    last_failure = models.DateTimeField(_("Last failure"), null=True, blank=True)
+    last_error = models.CharField(_("Last error"), max_length=500, blank=True)
+    next_attempt = models.DateTimeField(
+        _("Next attempt"),
+        null=True,
+        blank=True,
+        help_text=_("Runs before this time skip the IP unless a quick TCP probe succeeds"),
+    )
+
+    objects = DeviceReachabilityManager()
+
+    class Meta:
+        verbose_name = _("Device Reachability")
+        verbose_name_plural = _("Device Reachability")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["device", "ip_address"],
+                name="netbox_facts_devicereachability_unique_device_ip",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.device} via {self.ip_address}"
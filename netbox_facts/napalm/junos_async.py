@@ -0,0 +1,333 @@
+"""Asyncio NETCONF transport for EnhancedJunOSDriver.
+
+A PyEZ ``Device`` holds a blocking SSH session, so the threaded collector
+spends one thread per device. This module fetches the RPC replies a set of
+driver getters need over an ``asyncssh`` NETCONF session instead, and stores
+them on a :class:`ReplayDevice`. Swapping that in as ``driver.device`` lets
+the regular PyEZ tables and getters parse the cached replies, so collectors
+reconcile exactly the same data as on the threaded path.
+
+``asyncssh`` is an optional dependency (``pip install netbox-facts[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from lxml import etree
+from napalm.base.exceptions import CommandErrorException, CommandTimeoutException, ConnectionException
+
+from netbox_facts import metrics
+
+try:
+    import asyncssh
+
+    HAS_ASYNCSSH = True
+except ImportError:
+    HAS_ASYNCSSH = False
+
+__all__ = (
+    "HAS_ASYNCSSH",
+    "AsyncNetconfSession",
+    "ReplayDevice",
+    "RPCMiss",
+)
+
+NETCONF_DELIMITER = "]]>]]>"
+
+# Advertise base:1.0 only so the device frames replies with the end-of-message
+# delimiter rather than chunked framing.
+NETCONF_HELLO = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+    "<capabilities><capability>urn:ietf:params:netconf:base:1.0</capability></capabilities>"
+    "</hello>"
+)
+
+# Keyword arguments PyEZ passes to RPC methods that are not RPC parameters.
+_IGNORED_RPC_KWARGS = frozenset({"normalize", "dev_timeout", "ignore_warning", "filter_xml"})
+
+_JUNOS_VERSION_RE = re.compile(r"\[(.+?)\]")
+
+
+class RPCMiss(Exception):
+    """Raised by a recording ReplayDevice for an RPC that has not been fetched yet."""
+
+    def __init__(self, key: tuple):
+        super().__init__(f"RPC {key[0]} has not been fetched")
+        self.key = key
+
+
+def rpc_key(name: str, kwargs: dict[str, Any]) -> tuple:
+    """Return a hashable key identifying an RPC call as PyEZ would issue it."""
+    params = tuple(
+        sorted((k.replace("_", "-"), v) for k, v in kwargs.items() if k not in _IGNORED_RPC_KWARGS and v is not None)
+    )
+    return name.replace("_", "-"), params
+
+
+def rpc_to_xml(key: tuple) -> str:
+    """Serialize an RPC key to the ``<rpc>`` body PyEZ would send."""
+    name, params = key
+    rpc = etree.Element(name)
+    for param, value in params:
+        if value is False:
+            continue
+        values = value if isinstance(value, list | tuple) else [value]
+        for item in values:
+            elem = etree.SubElement(rpc, param)
+            if item is not True:
+                elem.text = str(item)
+    return etree.tostring(rpc, encoding="unicode")
+
+
+def normalize_reply(root: etree._Element) -> etree._Element:
+    """Strip namespaces and whitespace from a reply, like PyEZ's ``normalize=True``."""
+    for elem in root.iter():
+        if not isinstance(elem.tag, str):
+            continue
+        elem.tag = etree.QName(elem).localname
+        if elem.text is not None:
+            elem.text = " ".join(elem.text.split()) or None
+        elem.tail = None
+    etree.cleanup_namespaces(root)
+    return root
+
+
+def parse_rpc_reply(message: str) -> etree._Element:
+    """Return the payload element of an ``<rpc-reply>``, raising on RPC errors."""
+    try:
+        root = etree.fromstring(message.strip().encode())
+    except etree.XMLSyntaxError as exc:
+        raise CommandErrorException(f"Malformed NETCONF reply: {exc}") from exc
+    normalize_reply(root)
+
+    for error in root.iter("rpc-error"):
+        if error.findtext("error-severity") == "error":
+            raise CommandErrorException(error.findtext("error-message") or "RPC error")
+
+    payload = [child for child in root if isinstance(child.tag, str) and child.tag != "rpc-error"]
+    if not payload:
+        return etree.Element("ok")
+    return payload[0]
+
+
+class _ReplayRPC:
+    """``device.rpc`` stand-in: every attribute is an RPC answered from the cache."""
+
+    def __init__(self, device: ReplayDevice):
+        self._device = device
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            return self._device.reply(rpc_key(name, kwargs))
+
+        return call
+
+
+class ReplayDevice:
+    """Stand-in for ``jnpr.junos.Device`` that answers RPCs from fetched replies.
+
+    While ``recording`` is true, unknown RPCs raise :class:`RPCMiss` so the
+    caller can fetch them and retry the getter. Once recording stops, unknown
+    RPCs raise ``ConnectionException`` since the session is gone.
+    """
+
+    _use_filter = False
+    uptime = None
+
+    def __init__(self, hostname: str):
+        self.hostname = hostname
+        self.replies: dict[tuple, etree._Element | Exception] = {}
+        self.recording = True
+        self.rpc = _ReplayRPC(self)
+
+    def reply(self, key: tuple) -> etree._Element:
+        """Return the cached reply for *key*."""
+        try:
+            reply = self.replies[key]
+        except KeyError:
+            if self.recording:
+                raise RPCMiss(key) from None
+            raise ConnectionException(f"RPC {key[0]} was not fetched by the asyncio engine") from None
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    @property
+    def facts(self) -> dict[str, str]:
+        """The subset of PyEZ facts used by ``JunOSDriver.get_facts()``."""
+        software = self.rpc.get_software_information()
+        chassis = self.rpc.get_chassis_inventory()
+        hostname = software.findtext(".//host-name") or ""
+        version = software.findtext(".//junos-version")
+        if not version:
+            match = _JUNOS_VERSION_RE.search(software.findtext(".//package-information/comment") or "")
+            version = match.group(1) if match else ""
+        return {
+            "hostname": hostname,
+            "fqdn": hostname,
+            "model": (software.findtext(".//product-model") or "").upper(),
+            "version": version,
+            "serialnumber": chassis.findtext(".//chassis/serial-number") or "",
+        }
+
+
+# Getter errors that end prefetching a getter; the reconcile pass raises them
+# again and reports them like the threaded path. Anything else is a bug.
+GETTER_ERRORS = (CommandErrorException, CommandTimeoutException, ConnectionException, NotImplementedError)
+
+
+def _run_getter(method: Callable[[], Any]) -> tuple[Any, bool]:
+    """Call a getter, draining generator results so every RPC they issue is recorded.
+
+    Returns the result and whether the getter returned an iterator.
+    """
+    result = method()
+    if isinstance(result, Iterator):
+        return list(result), True
+    return result, False
+
+
+def _replay_result(method: Callable[..., Any], result: Any, iterator: bool) -> Callable[..., Any]:
+    """Wrap getter *method* so argument-less calls return the prefetched *result*.
+
+    Calls with arguments fall through to the getter, which parses the cached
+    replies again.
+    """
+
+    @functools.wraps(method)
+    def getter(*args, **kwargs):
+        if args or kwargs:
+            return method(*args, **kwargs)
+        return iter(result) if iterator else result
+
+    return getter
+
+
+class AsyncNetconfSession:
+    """Minimal NETCONF 1.0 client over ``asyncssh`` for Junos devices."""
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 22,
+        timeout: float = 60,
+        key_file: str | None = None,
+        known_hosts: str | None = None,
+        verify_host_key: bool = True,
+    ):
+        if not HAS_ASYNCSSH:
+            raise ConnectionException("The asyncio engine requires the optional asyncssh package.")
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.timeout = timeout
+        self.key_file = key_file
+        self.known_hosts = known_hosts
+        self.verify_host_key = verify_host_key
+        self._conn = None
+        self._reader = None
+        self._writer = None
+        self._message_id = 0
+
+    async def __aenter__(self) -> AsyncNetconfSession:
+        try:
+            self._conn = await asyncio.wait_for(
+                asyncssh.connect(
+                    self.host,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password or None,
+                    client_keys=[self.key_file] if self.key_file else (),
+                    known_hosts=self._known_hosts_arg(),
+                ),
+                self.timeout,
+            )
+            self._writer, self._reader, _ = await self._conn.open_session(subsystem="netconf", encoding="utf-8")
+            self._writer.write(NETCONF_HELLO + NETCONF_DELIMITER)
+            await self._read_message()
+        except (OSError, TimeoutError, asyncssh.Error) as exc:
+            await self.close()
+            raise ConnectionException(f"Cannot connect to {self.host}: {exc}") from exc
+        return self
+
+    def _known_hosts_arg(self) -> str | tuple | None:
+        """Return the ``known_hosts`` argument for ``asyncssh.connect``.
+
+        An empty tuple makes asyncssh read the user's ``~/.ssh/known_hosts``;
+        ``None`` disables host key verification.
+        """
+        if not self.verify_host_key:
+            return None
+        return self.known_hosts or ()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the SSH connection, ignoring errors from an already dead session."""
+        if self._conn is not None:
+            self._conn.close()
+            try:
+                await self._conn.wait_closed()
+            except (OSError, asyncssh.Error):
+                pass
+            self._conn = None
+
+    async def _read_message(self) -> str:
+        try:
+            data = await asyncio.wait_for(self._reader.readuntil(NETCONF_DELIMITER), self.timeout)
+        except TimeoutError as exc:
+            raise CommandTimeoutException(f"Timed out waiting for a NETCONF reply from {self.host}") from exc
+        except (asyncssh.Error, asyncio.IncompleteReadError) as exc:
+            raise ConnectionException(f"NETCONF session to {self.host} closed: {exc}") from exc
+        return data[: -len(NETCONF_DELIMITER)]
+
+    async def rpc(self, key: tuple) -> etree._Element:
+        """Send one RPC and return its normalized payload element."""
+        self._message_id += 1
+        started = time.monotonic()
+        self._writer.write(f'<rpc message-id="{self._message_id}">{rpc_to_xml(key)}</rpc>{NETCONF_DELIMITER}')
+        message = await self._read_message()
+        metrics.RPC_DURATION.labels(call=key[0]).observe(time.monotonic() - started)
+        return parse_rpc_reply(message)
+
+    async def prefetch(self, driver, getters: Iterable[str]) -> None:
+        """Fetch every RPC the named *driver* getters issue into ``driver.device``.
+
+        Each getter is run in a worker thread against the recording
+        ReplayDevice until it stops missing, so parsing stays off the event
+        loop. Its result then replaces the getter on *driver* for the
+        reconcile pass. Getters failing with :data:`GETTER_ERRORS` are left
+        unwrapped, so reconciling reports the error through the collector's
+        usual handling.
+        """
+        device: ReplayDevice = driver.device
+        for getter in getters:
+            method = getattr(driver, getter)
+            while True:
+                try:
+                    result, iterator = await asyncio.to_thread(_run_getter, method)
+                except RPCMiss as miss:
+                    try:
+                        device.replies[miss.key] = await self.rpc(miss.key)
+                    except CommandErrorException as exc:
+                        device.replies[miss.key] = exc
+                    continue
+                except GETTER_ERRORS:
+                    break
+                setattr(driver, getter, _replay_result(method, result, iterator))
+                break
+        device.recording = False
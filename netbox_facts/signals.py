@@ -1,18 +1,19 @@
 from core.choices import JobStatusChoices
-from dcim.fields import mac_unix_expanded_uppercase
 from dcim.models.devices import Manufacturer
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from netaddr import EUI
 
+from .helpers.oui import mac_prefix, oui_index, prefix_range
 from .models import CollectionPlan, MACAddress, MACVendor
 
 
 @receiver(post_save, sender=MACAddress)
-def handle_mac_change(instance: MACAddress, **kwargs):  # pylint: disable=unused-argument
+def handle_mac_change(instance: MACAddress, batch=False, **kwargs):  # pylint: disable=unused-argument
     """
     Update vendor foreign key when MACAddress is created or updated.
     """
+    if batch:
+        return
     if instance.vendor is None:
         try:
             vendor = MACVendor.objects.get_by_mac_address(instance.mac_address)
@@ -43,21 +44,25 @@ def handle_mac_change(instance: MACAddress, **kwargs):  # pylint: disable=unused
 
 
 @receiver(post_save, sender=MACVendor)
-def handle_mac_vendor_change(instance: MACVendor, **kwargs):  # pylint: disable=unused-argument
+def handle_mac_vendor_change(instance: MACVendor, batch=False, **kwargs):  # pylint: disable=unused-argument
     """
     Update vendor foreign key when a MACVendor is created or updated.
     """
-    # Normalize prefix to colon-separated lowercase format matching PostgreSQL
-    # macaddr::text output (e.g. "dd:ee:ff"). The instance attribute may have
-    # any dialect depending on how it was created, so we normalize explicitly.
-    prefix = EUI(
-        int(instance.mac_prefix) & ~0x0000FFFFFF,
-        version=48,
-        dialect=mac_unix_expanded_uppercase,
-    )
-    prefix_str = str(prefix).lower()[:8]  # "dd:ee:ff"
-    mac_addresses = MACAddress.objects.filter(mac_address__startswith=prefix_str)
-    mac_addresses.update(vendor=instance)
+    if batch:
+        return
+    # A range on the macaddr column uses its index; a text prefix match would scan the table
+    mac_addresses = MACAddress.objects.filter(mac_address__range=prefix_range(mac_prefix(instance.mac_prefix)))
+    mac_addresses.exclude(vendor=instance).update(vendor=instance)
+
+
+@receiver((post_save, post_delete), sender=MACVendor)
+def invalidate_oui_index(batch=False, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the cached vendor prefixes when a MACVendor is created, updated or deleted.
+    """
+    if batch:
+        return
+    oui_index.invalidate()
 
 
 @receiver(post_save, sender=CollectionPlan)
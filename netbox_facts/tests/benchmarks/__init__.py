@@ -0,0 +1,4 @@
+"""Collector benchmarks against a fake NAPALM driver and a synthetic topology.
+
+Skipped unless ``NETBOX_FACTS_BENCHMARK`` is set; see ``make benchmark``.
+"""
@@ -0,0 +1,227 @@
+"""Deterministic NAPALM driver serving a synthetic topology."""
+
+from napalm.base import NetworkDriver
+
+from .topology import LOCAL_AS, SyntheticTopology, synthetic_mac
+
+__all__ = ("FakeNetworkDriver",)
+
+
+class FakeNetworkDriver(NetworkDriver):
+    """NAPALM driver whose getters return the tables of a :class:`SyntheticTopology`.
+
+    The topology is passed in ``optional_args["topology"]``. Every call
+    rebuilds its result from the topology, so repeated runs see identical
+    data and the cost of generating it is the same as parsing a reply.
+    """
+
+    def __init__(self, hostname, username="", password="", timeout=60, optional_args=None):
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.topology: SyntheticTopology = (optional_args or {})["topology"]
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def is_alive(self):
+        return {"is_alive": True}
+
+    def get_facts(self):
+        return {
+            "hostname": self.topology.name,
+            "fqdn": self.topology.name,
+            "vendor": "Bench",
+            "model": "Bench",
+            "serial_number": "BENCH0001",
+            "os_version": "1.0",
+            "uptime": 1.0,
+            "interface_list": [self.topology.interface_name(i) for i in range(self.topology.interfaces)],
+        }
+
+    def get_chassis_inventory(self):
+        """Yield one FPC per 16 entries, each holding up to 16 PICs, as EnhancedJunOSDriver does."""
+        for i in range(self.topology.entries):
+            fpc, pic = divmod(i, 16)
+            name = f"FPC {fpc}"
+            module = {
+                "name": name,
+                "component_name": name,
+                "parent_name": None,
+                "serial": f"BENCH{i:08d}",
+                "part_id": "BENCH-PIC",
+                "description": "Bench PIC",
+            }
+            if pic:
+                module.update(name=f"{name}/PIC {pic}", component_name=f"PIC {pic}", parent_name=name)
+            else:
+                module.update(part_id="BENCH-FPC", description="Bench FPC")
+            yield module
+
+    def cli(self, commands, encoding="text"):
+        outputs = {
+            "show evpn mac-table": self._evpn_mac_table,
+            "show ospf neighbor": self._ospf_neighbors,
+            "show l2circuit connections": self._l2circuit_connections,
+        }
+        return {command: outputs[command]() for command in commands}
+
+    def _evpn_mac_table(self):
+        topology = self.topology
+        lines = ["Routing instance : bench-evpn"]
+        for row, index, _ in topology.neighbors():
+            lines.append(f"   {synthetic_mac(row, prefix=0x0E)}   DR   {topology.interface_name(index)}.0")
+        return "\n".join(lines)
+
+    def _ospf_neighbors(self):
+        topology = self.topology
+        lines = ["Address          Interface              State     ID               Pri  Dead"]
+        for row, index, host in topology.neighbors():
+            address = topology.ipv4_network(index)[host + 2]
+            router_id = f"172.31.{(row >> 8) & 0xFF}.{row & 0xFF}"
+            lines.append(f"{address}  {topology.interface_name(index)}.0  Full  {router_id}  128  36")
+        return "\n".join(lines)
+
+    def _l2circuit_connections(self):
+        topology = self.topology
+        lines = ["Neighbor: 192.0.2.2"]
+        for index in range(topology.interfaces):
+            lines.append(f"    {topology.interface_name(index)}.0(vc {index + 1})  rmt   Up")
+        return "\n".join(lines)
+
+    def get_network_instances(self, name=""):
+        topology = self.topology
+        instances = {
+            "default": {
+                "name": "default",
+                "type": "DEFAULT_INSTANCE",
+                "state": {"route_distinguisher": ""},
+                "interfaces": {"interface": {}},
+            }
+        }
+        for index in range(topology.interfaces):
+            vrf_name = topology.vrf_name(index) or "default"
+            instance = instances.setdefault(
+                vrf_name,
+                {
+                    "name": vrf_name,
+                    "type": "L3VRF",
+                    "state": {"route_distinguisher": f"{LOCAL_AS}:{len(instances)}"},
+                    "interfaces": {"interface": {}},
+                },
+            )
+            instance["interfaces"]["interface"][topology.interface_name(index)] = {}
+        return instances
+
+    def get_interfaces_ip(self):
+        topology = self.topology
+        return {
+            topology.interface_name(index): {
+                "ipv4": {str(topology.ipv4_network(index)[1]): {"prefix_length": 16}},
+                "ipv6": {str(topology.ipv6_network(index)[1]): {"prefix_length": 64}},
+            }
+            for index in range(topology.interfaces)
+        }
+
+    def get_arp_table(self, vrf=""):
+        topology = self.topology
+        return [
+            {
+                "interface": topology.interface_name(index),
+                "mac": synthetic_mac(row),
+                "ip": str(topology.ipv4_network(index)[host + 2]),
+                "age": 60.0,
+            }
+            for row, index, host in topology.neighbors()
+        ]
+
+    def get_ipv6_neighbors_table(self):
+        topology = self.topology
+        return [
+            {
+                "interface": topology.interface_name(index),
+                "mac": synthetic_mac(row),
+                "ip": str(topology.ipv6_network(index)[host + 2]),
+                "age": 60.0,
+                "state": "reachable",
+            }
+            for row, index, host in topology.neighbors()
+        ]
+
+    def get_mac_address_table(self):
+        topology = self.topology
+        return [
+            {
+                "mac": synthetic_mac(row),
+                "interface": topology.interface_name(index),
+                "vlan": 100 + index,
+                "static": False,
+                "active": True,
+                "moves": 0,
+                "last_move": 0.0,
+            }
+            for row, index, _ in topology.neighbors()
+        ]
+
+    def get_interfaces(self):
+        topology = self.topology
+        return {
+            topology.access_port_name(i): {
+                "is_up": True,
+                "is_enabled": True,
+                "description": "",
+                "last_flapped": -1.0,
+                "speed": 1000.0,
+                "mtu": 1514,
+                "mac_address": synthetic_mac(i, prefix=0x06),
+            }
+            for i in range(topology.entries)
+        }
+
+    def get_lldp_neighbors_detail(self, interface=""):
+        topology = self.topology
+        neighbors = {}
+        for i in range(topology.entries):
+            neighbor, port = divmod(i, topology.ports_per_neighbor)
+            neighbors[topology.access_port_name(i)] = [
+                {
+                    "parent_interface": "",
+                    "remote_port": topology.interface_name(port),
+                    "remote_port_description": "",
+                    "remote_chassis_id": synthetic_mac(neighbor, prefix=0x0A),
+                    "remote_system_name": topology.neighbor_device_name(neighbor),
+                    "remote_system_description": "",
+                    "remote_system_capab": ["bridge", "router"],
+                    "remote_system_enable_capab": ["bridge", "router"],
+                }
+            ]
+        return neighbors
+
+    def get_bgp_neighbors_detail(self, neighbor_address=""):
+        topology = self.topology
+        peers = {}
+        for i in range(topology.entries):
+            vrf_name = topology.vrf_name(i) or "global"
+            remote_as = 64512 + i % 1000
+            remote_address = f"172.{16 + (i >> 16)}.{(i >> 8) & 0xFF}.{i & 0xFF}"
+            peers.setdefault(vrf_name, {}).setdefault(remote_as, []).append(
+                {
+                    "up": True,
+                    "local_as": LOCAL_AS,
+                    "remote_as": remote_as,
+                    "router_id": remote_address,
+                    "local_address": "192.0.2.1",
+                    "remote_address": remote_address,
+                    "connection_state": "Established",
+                    "previous_connection_state": "OpenConfirm",
+                    "active_prefix_count": 1,
+                    "received_prefix_count": 1,
+                    "accepted_prefix_count": 1,
+                    "advertised_prefix_count": 1,
+                }
+            )
+        return peers
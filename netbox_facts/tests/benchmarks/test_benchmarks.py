@@ -0,0 +1,232 @@
+"""Time and query-count collectors and apply_entries() at increasing scale.
+
+Enable with ``NETBOX_FACTS_BENCHMARK=1``. Optional settings:
+
+- ``NETBOX_FACTS_BENCHMARK_SCALES``: comma-separated entry counts
+  (default ``1000,10000,100000``).
+- ``NETBOX_FACTS_BENCHMARK_OUTPUT``: write the results to this JSON file.
+- ``NETBOX_FACTS_BENCHMARK_BASELINE``: fail any measurement issuing more
+  queries than the same measurement in this JSON file, as written by a
+  previous run.
+
+Every collector runs in three modes: detect only, followed by
+``apply_entries()``, then applying during collection with
+``bulk_reconciliation`` off and on. Applying runs are reported as
+``<collector>/apply`` and ``<collector>/apply+bulk``.
+"""
+
+import json
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+from dcim.choices import DeviceStatusChoices
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+
+from netbox_facts.choices import CollectionTypeChoices, EntryActionChoices, EntryStatusChoices
+from netbox_facts.helpers.applier import apply_entries
+from netbox_facts.helpers.collector import NapalmCollector
+from netbox_facts.helpers.entry_buffer import INGESTION_COPY, INGESTION_ORM, EntryBuffer
+from netbox_facts.models import CollectionPlan, FactsReport, FactsReportEntry
+
+from .fake_driver import FakeNetworkDriver
+from .topology import SyntheticTopology, synthetic_mac
+
+ENABLED = bool(os.environ.get("NETBOX_FACTS_BENCHMARK"))
+SCALES = [
+    int(scale) for scale in os.environ.get("NETBOX_FACTS_BENCHMARK_SCALES", "1000,10000,100000").split(",") if scale
+]
+RESULTS: list[dict] = []
+
+# (benchmark suffix, detect_only, bulk_reconciliation)
+MODES = (
+    ("", True, False),
+    ("/apply", False, False),
+    ("/apply+bulk", False, True),
+)
+
+
+def _load_baseline() -> dict[tuple, int]:
+    path = os.environ.get("NETBOX_FACTS_BENCHMARK_BASELINE")
+    if not path:
+        return {}
+    return {
+        (result["benchmark"], result["phase"], result["entries"]): result["queries"]
+        for result in json.loads(Path(path).read_text())
+    }
+
+
+BASELINE = _load_baseline()
+
+
+class QueryCounter:
+    """Database execute wrapper counting the queries it sees."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def tearDownModule():
+    if not RESULTS:
+        return
+    lines = [f"{'benchmark':<20} {'phase':<8} {'entries':>8} {'seconds':>10} {'queries':>9} {'report rows':>12}"]
+    for result in RESULTS:
+        lines.append(
+            f"{result['benchmark']:<20} {result['phase']:<8} {result['entries']:>8} "
+            f"{result['seconds']:>10.3f} {result['queries']:>9} {result['report_entries']:>12}"
+        )
+    sys.stderr.write("\n" + "\n".join(lines) + "\n")
+    if output := os.environ.get("NETBOX_FACTS_BENCHMARK_OUTPUT"):
+        Path(output).write_text(json.dumps(RESULTS, indent=2))
+
+
+@unittest.skipUnless(ENABLED, "Set NETBOX_FACTS_BENCHMARK=1 to run the benchmarks.")
+class CollectorBenchmark(TestCase):
+    """Run each table-driven collector, then apply its report, at every scale.
+
+    Each scale runs in its own savepoint, rolled back afterwards, so runs do
+    not see each other's objects.
+    """
+
+    def _measure(self, benchmark, phase, entries, report, func):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            func()
+            seconds = time.perf_counter() - started
+        RESULTS.append(
+            {
+                "benchmark": benchmark,
+                "phase": phase,
+                "entries": entries,
+                "seconds": round(seconds, 4),
+                "queries": counter.count,
+                "report_entries": report.entries.count(),
+            }
+        )
+
+        baseline = BASELINE.get((benchmark, phase, entries))
+        if baseline is not None:
+            self.assertLessEqual(
+                counter.count,
+                baseline,
+                f"{benchmark} {phase} at {entries} entries issued {counter.count} queries (baseline {baseline})",
+            )
+
+    def _run_scale(self, collector_type, entries, lldp, mode=MODES[0]):
+        suffix, detect_only, bulk = mode
+        benchmark = f"{collector_type}{suffix}"
+        topology = SyntheticTopology(entries=entries)
+        device = topology.populate(lldp=lldp)
+        plan = CollectionPlan.objects.create(
+            name=f"Bench {benchmark} {entries}",
+            collector_type=collector_type,
+            napalm_driver="junos",
+            device_status=[DeviceStatusChoices.STATUS_ACTIVE],
+            detect_only=detect_only,
+        )
+        report = FactsReport.objects.create(collection_plan=plan)
+        collector = NapalmCollector(plan, device_ids=[device.pk], report=report)
+        driver = FakeNetworkDriver(device.name, optional_args={"topology": topology})
+
+        def collect():
+            collector._current_device = device
+            collector._run_collector(collector_type, driver)
+
+        def apply():
+            pending = report.entries.filter(status=EntryStatusChoices.STATUS_PENDING)
+            apply_entries(report, list(pending.values_list("pk", flat=True)))
+
+        plugin_config = {**settings.PLUGINS_CONFIG["netbox_facts"], "bulk_reconciliation": bulk}
+        with override_settings(PLUGINS_CONFIG={**settings.PLUGINS_CONFIG, "netbox_facts": plugin_config}):
+            self._measure(benchmark, "collect", entries, report, collect)
+        if detect_only:
+            self._measure(benchmark, "apply", entries, report, apply)
+
+    def _run_ingestion(self, entries):
+        topology = SyntheticTopology(entries=entries)
+        device = topology.populate()
+        plan = CollectionPlan.objects.create(
+            name=f"Bench ingestion {entries}",
+            collector_type=CollectionTypeChoices.TYPE_ARP,
+            napalm_driver="junos",
+            device_status=[DeviceStatusChoices.STATUS_ACTIVE],
+        )
+        for ingestion in (INGESTION_ORM, INGESTION_COPY):
+            report = FactsReport.objects.create(collection_plan=plan)
+            buffer = EntryBuffer(batch_size=entries, ingestion=ingestion)
+            for row, index, host in topology.neighbors():
+                buffer.add(
+                    FactsReportEntry(
+                        report=report,
+                        action=EntryActionChoices.ACTION_NEW,
+                        collector_type=CollectionTypeChoices.TYPE_ARP,
+                        device=device,
+                        object_repr=f"MACAddress {synthetic_mac(row)}",
+                        detected_values={
+                            "mac": synthetic_mac(row),
+                            "ip": str(topology.ipv4_network(index)[host + 2]),
+                            "interface": topology.interface_name(index),
+                        },
+                    )
+                )
+            self._measure("ingestion", ingestion, entries, report, buffer.flush)
+
+    def _benchmark(self, collector_type, lldp=False, run=None):
+        modes = MODES if run is None else MODES[:1]
+        for mode in modes:
+            for entries in SCALES:
+                with self.subTest(entries=entries, mode=mode[0]), transaction.atomic():
+                    try:
+                        if run is None:
+                            self._run_scale(collector_type, entries, lldp, mode)
+                        else:
+                            run(entries)
+                    finally:
+                        transaction.set_rollback(True)
+
+    def test_arp(self):
+        self._benchmark(CollectionTypeChoices.TYPE_ARP)
+
+    def test_ndp(self):
+        self._benchmark(CollectionTypeChoices.TYPE_NDP)
+
+    def test_inventory(self):
+        self._benchmark(CollectionTypeChoices.TYPE_INVENTORY)
+
+    def test_interfaces(self):
+        self._benchmark(CollectionTypeChoices.TYPE_INTERFACES)
+
+    def test_lldp(self):
+        self._benchmark(CollectionTypeChoices.TYPE_LLDP, lldp=True)
+
+    def test_ethernet_switching(self):
+        self._benchmark(CollectionTypeChoices.TYPE_L2)
+
+    def test_l2_circuits(self):
+        self._benchmark(CollectionTypeChoices.TYPE_L2CIRCTUITS)
+
+    def test_evpn(self):
+        self._benchmark(CollectionTypeChoices.TYPE_EVPN)
+
+    def test_bgp(self):
+        self._benchmark(CollectionTypeChoices.TYPE_BGP)
+
+    def test_ospf(self):
+        self._benchmark(CollectionTypeChoices.TYPE_OSPF)
+
+    def test_entry_ingestion(self):
+        """Compare ORM and COPY inserts of one batch of report entries.
+
+        The COPY statement bypasses Django's cursor wrapper, so only the
+        query drawing primary keys is counted for it.
+        """
+        self._benchmark("ingestion", run=self._run_ingestion)
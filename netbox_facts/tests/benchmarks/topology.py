@@ -0,0 +1,130 @@
+"""Deterministic synthetic topology for collector benchmarks.
+
+A :class:`SyntheticTopology` describes one device under test (DUT) with a
+number of routed interfaces spread over a few VRFs, plus ``entries`` rows for
+each table a NAPALM getter returns. The same description drives both the
+NetBox objects created by :meth:`SyntheticTopology.populate` and the data
+served by :class:`~netbox_facts.tests.benchmarks.fake_driver.FakeNetworkDriver`,
+so every detected fact resolves against the test database.
+"""
+
+import ipaddress
+from dataclasses import dataclass, field
+
+from dcim.choices import DeviceStatusChoices, InterfaceTypeChoices
+from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
+from ipam.models import RIR, VRF, Prefix
+
+__all__ = ("LOCAL_AS", "SyntheticTopology", "synthetic_mac")
+
+LOCAL_AS = 65000
+
+
+def synthetic_mac(index: int, prefix: int = 0x02) -> str:
+    """Return a locally administered MAC address unique to *index*."""
+    octets = [prefix, 0x00, (index >> 24) & 0xFF, (index >> 16) & 0xFF, (index >> 8) & 0xFF, index & 0xFF]
+    return ":".join(f"{octet:02X}" for octet in octets)
+
+
+@dataclass
+class SyntheticTopology:
+    """Scale knobs and generated data for one benchmark device.
+
+    ``entries`` is the number of rows in every table getter (ARP, NDP, MAC
+    table, BGP neighbors, LLDP neighbors, interfaces and chassis inventory)
+    and in the EVPN MAC table and OSPF neighbor CLI output. Neighbor rows are
+    spread over ``interfaces`` routed interfaces, whose subnets are assigned
+    round-robin to the global table and ``vrfs`` VRFs.
+    """
+
+    entries: int
+    interfaces: int = 48
+    vrfs: int = 4
+    ports_per_neighbor: int = 48
+    name: str = "bench-dut"
+    device: Device | None = field(default=None, init=False)
+
+    # --- Naming and addressing ---
+
+    def interface_name(self, index: int) -> str:
+        return f"ge-0/0/{index}"
+
+    def access_port_name(self, index: int) -> str:
+        return f"xe-{index // 4096}/{(index // 64) % 64}/{index % 64}"
+
+    def vrf_name(self, index: int) -> str | None:
+        """Return the VRF of routed interface *index*, or None for the global table."""
+        slot = index % (self.vrfs + 1)
+        return f"bench-vrf-{slot}" if slot else None
+
+    def ipv4_network(self, index: int) -> ipaddress.IPv4Network:
+        return ipaddress.ip_network(f"10.{index}.0.0/16")
+
+    def ipv6_network(self, index: int) -> ipaddress.IPv6Network:
+        return ipaddress.ip_network(f"2001:db8:{index:x}::/64")
+
+    def neighbors_per_interface(self, index: int) -> int:
+        """Return how many of the ``entries`` neighbor rows land on routed interface *index*."""
+        base, extra = divmod(self.entries, self.interfaces)
+        return base + (1 if index < extra else 0)
+
+    def neighbors(self):
+        """Yield ``(row, interface_index, host_index)`` for every neighbor row, grouped by interface."""
+        row = 0
+        for index in range(self.interfaces):
+            for host in range(self.neighbors_per_interface(index)):
+                yield row, index, host
+                row += 1
+
+    def neighbor_device_name(self, index: int) -> str:
+        return f"bench-nbr-{index}"
+
+    # --- Database ---
+
+    def populate(self, lldp: bool = False) -> Device:
+        """Create the DUT, its routed interfaces, VRFs and prefixes.
+
+        With *lldp*, also create one access port per entry on the DUT and
+        enough neighbor devices, in the same site, to terminate them.
+        """
+        site = Site.objects.create(name="Bench Site", slug="bench-site")
+        manufacturer = Manufacturer.objects.create(name="Bench Mfg", slug="bench-mfg")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Bench", slug="bench")
+        role = DeviceRole.objects.create(name="Bench Role", slug="bench-role")
+        RIR.objects.create(name="Bench RIR", slug="bench-rir", is_private=True)
+
+        def create_device(name):
+            return Device.objects.create(
+                name=name,
+                site=site,
+                device_type=device_type,
+                role=role,
+                status=DeviceStatusChoices.STATUS_ACTIVE,
+            )
+
+        self.device = create_device(self.name)
+        vrfs = {
+            name: VRF.objects.create(name=name) for name in (f"bench-vrf-{slot}" for slot in range(1, self.vrfs + 1))
+        }
+        for index in range(self.interfaces):
+            Interface.objects.create(
+                device=self.device,
+                name=self.interface_name(index),
+                type=InterfaceTypeChoices.TYPE_10GE_SFP_PLUS,
+            )
+            vrf = vrfs.get(self.vrf_name(index))
+            Prefix.objects.create(prefix=str(self.ipv4_network(index)), vrf=vrf)
+            Prefix.objects.create(prefix=str(self.ipv6_network(index)), vrf=vrf)
+
+        if lldp:
+            Interface.objects.bulk_create(
+                Interface(device=self.device, name=self.access_port_name(i), type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+                for i in range(self.entries)
+            )
+            for n in range(-(-self.entries // self.ports_per_neighbor)):
+                neighbor = create_device(self.neighbor_device_name(n))
+                Interface.objects.bulk_create(
+                    Interface(device=neighbor, name=self.interface_name(p), type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+                    for p in range(self.ports_per_neighbor)
+                )
+        return self.device
@@ -1,7 +1,8 @@
 from dcim.choices import DeviceStatusChoices
 from dcim.models import Manufacturer
+from django.urls import reverse
 from netaddr import EUI
-from utilities.testing import APIViewTestCases
+from utilities.testing import APITestCase, APIViewTestCases
 
 from netbox_facts.choices import (
     CollectionTypeChoices,
@@ -144,3 +145,12 @@ class CollectionPlanAPITest(
                 "device_status": [DeviceStatusChoices.STATUS_ACTIVE],
             },
         ]
+
+
+class MetricsAPITest(APITestCase):
+    def test_metrics_exposition(self):
+        response = self.client.get(reverse("plugins-api:netbox_facts-api:metrics"), **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(b"# TYPE netbox_facts_devices_collected_total counter", response.content)
+        self.assertIn(b"# TYPE netbox_facts_rpc_duration_seconds histogram", response.content)
@@ -14,6 +14,7 @@ from django.test import TestCase
 from ipam.models.ip import IPAddress, Prefix
 from ipam.models.vrfs import VRF
 
+from netbox_facts import metrics
 from netbox_facts.choices import (
     CollectionTypeChoices,
     EntryActionChoices,
@@ -159,6 +160,23 @@ class ApplyFailureTest(ApplierTestMixin, TestCase):
         self.assertEqual(entry.status, EntryStatusChoices.STATUS_FAILED)
         self.assertTrue(len(entry.error_message) > 0)
 
+    def test_apply_counts_entries_in_metrics(self):
+        """apply_entries() should count processed entries by collector type and status."""
+        labels = {"collector_type": CollectionTypeChoices.TYPE_LLDP, "status": EntryStatusChoices.STATUS_FAILED}
+        before = metrics.REGISTRY.get_sample_value("netbox_facts_entries_applied_total", labels) or 0
+        report = FactsReport.objects.create(collection_plan=self.plan)
+        entry = FactsReportEntry.objects.create(
+            report=report,
+            action=EntryActionChoices.ACTION_NEW,
+            collector_type=CollectionTypeChoices.TYPE_LLDP,
+            device=self.device,
+            detected_values={"local_interface": "Ethernet9", "remote_device": "nowhere", "remote_interface": "x"},
+        )
+
+        apply_entries(report, [entry.pk])
+
+        self.assertEqual(metrics.REGISTRY.get_sample_value("netbox_facts_entries_applied_total", labels), before + 1)
+
 
 class SkipEntriesTest(ApplierTestMixin, TestCase):
     """Tests for skip_entries."""
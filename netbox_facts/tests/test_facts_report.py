@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from dcim.choices import DeviceStatusChoices
 from dcim.models import (
     Device,
@@ -89,6 +91,38 @@ class FactsReportModelTest(TestCase):
         report = FactsReport.objects.create(collection_plan=self.plan)
         self.assertEqual(report.summary, {})
 
+    def test_finalize_rolls_up_timings(self):
+        report = FactsReport.objects.create(collection_plan=self.plan)
+        timings = {
+            "1": {"name": "dev1", "total": 2.0, "connect": 0.5, "rpc": 1.0, "calls": {"ARP data": 1.0}},
+            "2": {"name": "dev2", "total": 4.5, "connect": 1.25, "reconcile": 3.0, "calls": {}},
+        }
+        report.finalize(ReportStatusChoices.STATUS_PENDING, timings=timings)
+        report.refresh_from_db()
+        self.assertEqual(report.timings["phases"], {"total": 6.5, "connect": 1.75, "rpc": 1.0, "reconcile": 3.0})
+        self.assertEqual(report.timings["devices"], timings)
+
+    def test_finalize_without_timings_keeps_them(self):
+        report = FactsReport.objects.create(collection_plan=self.plan)
+        report.finalize(ReportStatusChoices.STATUS_FAILED, error_message="boom")
+        report.refresh_from_db()
+        self.assertEqual(report.timings, {})
+
+    def test_get_slowest_devices(self):
+        report = FactsReport.objects.create(
+            collection_plan=self.plan,
+            timings={
+                "devices": {
+                    "1": {"name": "fast", "total": 1.0},
+                    "2": {"name": "slow", "total": 9.0},
+                    "3": {"name": "medium", "total": 4.0},
+                }
+            },
+        )
+        self.assertEqual([timing["name"] for _, timing in report.get_slowest_devices()], ["slow", "medium", "fast"])
+        with patch("netbox_facts.models.facts_report.get_plugin_config", return_value=2):
+            self.assertEqual([device_id for device_id, _ in report.get_slowest_devices()], ["2", "3"])
+
 
 class FactsReportEntryModelTest(TestCase):
     """Tests for the FactsReportEntry model."""
@@ -1,4 +1,8 @@
-from unittest.mock import MagicMock, patch
+import ipaddress
+import threading
+import uuid
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from dcim.choices import DeviceStatusChoices
 from dcim.models import (
@@ -10,30 +14,58 @@ from dcim.models import (
 )
 from dcim.models.device_components import Interface, InventoryItem, ModuleBay
 from dcim.models.modules import Module, ModuleType
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
+from extras.choices import LogLevelChoices
 from extras.models.models import JournalEntry
 from ipam.models.ip import IPAddress, Prefix
 from ipam.models.vrfs import VRF
+from netaddr import EUI
 
+from netbox_facts import metrics
 from netbox_facts.choices import CollectionTypeChoices, EntryActionChoices
 from netbox_facts.constants import AUTO_D_TAG
 from netbox_facts.helpers.collector import NapalmCollector
+from netbox_facts.helpers.entry_buffer import INGESTION_COPY, EntryBuffer
+from netbox_facts.helpers.governor import ConcurrencyGovernor
 from netbox_facts.helpers.napalm import (
     get_network_instances_by_interface,
     parse_network_instances,
 )
 from netbox_facts.helpers.netbox import (
+    bulk_assign_vendors,
+    bulk_get_ips,
+    bulk_get_or_create_asns,
+    bulk_get_or_create_ips,
+    bulk_get_or_create_macs,
+    bulk_insert_new,
+    bulk_journal,
+    bulk_resolve_vendors,
+    bulk_resolve_vrfs,
     create_module,
     get_absolute_url_markdown,
     get_or_create_ip,
     get_or_create_mac,
     get_primary_ip,
     resolve_vrf,
+    touch_last_seen,
 )
-from netbox_facts.models import CollectionPlan
-from netbox_facts.models.mac import MACAddress
+from netbox_facts.helpers.oui import OUIIndex, oui_index, parse_oui_registry, prefix_eui
+from netbox_facts.helpers.prefixes import PrefixIndex, SubnetMatcher, address_to_int, addresses_to_ints, int_to_address
+from netbox_facts.models import CollectionPlan, DeviceReachability
+from netbox_facts.models.mac import MACAddress, MACVendor
 from netbox_facts.napalm.junos import EnhancedJunOSDriver
+from netbox_facts.napalm.junos_async import (
+    AsyncNetconfSession,
+    ReplayDevice,
+    RPCMiss,
+    parse_rpc_reply,
+    rpc_key,
+    rpc_to_xml,
+)
 
 
 class ParseNetworkInstancesTest(TestCase):
@@ -172,6 +204,8 @@ class CollectorTestMixin:
         with patch.object(NapalmCollector, "__init__", lambda self, p: None):
             collector = NapalmCollector.__new__(NapalmCollector)
         collector.plan = plan
+        collector._local = threading.local()
+        collector._collector_types = [plan.collector_type]
         collector._collector_type = plan.collector_type
         collector._napalm_args = {}
         collector._napalm_driver = None
@@ -180,6 +214,9 @@ class CollectorTestMixin:
         collector._interfaces_re = MagicMock()
         collector._interfaces_re.match.return_value = True
         collector._devices = []
+        collector._max_workers = 1
+        collector._governor = ConcurrencyGovernor(1)
+        collector.device_timings = {}
         collector._current_device = None
         collector._log_prefix = ""
         collector._now = timezone.now()
@@ -712,6 +749,124 @@ class EthernetSwitchingCollectorTest(CollectorTestMixin, TestCase):
 
         self.assertEqual(MACAddress.objects.count(), 0)
 
+    def test_skips_invalid_mac(self):
+        """An unparseable MAC is skipped with a warning and the rest of the table is collected."""
+        plan = self._create_plan(
+            collector_type=CollectionTypeChoices.TYPE_L2,
+            name="Plan-ethsw-badmac",
+        )
+        device = self._create_device("ethsw-dev4")
+        Interface.objects.create(device=device, name="Ethernet1", type="1000base-t")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_mac_address_table.return_value = [
+            {"mac": "not-a-mac", "interface": "Ethernet1", "vlan": 100},
+            {"mac": "AA:BB:CC:DD:EE:12", "interface": "Ethernet1", "vlan": 100},
+        ]
+
+        with patch.object(collector, "_log_warning") as log_warning:
+            collector.ethernet_switching(driver)
+
+        log_warning.assert_called_once_with("Invalid MAC address `not-a-mac` on interface `Ethernet1`. Skipping.")
+        self.assertEqual(MACAddress.objects.count(), 1)
+        self.assertTrue(MACAddress.objects.filter(mac_address="AA:BB:CC:DD:EE:12").exists())
+
+
+class InterfaceCacheTest(CollectorTestMixin, TestCase):
+    """Tests for the per-collector-method interface map."""
+
+    def setUp(self):
+        self.plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_L2, name="Plan-iface-cache")
+        self.device = self._create_device("iface-cache-dev1")
+        for name in ("Ethernet1", "Ethernet2", "Ethernet3"):
+            Interface.objects.create(device=self.device, name=name, type="1000base-t")
+        self.collector = self._make_collector(self.plan)
+        self.collector._current_device = self.device
+
+    def test_lookups_share_one_query(self):
+        with self.assertNumQueries(1):
+            for name in ("Ethernet1", "Ethernet2", "Ethernet3", "Ethernet1"):
+                self.assertEqual(self.collector._get_interface(self.device, name).name, name)
+            with self.assertRaises(Interface.DoesNotExist):
+                self.collector._get_interface(self.device, "Ethernet9")
+
+    def test_created_interface_joins_map_with_cached_parent(self):
+        self.collector._get_interface(self.device, "Ethernet1")
+        sub = self.collector._get_or_create_interface(self.device, "Ethernet1.100")
+
+        self.assertEqual(sub.parent.name, "Ethernet1")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.collector._get_interface(self.device, "Ethernet1.100"), sub)
+
+    def test_map_is_dropped_after_collector_method(self):
+        driver = MagicMock()
+        driver.get_mac_address_table.return_value = [
+            {
+                "mac": "AA:BB:CC:50:00:0" + str(i),
+                "interface": "Ethernet1",
+                "vlan": 100,
+                "static": False,
+                "active": True,
+                "moves": 0,
+                "last_move": 0.0,
+            }
+            for i in range(3)
+        ]
+        self.collector.ethernet_switching(driver)
+
+        self.assertEqual(MACAddress.objects.filter(interfaces__name="Ethernet1").count(), 3)
+        self.assertEqual(self.collector._ctx.interfaces, {})
+
+
+class MACLookupTest(CollectorTestMixin, TestCase):
+    """Tests for the per-collector-method MAC address map."""
+
+    def setUp(self):
+        self.plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_L2, name="Plan-mac-lookup")
+        self.device = self._create_device("mac-lookup-dev1")
+        Interface.objects.create(device=self.device, name="Ethernet1", type="1000base-t")
+        self.collector = self._make_collector(self.plan)
+        self.collector._current_device = self.device
+
+    def test_lookups_share_one_query_across_notations(self):
+        existing, _ = get_or_create_mac("AA:BB:CC:60:00:01")
+        with self.assertNumQueries(1):
+            self.collector._prefetch_macs(["aa:bb:cc:60:00:01", "AA:BB:CC:60:00:02", "not-a-mac"])
+            self.assertEqual(self.collector._lookup_mac("aabb.cc60.0001"), existing)
+            self.assertIsNone(self.collector._lookup_mac("AA-BB-CC-60-00-02"))
+        with self.assertRaises(ValueError):
+            self.collector._lookup_mac("not-a-mac")
+
+    def test_batches_lookups(self):
+        with patch("netbox_facts.helpers.netbox.MAC_LOOKUP_BATCH_SIZE", 2), self.assertNumQueries(3):
+            self.collector._prefetch_macs(f"AA:BB:CC:61:00:0{i}" for i in range(5))
+
+    def test_repeated_mac_in_table_is_confirmed_once_created(self):
+        from netbox_facts.models.facts_report import FactsReport
+
+        report = FactsReport.objects.create(collection_plan=self.plan)
+        self.collector._report = report
+        driver = MagicMock()
+        driver.get_mac_address_table.return_value = [
+            {
+                "mac": "AA:BB:CC:62:00:01",
+                "interface": "Ethernet1",
+                "vlan": vlan,
+                "static": False,
+                "active": True,
+                "moves": 0,
+                "last_move": 0.0,
+            }
+            for vlan in (100, 200)
+        ]
+        self.collector.ethernet_switching(driver)
+
+        actions = list(report.entries.order_by("pk").values_list("action", flat=True))
+        self.assertEqual(actions, [EntryActionChoices.ACTION_NEW, EntryActionChoices.ACTION_CONFIRMED])
+        self.assertEqual(self.collector._ctx.macs, {})
+
 
 class LLDPCollectorTest(CollectorTestMixin, TestCase):
     """Tests for the lldp() collector method."""
@@ -1114,6 +1269,26 @@ class BGPCollectorTest(CollectorTestMixin, TestCase):
             # Should return without error (no local AS)
             collector._bgp_routing_integration()
 
+    def test_bgp_routing_integration_detect_only_creates_no_asn(self):
+        """In detect-only mode the local ASN is looked up but never created."""
+        from ipam.models import ASN, RIR
+
+        plan = self._create_plan(
+            collector_type=CollectionTypeChoices.TYPE_BGP,
+            name="Plan-bgp-detect-asn",
+            detect_only=True,
+        )
+        device = self._create_device("bgp-dev-detect-asn")
+        RIR.objects.create(name="Detect RIR", slug="detect-rir")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+        collector._bgp_routing_data = {"local_as": 65010, "vrfs": {"global": []}}
+
+        with patch("netbox_facts.helpers.collector.HAS_NETBOX_ROUTING", True):
+            collector._bgp_routing_integration()
+
+        self.assertFalse(ASN.objects.filter(asn=65010).exists())
+
     def test_bgp_routing_data_not_set_on_empty_bgp(self):
         """_bgp_routing_data local_as should remain None when no peers found."""
         plan = self._create_plan(
@@ -1133,6 +1308,93 @@ class BGPCollectorTest(CollectorTestMixin, TestCase):
         self.assertIsNone(collector._bgp_routing_data["local_as"])
         self.assertEqual(collector._bgp_routing_data["vrfs"], {})
 
+    def _bgp_table(self, count, vrf_name="global"):
+        return {
+            vrf_name: {
+                str(65100 + i): [
+                    {
+                        "up": True,
+                        "local_as": 65000,
+                        "remote_as": 65100 + i,
+                        "remote_address": f"10.40.0.{i + 1}",
+                        "local_address": "10.40.0.254",
+                    }
+                ]
+                for i in range(count)
+            }
+        }
+
+    def _bgp_collector(self, name):
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_BGP, name=f"Plan-{name}")
+        collector = self._make_collector(plan)
+        collector._current_device = self._create_device(name)
+        return collector
+
+    def _run_bgp(self, collector, table):
+        driver = MagicMock()
+        driver.get_bgp_neighbors_detail.return_value = table
+        with patch("netbox_facts.helpers.collector.HAS_NETBOX_ROUTING", False):
+            collector.bgp(driver)
+        return collector
+
+    def test_peers_resolved_in_bulk(self):
+        """ASNs and peer IPs of all peers should be created in one pass, sharing one RIR."""
+        from ipam.models import ASN, RIR
+
+        rir = RIR.objects.create(name="BGP-RIR-bulk", slug="bgp-rir-bulk")
+        collector = self._run_bgp(self._bgp_collector("bgp-dev-bulk"), self._bgp_table(3))
+
+        self.assertEqual(set(ASN.objects.filter(rir=rir).values_list("asn", flat=True)), {65100, 65101, 65102})
+        peer_ip = IPAddress.objects.get(address="10.40.0.2/32")
+        self.assertTrue(peer_ip.description.startswith("BGP peer AS65101 discovered on"))
+        self.assertTrue(JournalEntry.objects.filter(assigned_object_id=peer_ip.pk).exists())
+        peers = collector._bgp_routing_data["vrfs"]["global"]
+        self.assertEqual({peer["nb_asn"].asn for peer in peers}, {65100, 65101, 65102})
+
+    def test_queries_do_not_grow_with_peers(self):
+        """Known VRFs, ASNs and peer IPs should be looked up with the same number of queries for any peer count."""
+        from ipam.models import ASN, RIR
+
+        rir = RIR.objects.create(name="BGP-RIR-count", slug="bgp-rir-count")
+        vrf = VRF.objects.create(name="VRF_BGP_COUNT")
+        for i in range(6):
+            ASN.objects.create(asn=65100 + i, rir=rir)
+            IPAddress.objects.create(address=f"10.40.0.{i + 1}/32", vrf=vrf)
+
+        queries = []
+        for count in (2, 6):
+            collector = self._bgp_collector(f"bgp-dev-count-{count}")
+            with CaptureQueriesContext(connection) as context:
+                self._run_bgp(collector, self._bgp_table(count, vrf_name="VRF_BGP_COUNT"))
+            queries.append(len(context.captured_queries))
+        self.assertEqual(queries[0], queries[1])
+
+    def test_created_and_existing_peer_ips_are_logged_apart(self):
+        """Every peer of a created IP is logged as created, peers of existing IPs as found."""
+        IPAddress.objects.create(address="10.40.0.2/32")
+        table = self._bgp_table(2)
+        table["global"]["65102"] = [{**table["global"]["65100"][0], "remote_as": 65102}]
+        collector = self._run_bgp(self._bgp_collector("bgp-dev-logs"), table)
+
+        messages = [entry["message"] for entry in collector.plan.log]
+        created = [message for message in messages if "Created peer IP" in message]
+        found = [message for message in messages if "Found existing peer IP" in message]
+        self.assertEqual(len(created), 2)
+        self.assertTrue(all("10.40.0.1/32" in message for message in created))
+        self.assertEqual(len(found), 1)
+        self.assertIn("10.40.0.2/32", found[0])
+        self.assertEqual(JournalEntry.objects.filter(comments__contains="10.40.0.1").count(), 1)
+
+    def test_asn_not_created_without_rir(self):
+        """Peers should still get IPs when no RIR exists, without ASNs."""
+        from ipam.models import ASN
+
+        collector = self._run_bgp(self._bgp_collector("bgp-dev-norir"), self._bgp_table(2))
+
+        self.assertFalse(ASN.objects.exists())
+        self.assertTrue(IPAddress.objects.filter(address="10.40.0.1/32").exists())
+        self.assertIsNone(collector._bgp_routing_data["vrfs"]["global"][0]["nb_asn"])
+
 
 class VendorDispatchTest(TestCase):
     """Tests for the vendor-specific dispatch mechanism."""
@@ -1145,6 +1407,7 @@ class VendorDispatchTest(TestCase):
         with patch.object(NapalmCollector, "__init__", lambda self, p: None):
             collector = NapalmCollector.__new__(NapalmCollector)
         collector.plan = plan
+        collector._local = threading.local()
         collector._collector_type = "l2_circuits"
         collector._now = timezone.now()
         collector._current_device = None
@@ -1238,6 +1501,7 @@ class EVPNCollectorTest(CollectorTestMixin, TestCase):
         with patch.object(NapalmCollector, "__init__", lambda self, p: None):
             collector = NapalmCollector.__new__(NapalmCollector)
         collector.plan = plan
+        collector._local = threading.local()
         collector._collector_type = CollectionTypeChoices.TYPE_EVPN
         collector._now = timezone.now()
         collector._current_device = None
@@ -1356,6 +1620,7 @@ class OSPFCollectorTest(CollectorTestMixin, TestCase):
         with patch.object(NapalmCollector, "__init__", lambda self, p: None):
             collector = NapalmCollector.__new__(NapalmCollector)
         collector.plan = plan
+        collector._local = threading.local()
         collector._collector_type = CollectionTypeChoices.TYPE_OSPF
         collector._now = timezone.now()
         collector._current_device = None
@@ -2158,6 +2423,41 @@ class InterfacesIPGenericTest(CollectorTestMixin, TestCase):
         # But the IP should still be created via the enhanced path
         self.assertTrue(IPAddress.objects.filter(address="10.0.7.1/24").exists())
 
+    def test_generic_path_creates_ips_in_bulk(self):
+        """Missing IPs of every interface are created with one bulk call and assigned."""
+        plan = self._create_plan(
+            collector_type=CollectionTypeChoices.TYPE_INTERFACES,
+            name="Plan-generic-bulk-ip",
+        )
+        device = self._create_device("generic-bulk-dev")
+        eth1 = Interface.objects.create(device=device, name="Ethernet1", type="1000base-t")
+        eth2 = Interface.objects.create(device=device, name="Ethernet2", type="1000base-t")
+        moved_ip = IPAddress.objects.create(address="10.3.0.1/24", assigned_object=eth1)
+        moved_ip.tags.add(AUTO_D_TAG)
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_interfaces.return_value = {
+            name: {"is_up": True, "is_enabled": True, "mac_address": ""} for name in ("Ethernet1", "Ethernet2")
+        }
+        driver.get_interfaces_ip.return_value = {
+            "Ethernet1": {"ipv4": {"10.2.0.1": {"prefix_length": 24}}},
+            "Ethernet2": {"ipv4": {"10.2.1.1": {"prefix_length": 24}, "10.3.0.1": {"prefix_length": 24}}},
+        }
+        driver.get_network_instances.return_value = {}
+
+        with patch("netbox_facts.helpers.collector.bulk_get_or_create_ips", wraps=bulk_get_or_create_ips) as mock_bulk:
+            collector.interfaces(driver)
+        mock_bulk.assert_called_once()
+
+        self.assertEqual(IPAddress.objects.get(address="10.2.0.1/24").assigned_object, eth1)
+        new_ip = IPAddress.objects.get(address="10.2.1.1/24")
+        self.assertEqual(new_ip.assigned_object, eth2)
+        self.assertTrue(new_ip.tags.filter(name=AUTO_D_TAG).exists())
+        moved_ip.refresh_from_db()
+        self.assertEqual(moved_ip.assigned_object, eth2)
+
 
 class DetectOnlyInterfacesLogicalTest(CollectorTestMixin, TestCase):
     """Tests that detect_only=True prevents mutations for LAG/IP entries."""
@@ -3258,6 +3558,432 @@ class GetOrCreateMacTest(CollectorTestMixin, TestCase):
         self.assertEqual(mac1.pk, mac2.pk)
 
 
+class BulkGetOrCreateMacsTest(CollectorTestMixin, TestCase):
+    """Tests for bulk_get_or_create_macs helper."""
+
+    def test_creates_missing_and_returns_existing(self):
+        existing, _ = get_or_create_mac("AA:BB:CC:00:00:01")
+        macs, created = bulk_get_or_create_macs({"aa:bb:cc:00:00:01", "AA:BB:CC:00:00:02"})
+
+        self.assertEqual(macs["aa:bb:cc:00:00:01"].pk, existing.pk)
+        self.assertEqual(created, {"AA:BB:CC:00:00:02"})
+        self.assertTrue(macs["AA:BB:CC:00:00:02"].tags.filter(name=AUTO_D_TAG).exists())
+
+    def test_assigns_known_vendor(self):
+        vendor = MACVendor.objects.create(vendor_name="Bulk Vendor", mac_prefix="AA:BB:DD:00:00:00")
+        macs, _ = bulk_get_or_create_macs({"AA:BB:DD:00:00:03"})
+        self.assertEqual(macs["AA:BB:DD:00:00:03"].vendor, vendor)
+
+    def test_signals_created_macs(self):
+        """post_save is sent, as one batch, for the created MACs only."""
+        get_or_create_mac("AA:BB:CC:00:00:04")
+        with patch("netbox_facts.helpers.netbox.send_created_signals") as send_created_signals:
+            macs, _ = bulk_get_or_create_macs({"AA:BB:CC:00:00:04", "AA:BB:CC:00:00:05"})
+
+        send_created_signals.assert_called_once_with([macs["AA:BB:CC:00:00:05"]], batch=True)
+
+
+class BulkVendorResolutionTest(CollectorTestMixin, TestCase):
+    """Tests for bulk_resolve_vendors and bulk_assign_vendors helpers."""
+
+    def test_creates_registered_vendor_with_manufacturer(self):
+        vendor_name = EUI("00:00:0C:00:00:00").oui.registration().org
+        manufacturer = Manufacturer.objects.create(name=vendor_name, slug="bulk-oui-mfg")
+        vendors = bulk_resolve_vendors([EUI("00:00:0C:00:00:01"), EUI("00:00:0C:00:00:02"), EUI("02:00:00:00:00:01")])
+
+        vendor = MACVendor.objects.get(vendor_name=vendor_name)
+        self.assertEqual(vendors, {int(EUI("00:00:0C:00:00:00")): vendor})
+        self.assertEqual(vendor.manufacturer, manufacturer)
+
+    def test_signals_only_inserted_vendors(self):
+        """A vendor inserted by another worker after the index was read is returned but not signalled."""
+        cisco, vmware = EUI("00:00:0C:00:00:00"), EUI("00:50:56:00:00:00")
+        raced = MACVendor.objects.create(vendor_name="Raced Vendor", mac_prefix=cisco)
+
+        with (
+            patch.object(oui_index, "vendors", return_value={}),
+            patch("netbox_facts.helpers.netbox.send_created_signals") as send_created_signals,
+        ):
+            vendors = bulk_resolve_vendors([EUI("00:00:0C:00:00:01"), EUI("00:50:56:00:00:01")])
+
+        created = MACVendor.objects.get(mac_prefix=vmware)
+        self.assertEqual(vendors, {int(cisco): raced, int(vmware): created})
+        send_created_signals.assert_called_once_with([created], batch=True)
+
+    def test_assigns_vendor_with_one_update(self):
+        vendor = MACVendor.objects.create(vendor_name="Assign Vendor", mac_prefix="AA:BB:EE:00:00:00")
+        macs = [MACAddress.objects.create(mac_address=f"AA:BB:EE:00:00:0{i}") for i in range(3)]
+        MACAddress.objects.update(vendor=None)
+        macs = list(MACAddress.objects.filter(pk__in=[mac.pk for mac in macs]))
+
+        with self.assertNumQueries(2):
+            bulk_assign_vendors(macs)
+        self.assertEqual(MACAddress.objects.filter(vendor=vendor).count(), 3)
+
+
+class BulkVendorIndexTest(TransactionTestCase):
+    """Tests for bulk_resolve_vendors against the cached OUI index.
+
+    Vendor writes only invalidate the index once their transaction commits,
+    which never happens under TestCase.
+    """
+
+    def setUp(self):
+        oui_index.invalidate()
+        self.addCleanup(oui_index.invalidate)
+
+    def test_new_vendors_invalidate_index_once(self):
+        cisco, vmware = EUI("00:00:0C:00:00:00"), EUI("00:50:56:00:00:00")
+        self.assertIsNone(oui_index.vendor(int(cisco)))
+        # Skip the MACAddress signals, which would create the vendor
+        MACAddress.objects.bulk_create([MACAddress(mac_address=EUI("00:50:56:00:00:01"))])
+        mac = MACAddress.objects.get(mac_address="00:50:56:00:00:01")
+
+        with (
+            patch.object(oui_index, "invalidate", wraps=oui_index.invalidate) as invalidate,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            vendors = bulk_resolve_vendors([EUI("00:00:0C:00:00:01"), EUI("00:50:56:00:00:01")])
+
+        invalidate.assert_called_once_with()
+        mac_updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(f'UPDATE "{MACAddress._meta.db_table}"')
+        ]
+        self.assertEqual(len(mac_updates), 1)
+        self.assertEqual(set(vendors), {int(cisco), int(vmware)})
+        self.assertEqual(oui_index.vendor(int(vmware)), vendors[int(vmware)])
+        mac.refresh_from_db()
+        self.assertEqual(mac.vendor, vendors[int(vmware)])
+
+
+class OUIIndexTest(TestCase):
+    """Tests for the process-wide OUI index."""
+
+    def setUp(self):
+        # Vendor writes invalidate the index on commit, which TestCase never reaches
+        patcher = patch.object(OUIIndex, "_in_transaction", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        oui_index.invalidate()
+        self.addCleanup(oui_index.invalidate)
+
+    def test_lookups_reuse_loaded_vendors(self):
+        vendor = MACVendor.objects.create(vendor_name="Index Vendor", mac_prefix=EUI("AA:BB:F0:00:00:00"))
+        prefix = int(EUI("AA:BB:F0:00:00:00"))
+        self.assertEqual(oui_index.vendor(prefix), vendor)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(MACVendor.objects.get_by_mac_address(EUI("AA:BB:F0:12:34:56")), vendor)
+            self.assertEqual(oui_index.vendors([prefix, int(EUI("AA:BB:F1:00:00:00"))]), {prefix: vendor})
+            with self.assertRaises(MACVendor.DoesNotExist):
+                MACVendor.objects.get_by_mac_address(EUI("AA:BB:F1:12:34:56"))
+
+    def test_vendor_signals_invalidate(self):
+        prefix = int(EUI("AA:BB:F2:00:00:00"))
+        self.assertIsNone(oui_index.vendor(prefix))
+
+        vendor = MACVendor.objects.create(vendor_name="Late Index Vendor", mac_prefix=EUI("AA:BB:F2:00:00:00"))
+        self.assertEqual(oui_index.vendor(prefix), vendor)
+
+        vendor.delete()
+        self.assertIsNone(oui_index.vendor(prefix))
+
+    def test_registry_names_are_cached(self):
+        prefix = int(EUI("02:00:00:00:00:00"))
+        with patch("netbox_facts.helpers.oui.prefix_eui", wraps=prefix_eui) as eui:
+            self.assertIsNone(oui_index.registry_name(prefix))
+            self.assertIsNone(oui_index.registry_name(prefix))
+        eui.assert_called_once_with(prefix)
+
+
+class OUIIndexTransactionTest(TestCase):
+    """Tests for OUI index lookups inside the transaction TestCase opens."""
+
+    def setUp(self):
+        self.prefix = int(EUI("AA:BB:F4:00:00:00"))
+        self.vendor = MACVendor.objects.create(vendor_name="Txn Vendor", mac_prefix=EUI("AA:BB:F4:00:00:00"))
+        # Stand in for the commit that would have followed the vendor write
+        oui_index._drop()
+        self.addCleanup(oui_index._drop)
+
+    def test_warm_index_serves_transactions(self):
+        self.assertEqual(oui_index.vendor(self.prefix), self.vendor)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(MACVendor.objects.get_by_mac_address(EUI("AA:BB:F4:12:34:56")), self.vendor)
+            self.assertEqual(oui_index.vendors([self.prefix]), {self.prefix: self.vendor})
+
+    def test_vendor_writes_bypass_index_until_commit(self):
+        self.assertEqual(oui_index.vendor(self.prefix), self.vendor)
+        prefix = int(EUI("AA:BB:F5:00:00:00"))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            vendor = MACVendor.objects.create(vendor_name="Txn Vendor 2", mac_prefix=EUI("AA:BB:F5:00:00:00"))
+            with self.assertNumQueries(1):
+                self.assertEqual(oui_index.vendor(prefix), vendor)
+        self.assertTrue(callbacks)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(oui_index.vendors([self.prefix, prefix]), {self.prefix: self.vendor, prefix: vendor})
+        with self.assertNumQueries(0):
+            self.assertEqual(oui_index.vendor(prefix), vendor)
+
+
+class ImportOUICommandTest(TestCase):
+    """Tests for parse_oui_registry and the import_oui management command."""
+
+    OUI_TXT = (
+        "OUI/MA-L                                                    Organization\n"
+        "company_id                                                  Organization\n"
+        "\n"
+        "AA-BB-A0   (hex)\t\tImport Vendor One\n"
+        "AABBA0     (base 16)\t\tImport Vendor One\n"
+        "\t\t\t\t1 Example Street\n"
+        "\n"
+        "AA-BB-A1   (hex)\t\tImport Vendor Two\n"
+        "AABBA1     (base 16)\t\tImport Vendor Two\n"
+    )
+
+    def _import(self, content, suffix=".txt", **options):
+        import tempfile
+        from io import StringIO
+        from pathlib import Path
+
+        from django.core.management import call_command
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"oui{suffix}"
+            path.write_text(content)
+            out = StringIO()
+            call_command("import_oui", file=str(path), stdout=out, **options)
+        return out.getvalue()
+
+    def test_parses_txt_and_csv(self):
+        expected = [
+            (int(EUI("AA:BB:A0:00:00:00")), "Import Vendor One"),
+            (int(EUI("AA:BB:A1:00:00:00")), "Import Vendor Two"),
+        ]
+        self.assertEqual(list(parse_oui_registry(self.OUI_TXT.splitlines())), expected)
+        csv_lines = [
+            "Registry,Assignment,Organization Name,Organization Address",
+            "MA-L,AABBA0,Import Vendor One,1 Example Street",
+            'MA-L,AABBA1,"Import Vendor Two",',
+            "MA-M,AABBA2F,Not A MA-L,",
+        ]
+        self.assertEqual(list(parse_oui_registry(csv_lines)), expected)
+
+    def test_upserts_vendors_and_repoints_macs(self):
+        renamed = MACVendor.objects.create(vendor_name="Old Name", mac_prefix=EUI("AA:BB:A0:00:00:00"))
+        mac = MACAddress.objects.create(mac_address="AA:BB:A1:00:00:01")
+        self.assertIsNone(mac.vendor)
+
+        out = self._import(self.OUI_TXT)
+
+        self.assertIn("Imported 2", out)
+        renamed.refresh_from_db()
+        self.assertEqual(renamed.vendor_name, "Import Vendor One")
+        mac.refresh_from_db()
+        self.assertEqual(mac.vendor.vendor_name, "Import Vendor Two")
+        self.assertIn("Updated the vendor of 1", out)
+
+    def test_links_manufacturers(self):
+        manufacturer = Manufacturer.objects.create(name="Import Vendor Two", slug="import-vendor-two")
+        self._import(self.OUI_TXT, link_manufacturers=True)
+        self.assertEqual(MACVendor.objects.get(vendor_name="Import Vendor Two").manufacturer, manufacturer)
+        self.assertIsNone(MACVendor.objects.get(vendor_name="Import Vendor One").manufacturer)
+
+
+class BulkGetOrCreateIpsTest(CollectorTestMixin, TestCase):
+    """Tests for bulk_get_or_create_ips and bulk_journal helpers."""
+
+    def test_creates_missing_and_returns_existing(self):
+        vrf = VRF.objects.create(name="BulkVRF-ip")
+        existing = IPAddress.objects.create(address="10.30.0.1/24")
+        ips, created, duplicates = bulk_get_or_create_ips(
+            [("10.30.0.1/24", None), ("10.30.0.2/24", None), ("10.30.0.1/24", vrf)], description="bulk"
+        )
+
+        self.assertEqual(ips[("10.30.0.1/24", None)].pk, existing.pk)
+        self.assertEqual(created, {("10.30.0.2/24", None), ("10.30.0.1/24", vrf.pk)})
+        self.assertEqual(duplicates, set())
+        new_ip = ips[("10.30.0.1/24", vrf.pk)]
+        self.assertEqual(new_ip.vrf, vrf)
+        self.assertEqual(new_ip.description, "bulk")
+        self.assertTrue(new_ip.tags.filter(name=AUTO_D_TAG).exists())
+
+    def test_reports_duplicates(self):
+        IPAddress.objects.create(address="10.30.1.1/24")
+        IPAddress.objects.create(address="10.30.1.1/24")
+        ips, created, duplicates = bulk_get_or_create_ips([("10.30.1.1/24", None)])
+        self.assertEqual(ips, {})
+        self.assertEqual(created, set())
+        self.assertEqual(duplicates, {("10.30.1.1/24", None)})
+
+    def test_created_objects_are_change_logged(self):
+        from core.models import ObjectChange
+        from django.contrib.auth import get_user_model
+        from django.test import RequestFactory
+        from netbox.context_managers import event_tracking
+
+        request = RequestFactory().get("/")
+        request.id = uuid.uuid4()
+        request.user = get_user_model().objects.create_user(username="bulk-ip-user")
+        with event_tracking(request):
+            ips, _, _ = bulk_get_or_create_ips([("10.30.2.1/24", None)])
+            bulk_journal([(ips[("10.30.2.1/24", None)], "Discovered in bulk.")])
+
+        new_ip = ips[("10.30.2.1/24", None)]
+        change = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(IPAddress), changed_object_id=new_ip.pk
+        )
+        self.assertEqual(change.request_id, request.id)
+        self.assertIn(AUTO_D_TAG, change.postchange_data["tags"])
+        self.assertEqual(JournalEntry.objects.get(assigned_object_id=new_ip.pk).comments, "Discovered in bulk.")
+
+    def test_overrides_apply_per_key(self):
+        ips, _, _ = bulk_get_or_create_ips(
+            [("10.30.3.1/32", None), ("10.30.3.2/32", None)],
+            overrides={("10.30.3.2/32", None): {"description": "override"}},
+            description="default",
+        )
+        self.assertEqual(ips[("10.30.3.1/32", None)].description, "default")
+        self.assertEqual(ips[("10.30.3.2/32", None)].description, "override")
+
+    def test_get_ips_returns_oldest_duplicate(self):
+        first = IPAddress.objects.create(address="10.30.4.1/32")
+        IPAddress.objects.create(address="10.30.4.1/32")
+        ips, duplicates = bulk_get_ips([("10.30.4.1/32", None), ("10.30.4.2/32", None)])
+        self.assertEqual(ips, {("10.30.4.1/32", None): first})
+        self.assertEqual(duplicates, {("10.30.4.1/32", None)})
+
+
+class BulkResolveVrfsAndAsnsTest(TestCase):
+    """Tests for bulk_resolve_vrfs and bulk_get_or_create_asns."""
+
+    def test_resolves_vrfs_with_one_query(self):
+        vrf = VRF.objects.create(name="BulkVRF-one")
+        VRF.objects.create(name="BulkVRF-dup")
+        VRF.objects.create(name="BulkVRF-dup")
+        with self.assertNumQueries(1):
+            vrfs, duplicates = bulk_resolve_vrfs(["", "global", "BulkVRF-one", "BulkVRF-dup", "BulkVRF-missing"])
+        self.assertEqual(vrfs, {"": None, "global": None, "BulkVRF-one": vrf})
+        self.assertEqual(duplicates, {"BulkVRF-dup"})
+
+    def test_creates_missing_asns_in_first_rir(self):
+        from ipam.models import ASN, RIR
+
+        rir = RIR.objects.create(name="Bulk-RIR", slug="bulk-rir")
+        existing = ASN.objects.create(asn=64600, rir=rir)
+        asns, uncreated = bulk_get_or_create_asns(["64600", 64601, 64602])
+        self.assertEqual(asns[64600], existing)
+        self.assertEqual(asns[64601].rir, rir)
+        self.assertEqual(set(asns), {64600, 64601, 64602})
+        self.assertEqual(uncreated, set())
+
+    def test_signals_only_asns_this_call_created(self):
+        """ASNs another worker inserted meanwhile are returned but not signalled as created."""
+        from ipam.models import ASN, RIR
+
+        rir = RIR.objects.create(name="Race-RIR", slug="race-rir")
+
+        def racing_insert(model, objects):
+            ASN.objects.create(asn=64901, rir=rir)
+            return bulk_insert_new(model, objects)
+
+        with (
+            patch("netbox_facts.helpers.netbox.bulk_insert_new", side_effect=racing_insert),
+            patch("netbox_facts.helpers.netbox.send_created_signals") as send_signals,
+        ):
+            asns, uncreated = bulk_get_or_create_asns([64900, 64901])
+
+        self.assertEqual(set(asns), {64900, 64901})
+        self.assertEqual(uncreated, set())
+        self.assertEqual([asn.asn for asn in send_signals.call_args.args[0]], [64900])
+
+    def test_reports_asns_without_rir(self):
+        asns, uncreated = bulk_get_or_create_asns([64700])
+        self.assertEqual(asns, {})
+        self.assertEqual(uncreated, {64700})
+
+
+class MacLastSeenTouchTest(CollectorTestMixin, TestCase):
+    """Tests for deferred MAC last_seen updates."""
+
+    def _run_ethernet_switching(self, mac_str, discovery_method):
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_L2, name="Plan-touch")
+        device = self._create_device("touch-dev1")
+        Interface.objects.create(device=device, name="Ethernet1", type="1000base-t")
+        seen = timezone.now() - timedelta(days=1)
+        mac = MACAddress.objects.create(mac_address=mac_str, discovery_method=discovery_method, last_seen=seen)
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_mac_address_table.return_value = [
+            {
+                "mac": mac_str,
+                "interface": "Ethernet1",
+                "vlan": 100,
+                "static": False,
+                "active": True,
+                "moves": 0,
+                "last_move": 0.0,
+            }
+        ]
+        collector.ethernet_switching(driver)
+        return collector, mac, seen
+
+    def test_unchanged_mac_is_touched_when_device_finishes(self):
+        collector, mac, seen = self._run_ethernet_switching("AA:BB:CC:40:00:01", CollectionTypeChoices.TYPE_L2)
+
+        mac.refresh_from_db()
+        self.assertEqual(mac.last_seen, seen)
+        self.assertEqual(collector._ctx.touched_macs, {mac.pk})
+
+        collector._flush_mac_touches()
+        mac.refresh_from_db()
+        self.assertEqual(mac.last_seen, collector._now)
+        self.assertEqual(collector._ctx.touched_macs, set())
+
+    def test_changed_mac_is_saved(self):
+        collector, mac, _ = self._run_ethernet_switching("AA:BB:CC:40:00:02", CollectionTypeChoices.TYPE_ARP)
+
+        mac.refresh_from_db()
+        self.assertEqual(mac.discovery_method, CollectionTypeChoices.TYPE_L2)
+        self.assertEqual(mac.last_seen, collector._now)
+        self.assertEqual(collector._ctx.touched_macs, set())
+
+    def test_touch_last_seen_issues_one_update(self):
+        macs = [MACAddress.objects.create(mac_address=f"AA:BB:CC:40:01:0{i}") for i in range(3)]
+        now = timezone.now()
+        with self.assertNumQueries(1):
+            touch_last_seen({mac.pk for mac in macs}, now)
+        self.assertEqual(MACAddress.objects.filter(last_seen=now).count(), 3)
+
+    def test_touch_last_seen_changelog(self):
+        from core.models import ObjectChange
+        from django.contrib.auth import get_user_model
+        from django.test import RequestFactory
+        from netbox.context_managers import event_tracking
+
+        mac = MACAddress.objects.create(mac_address="AA:BB:CC:40:02:01")
+        request = RequestFactory().get("/")
+        request.id = uuid.uuid4()
+        request.user = get_user_model().objects.create_user(username="touch-user")
+        now = timezone.now()
+        with event_tracking(request):
+            touch_last_seen({mac.pk}, now, changelog=True)
+
+        change = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(MACAddress), changed_object_id=mac.pk
+        )
+        self.assertIsNone(change.prechange_data["last_seen"])
+        self.assertIsNotNone(change.postchange_data["last_seen"])
+
+
 class GetOrCreateIpTest(CollectorTestMixin, TestCase):
     """Tests for get_or_create_ip helper."""
 
@@ -3280,6 +4006,82 @@ class GetOrCreateIpTest(CollectorTestMixin, TestCase):
         self.assertEqual(ip.vrf, vrf)
 
 
+class PrefixIndexTest(TestCase):
+    """Tests for the in-memory PrefixIndex."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vrf = VRF.objects.create(name="PrefixIndexVRF")
+        Prefix.objects.create(prefix="10.40.0.0/16")
+        Prefix.objects.create(prefix="10.41.1.0/24", vrf=cls.vrf)
+        Prefix.objects.create(prefix="2001:db8:40::/48")
+        Prefix.objects.create(prefix="192.0.2.0/24")
+
+    def test_covering_loads_matching_prefixes_in_one_query(self):
+        with self.assertNumQueries(1):
+            index = PrefixIndex.covering(["10.40.3.0/24", "10.41.1.1/24", "2001:db8:40:1::/64"])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(index.contains("10.40.3.0/24"))
+            self.assertTrue(index.contains("10.41.1.0/24", self.vrf))
+            self.assertTrue(index.contains("2001:db8:40:1::/64"))
+            self.assertFalse(index.contains("192.0.2.0/24"))
+
+    def test_vrf_scoping(self):
+        index = PrefixIndex.covering(["10.40.3.0/24", "10.41.1.0/24"])
+
+        self.assertTrue(index.contains("10.41.1.0/24"))
+        self.assertTrue(index.contains("10.41.1.0/24", self.vrf.pk))
+        self.assertFalse(index.contains("10.40.3.0/24", self.vrf))
+
+    def test_longer_prefix_does_not_contain_network(self):
+        index = PrefixIndex([("10.42.1.0/24", None)])
+
+        self.assertTrue(index.contains("10.42.1.128/25"))
+        self.assertTrue(index.contains("10.42.1.0/24"))
+        self.assertFalse(index.contains("10.42.0.0/16"))
+        self.assertFalse(index.contains("10.42.2.0/24"))
+
+
+class SubnetMatcherTest(TestCase):
+    """Tests for the integer SubnetMatcher."""
+
+    def test_matches_longest_subnet_per_version(self):
+        matcher = SubnetMatcher(
+            [
+                (ipaddress.ip_network("10.50.0.0/16"), "wide"),
+                (ipaddress.ip_network("10.50.1.0/24"), "narrow"),
+                (ipaddress.ip_network("2001:db8:50::/64"), "v6"),
+            ]
+        )
+        self.assertEqual(
+            matcher.match_all(
+                address_to_int(address)
+                for address in (
+                    "10.50.1.9",
+                    ipaddress.ip_address("10.50.2.9"),
+                    "2001:db8:50::9",
+                    "10.51.0.1",
+                    "2001:db8:51::1",
+                )
+            ),
+            ["narrow", "wide", "v6", None, None],
+        )
+
+    def test_first_value_wins_for_duplicate_networks(self):
+        matcher = SubnetMatcher([("10.52.0.1/24", "primary"), ("10.52.0.2/24", "secondary")])
+        self.assertEqual(matcher.match("10.52.0.200"), "primary")
+
+    def test_addresses_to_ints_skips_malformed(self):
+        converted, malformed = addresses_to_ints(["10.53.0.1", "10.53.0.300", "10.53.0.1", "fe80::1%ge-0/0/0.0", ""])
+        self.assertEqual(converted, {"10.53.0.1": (4, 0x0A350001), "fe80::1%ge-0/0/0.0": (6, (0xFE80 << 112) + 1)})
+        self.assertEqual(malformed, ["10.53.0.300", ""])
+
+    def test_int_to_address_round_trips(self):
+        for address in ("10.53.0.1", "2001:db8:53::1"):
+            self.assertEqual(int_to_address(*address_to_int(address)), address)
+
+
 class ResolveVrfTest(TestCase):
     """Tests for resolve_vrf helper."""
 
@@ -3322,3 +4124,939 @@ class CreateModuleTest(CollectorTestMixin, TestCase):
         self.assertEqual(mod.module_bay, bay)
         self.assertEqual(mod.serial, "SN123")
         self.assertTrue(mod.tags.filter(name=AUTO_D_TAG).exists())
+
+
+class ConcurrentExecuteTest(CollectorTestMixin, TestCase):
+    """Tests for concurrent per-device collection in execute()."""
+
+    def test_device_context_is_thread_local(self):
+        """Device-scoped state set in a worker thread must not leak into other threads."""
+        plan = self._create_plan()
+        collector = self._make_collector(plan)
+        collector._current_device = "main-device"
+        collector._seen_ips.add(("10.0.0.1/24", None))
+
+        seen_in_thread = {}
+
+        def worker():
+            seen_in_thread["device"] = collector._current_device
+            seen_in_thread["seen_ips"] = set(collector._seen_ips)
+            collector._current_device = "worker-device"
+            collector._log_prefix = "worker"
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertIsNone(seen_in_thread["device"])
+        self.assertEqual(seen_in_thread["seen_ips"], set())
+        self.assertEqual(collector._current_device, "main-device")
+        self.assertEqual(collector._log_prefix, "")
+        self.assertIn(("10.0.0.1/24", None), collector._seen_ips)
+
+    def test_execute_concurrently_visits_every_device(self):
+        """Every device should be handed to _collect_device() exactly once."""
+        plan = self._create_plan()
+        collector = self._make_collector(plan)
+        collector._max_workers = 4
+        collector._devices = [MagicMock(pk=i) for i in range(10)]
+
+        with patch.object(collector, "_collect_device") as mock_collect:
+            collector._execute_concurrently()
+
+        self.assertEqual(mock_collect.call_count, 10)
+        visited = {call.args[0].pk for call in mock_collect.call_args_list}
+        self.assertEqual(visited, set(range(10)))
+
+    def test_execute_concurrently_propagates_errors(self):
+        """Unhandled worker exceptions should surface to execute()'s safety net."""
+        plan = self._create_plan()
+        collector = self._make_collector(plan)
+        collector._max_workers = 2
+        collector._devices = [MagicMock(pk=1), MagicMock(pk=2)]
+
+        with patch.object(collector, "_collect_device", side_effect=NotImplementedError):
+            with self.assertRaises(NotImplementedError):
+                collector._execute_concurrently()
+
+
+ARP_REPLY = """
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/21.4R0/junos">
+  <arp-table-information xmlns="http://xml.juniper.net/junos/21.4R0/junos-arp">
+    <arp-table-entry>
+      <mac-address>
+        00:11:22:33:44:55
+      </mac-address>
+      <ip-address>10.0.0.2</ip-address>
+      <interface-name>ge-0/0/0.0</interface-name>
+      <time-to-expire>1180</time-to-expire>
+    </arp-table-entry>
+  </arp-table-information>
+</rpc-reply>
+"""
+
+
+class AsyncEngineReplayTest(TestCase):
+    """Tests for the asyncio engine's NETCONF parsing and RPC replay."""
+
+    def test_rpc_key_normalizes_names_and_drops_pyez_kwargs(self):
+        key = rpc_key("get_arp_table_information", {"no_resolve": True, "normalize": True})
+        self.assertEqual(key, ("get-arp-table-information", (("no-resolve", True),)))
+
+    def test_rpc_to_xml(self):
+        key = rpc_key("get-interface-information", {"extensive": True, "interface-name": "ge-*", "terse": False})
+        self.assertEqual(
+            rpc_to_xml(key),
+            "<get-interface-information><extensive/><interface-name>ge-*</interface-name></get-interface-information>",
+        )
+
+    def test_parse_rpc_reply_strips_namespaces_and_whitespace(self):
+        payload = parse_rpc_reply(ARP_REPLY)
+        self.assertEqual(payload.tag, "arp-table-information")
+        self.assertEqual(payload.findtext("arp-table-entry/mac-address"), "00:11:22:33:44:55")
+
+    def test_parse_rpc_reply_raises_on_error(self):
+        from napalm.base.exceptions import CommandErrorException
+
+        reply = (
+            "<rpc-reply><rpc-error><error-severity>error</error-severity>"
+            "<error-message>syntax error</error-message></rpc-error></rpc-reply>"
+        )
+        with self.assertRaisesRegex(CommandErrorException, "syntax error"):
+            parse_rpc_reply(reply)
+
+    def test_replay_device_records_then_replays(self):
+        from napalm.base.exceptions import ConnectionException
+
+        device = ReplayDevice("192.0.2.1")
+        with self.assertRaises(RPCMiss) as ctx:
+            device.rpc.get_arp_table_information(no_resolve=True)
+        device.replies[ctx.exception.key] = parse_rpc_reply(ARP_REPLY)
+
+        self.assertEqual(device.rpc.get_arp_table_information(no_resolve=True).tag, "arp-table-information")
+
+        device.recording = False
+        with self.assertRaises(ConnectionException):
+            device.rpc.get_ipv6_nd_information()
+
+    def test_enhanced_driver_parses_replayed_arp_table(self):
+        """The PyEZ tables should parse replayed replies like live ones."""
+        driver = EnhancedJunOSDriver.__new__(EnhancedJunOSDriver)
+        driver.device = ReplayDevice("192.0.2.1")
+        with self.assertRaises(RPCMiss) as ctx:
+            list(driver.get_arp_table())
+        driver.device.replies[ctx.exception.key] = parse_rpc_reply(ARP_REPLY)
+
+        entries = list(driver.get_arp_table())
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["interface"], "ge-0/0/0.0")
+        self.assertEqual(str(entries[0]["ip"]), "10.0.0.2")
+
+    def _prefetch(self, driver, getters, replies):
+        """Run AsyncNetconfSession.prefetch with a session answering from *replies*."""
+        from asgiref.sync import async_to_sync
+
+        session = AsyncNetconfSession.__new__(AsyncNetconfSession)
+        session.rpc = AsyncMock(side_effect=lambda key: replies[key[0]])
+        async_to_sync(session.prefetch)(driver, getters)
+        return session
+
+    def test_prefetch_reuses_parsed_getter_results(self):
+        """Reconciling returns the results parsed during prefetch instead of parsing again."""
+        driver = EnhancedJunOSDriver.__new__(EnhancedJunOSDriver)
+        driver.device = ReplayDevice("192.0.2.1")
+        session = self._prefetch(driver, ["get_arp_table"], {"get-arp-table-information": parse_rpc_reply(ARP_REPLY)})
+
+        self.assertEqual(session.rpc.await_count, 1)
+        driver.device.replies.clear()
+        entries = list(driver.get_arp_table())
+        self.assertEqual([str(entry["ip"]) for entry in entries], ["10.0.0.2"])
+
+    def test_prefetch_leaves_failing_getter_for_reconcile(self):
+        from napalm.base.exceptions import CommandErrorException
+
+        driver = EnhancedJunOSDriver.__new__(EnhancedJunOSDriver)
+        driver.device = ReplayDevice("192.0.2.1")
+        self._prefetch(
+            driver,
+            ["get_arp_table"],
+            {"get-arp-table-information": CommandErrorException("syntax error")},
+        )
+        with self.assertRaisesRegex(CommandErrorException, "syntax error"):
+            list(driver.get_arp_table())
+
+    def test_prefetch_propagates_getter_bugs(self):
+        driver = MagicMock()
+        driver.device = ReplayDevice("192.0.2.1")
+        driver.get_facts.side_effect = KeyError("hostname")
+        with self.assertRaises(KeyError):
+            self._prefetch(driver, ["get_facts"], {})
+
+    def test_session_verifies_host_keys_by_default(self):
+        session = AsyncNetconfSession.__new__(AsyncNetconfSession)
+        session.known_hosts = None
+        session.verify_host_key = True
+        self.assertEqual(session._known_hosts_arg(), ())
+
+        session.known_hosts = "/etc/netbox/known_hosts"
+        self.assertEqual(session._known_hosts_arg(), "/etc/netbox/known_hosts")
+
+        session.verify_host_key = False
+        self.assertIsNone(session._known_hosts_arg())
+
+    def test_replay_device_facts(self):
+        device = ReplayDevice("192.0.2.1")
+        device.recording = False
+        device.replies[rpc_key("get-software-information", {})] = parse_rpc_reply(
+            "<rpc-reply><software-information><host-name>r1</host-name>"
+            "<product-model>mx204</product-model><junos-version>21.4R3</junos-version>"
+            "</software-information></rpc-reply>"
+        )
+        device.replies[rpc_key("get-chassis-inventory", {})] = parse_rpc_reply(
+            "<rpc-reply><chassis-inventory><chassis><serial-number>ABC123</serial-number>"
+            "</chassis></chassis-inventory></rpc-reply>"
+        )
+        self.assertEqual(
+            device.facts,
+            {"hostname": "r1", "fqdn": "r1", "model": "MX204", "version": "21.4R3", "serialnumber": "ABC123"},
+        )
+
+
+class AsyncEngineExecuteTest(CollectorTestMixin, TestCase):
+    """Tests for dispatching collection to the asyncio engine."""
+
+    def _make_async_collector(self, collector_type=CollectionTypeChoices.TYPE_ARP):
+        collector = self._make_collector(self._create_plan(collector_type))
+        collector._napalm_driver = EnhancedJunOSDriver
+        return collector
+
+    @patch("netbox_facts.helpers.collector.HAS_ASYNCSSH", True)
+    @patch("netbox_facts.helpers.collector.get_plugin_config", return_value=True)
+    def test_use_async_engine_when_enabled(self, _mock_config):
+        self.assertTrue(self._make_async_collector()._use_async_engine())
+
+    @patch("netbox_facts.helpers.collector.HAS_ASYNCSSH", True)
+    @patch("netbox_facts.helpers.collector.get_plugin_config", return_value=False)
+    def test_use_async_engine_disabled_by_default(self, _mock_config):
+        self.assertFalse(self._make_async_collector()._use_async_engine())
+
+    @patch("netbox_facts.helpers.collector.HAS_ASYNCSSH", True)
+    @patch("netbox_facts.helpers.collector.get_plugin_config", return_value=True)
+    def test_use_async_engine_unsupported_collector(self, _mock_config):
+        collector = self._make_async_collector(CollectionTypeChoices.TYPE_LLDP)
+        self.assertFalse(collector._use_async_engine())
+
+    @patch("netbox_facts.helpers.collector.HAS_ASYNCSSH", False)
+    @patch("netbox_facts.helpers.collector.get_plugin_config", return_value=True)
+    def test_use_async_engine_without_asyncssh(self, _mock_config):
+        collector = self._make_async_collector()
+        self.assertFalse(collector._use_async_engine())
+        self.assertEqual(collector.plan.log[-1]["status"], LogLevelChoices.LOG_WARNING)
+
+    def test_collect_devices_async_reconciles_fetched_devices(self):
+        """Devices whose fetch succeeded are reconciled; failed fetches are skipped."""
+        from asgiref.sync import async_to_sync
+
+        collector = self._make_async_collector()
+        targets = [(MagicMock(name=f"ctx{i}"), [("192.0.2.1", "primary")], []) for i in range(3)]
+        drivers = {id(targets[0][0]): "driver0", id(targets[1][0]): None, id(targets[2][0]): "driver2"}
+
+        async def fake_fetch(ctx, connection_ips):
+            return drivers[id(ctx)]
+
+        with (
+            patch.object(collector, "_fetch_device_async", side_effect=fake_fetch),
+            patch.object(collector, "_reconcile_device") as mock_reconcile,
+        ):
+            async_to_sync(collector._collect_devices_async)(targets)
+
+        reconciled = sorted(call.args[1] for call in mock_reconcile.call_args_list)
+        self.assertEqual(reconciled, ["driver0", "driver2"])
+
+
+class MultiCollectorTest(CollectorTestMixin, TestCase):
+    """Tests for plans running several collector types over one device session."""
+
+    def _make_multi_collector(self):
+        plan = self._create_plan(
+            CollectionTypeChoices.TYPE_ARP,
+            extra_collector_types=[CollectionTypeChoices.TYPE_LLDP, CollectionTypeChoices.TYPE_INVENTORY],
+        )
+        collector = self._make_collector(plan)
+        collector._collector_types = plan.get_collector_types()
+        collector._napalm_driver = MagicMock()
+        return collector
+
+    def _connection_ips(self):
+        return patch(
+            "netbox_facts.helpers.collector.get_connection_ips",
+            return_value=[("192.0.2.1", "primary"), ("192.0.2.2", "oob")],
+        )
+
+    def test_all_collectors_share_one_session(self):
+        collector = self._make_multi_collector()
+        device = self._create_device("multi-dev1")
+        seen = []
+
+        def record(driver):
+            seen.append(collector._collector_type)
+
+        with (
+            self._connection_ips(),
+            patch.object(collector, "arp", side_effect=record),
+            patch.object(collector, "lldp", side_effect=record),
+            patch.object(collector, "inventory", side_effect=record),
+        ):
+            collector._collect_device(device)
+
+        self.assertEqual(seen, ["arp", "lldp", "inventory"])
+        collector._napalm_driver.assert_called_once()
+
+    def test_connection_loss_resumes_pending_collectors(self):
+        """A dropped session should not re-run collectors that already completed."""
+        from napalm.base.exceptions import ConnectionException
+
+        collector = self._make_multi_collector()
+        device = self._create_device("multi-dev2")
+        lldp_calls = []
+
+        def flaky_lldp(driver):
+            lldp_calls.append(driver)
+            if len(lldp_calls) == 1:
+                raise ConnectionException("session dropped")
+
+        with (
+            self._connection_ips(),
+            patch.object(collector, "arp") as mock_arp,
+            patch.object(collector, "lldp", side_effect=flaky_lldp),
+            patch.object(collector, "inventory") as mock_inventory,
+        ):
+            collector._collect_device(device)
+
+        self.assertEqual(mock_arp.call_count, 1)
+        self.assertEqual(len(lldp_calls), 2)
+        self.assertEqual(mock_inventory.call_count, 1)
+        self.assertEqual(collector._napalm_driver.call_count, 2)
+
+    def test_unknown_collector_type_raises(self):
+        collector = self._make_multi_collector()
+        with self.assertRaises(NotImplementedError):
+            collector._run_collector("does_not_exist", MagicMock())
+
+
+class TimingInstrumentationTest(CollectorTestMixin, TestCase):
+    """Tests for the per-device phase timings recorded for the report."""
+
+    def test_napalm_rpc_times_call_and_drains_generator(self):
+        collector = self._make_collector(self._create_plan())
+        result = collector._napalm_rpc(lambda: (row for row in [1, 2]), "ARP data")
+        self.assertEqual(result, [1, 2])
+        timings = collector._ctx.timings
+        self.assertIn("rpc", timings)
+        self.assertEqual(list(timings["calls"]), ["ARP data"])
+
+    def test_napalm_rpc_streams_generator(self):
+        collector = self._make_collector(self._create_plan())
+        pulled = []
+
+        def getter():
+            for row in [1, 2, 3]:
+                pulled.append(row)
+                yield row
+
+        result = collector._napalm_rpc(getter, "ARP data", stream=True)
+        self.assertEqual(pulled, [1])
+        self.assertEqual(list(result), [1, 2, 3])
+        self.assertEqual(list(collector._napalm_rpc(lambda: (row for row in []), "ARP data", stream=True)), [])
+
+    def test_replayed_calls_count_as_parse(self):
+        collector = self._make_collector(self._create_plan())
+        collector._ctx.replaying = True
+        collector._napalm_rpc(dict, "inventory data")
+        self.assertIn("parse", collector._ctx.timings)
+        self.assertNotIn("rpc", collector._ctx.timings)
+
+    def test_reconcile_excludes_driver_calls(self):
+        collector = self._make_collector(self._create_plan())
+
+        def arp(driver):
+            collector._add_timing("rpc", 4.0, "ARP data")
+            collector._add_timing("entries", 1.5)
+
+        with (
+            patch.object(collector, "arp", side_effect=arp),
+            patch("netbox_facts.helpers.collector.time.monotonic", side_effect=[100.0, 110.0]),
+        ):
+            collector._run_collector("arp", MagicMock())
+
+        self.assertEqual(collector._ctx.timings["reconcile"], 4.5)
+
+    def test_collectors_count_devices_and_rpcs_in_metrics(self):
+        plan = self._create_plan()
+        collector = self._make_collector(plan)
+        devices = {"plan": plan.name, "collector_type": "arp"}
+        devices_before = metrics.REGISTRY.get_sample_value("netbox_facts_devices_collected_total", devices) or 0
+        rpcs_before = (
+            metrics.REGISTRY.get_sample_value("netbox_facts_rpc_duration_seconds_count", {"call": "ARP data"}) or 0
+        )
+
+        with patch.object(collector, "arp", side_effect=lambda driver: collector._napalm_rpc(dict, "ARP data")):
+            collector._run_collector("arp", MagicMock())
+
+        self.assertEqual(
+            metrics.REGISTRY.get_sample_value("netbox_facts_devices_collected_total", devices), devices_before + 1
+        )
+        self.assertEqual(
+            metrics.REGISTRY.get_sample_value("netbox_facts_rpc_duration_seconds_count", {"call": "ARP data"}),
+            rpcs_before + 1,
+        )
+
+    def test_collect_device_stores_timings(self):
+        collector = self._make_collector(self._create_plan())
+        collector._napalm_driver = MagicMock()
+        device = self._create_device("timing-dev1")
+
+        with (
+            patch(
+                "netbox_facts.helpers.collector.get_connection_ips",
+                return_value=[("192.0.2.1", "primary")],
+            ),
+            patch.object(collector, "arp"),
+        ):
+            collector._collect_device(device)
+
+        timings = collector.device_timings[str(device.pk)]
+        self.assertEqual(timings["name"], "timing-dev1")
+        for phase in ("total", "connect", "reconcile"):
+            self.assertIn(phase, timings)
+        self.assertGreaterEqual(timings["total"], timings["connect"])
+
+
+class EntryBufferTest(CollectorTestMixin, TestCase):
+    """Tests for buffered FactsReportEntry writes."""
+
+    def _make_reporting_collector(self):
+        from netbox_facts.models.facts_report import FactsReport
+
+        plan = self._create_plan()
+        collector = self._make_collector(plan)
+        collector._report = FactsReport.objects.create(collection_plan=plan)
+        collector._current_device = self._create_device(f"buffer-dev-{id(collector)}")
+        return collector
+
+    def _record(self, collector, name):
+        return collector._record_entry(
+            EntryActionChoices.ACTION_NEW,
+            CollectionTypeChoices.TYPE_INVENTORY,
+            collector._current_device,
+            {"name": name},
+            object_repr=name,
+        )
+
+    def test_entries_written_on_flush(self):
+        collector = self._make_reporting_collector()
+        entry = self._record(collector, "one")
+        self.assertIsNone(entry.pk)
+        self.assertEqual(collector._report.entries.count(), 0)
+
+        collector._flush_entries()
+        self.assertIsNotNone(entry.pk)
+        self.assertEqual(collector._report.entries.count(), 1)
+
+    def test_applied_before_flush_is_inserted_applied(self):
+        collector = self._make_reporting_collector()
+        device = collector._current_device
+        entry = self._record(collector, "one")
+        ContentType.objects.get_for_model(device)
+
+        with self.assertNumQueries(1):
+            collector._mark_entry_applied(entry, device, object_repr="Device")
+            collector._flush_entries()
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "applied")
+        self.assertEqual(entry.object_id, device.pk)
+        self.assertEqual(entry.object_repr, "Device")
+
+    def test_applied_after_flush_is_bulk_updated(self):
+        collector = self._make_reporting_collector()
+        first = self._record(collector, "one")
+        second = self._record(collector, "two")
+        collector._flush_entries()
+
+        collector._mark_entry_applied(first)
+        collector._mark_entry_applied(second)
+        with self.assertNumQueries(1):
+            collector._flush_entries()
+
+        self.assertEqual(collector._report.entries.filter(status="applied").count(), 2)
+
+    def test_full_buffer_flushes_before_adding(self):
+        collector = self._make_reporting_collector()
+        collector._ctx.entries = EntryBuffer(batch_size=2)
+        entries = [self._record(collector, name) for name in ("one", "two", "three")]
+
+        self.assertEqual(collector._report.entries.count(), 2)
+        self.assertIsNone(entries[-1].pk)
+
+    def test_copy_ingestion_assigns_primary_keys(self):
+        collector = self._make_reporting_collector()
+        collector._ctx.entries = EntryBuffer(ingestion=INGESTION_COPY)
+        first = self._record(collector, "one")
+        second = self._record(collector, "two")
+        collector._flush_entries()
+
+        self.assertIsNotNone(first.pk)
+        self.assertNotEqual(first.pk, second.pk)
+        stored = collector._report.entries.get(pk=second.pk)
+        self.assertEqual(stored.detected_values, {"name": "two"})
+        self.assertEqual(stored.object_repr, "two")
+        self.assertIsNotNone(stored.created)
+
+        collector._mark_entry_applied(first)
+        collector._flush_entries()
+        first.refresh_from_db()
+        self.assertEqual(first.status, "applied")
+
+    def test_collector_method_flushes_on_return(self):
+        collector = self._make_reporting_collector()
+        driver = MagicMock()
+        driver.get_facts.return_value = {"serial_number": "SN-BUFFER"}
+        driver.get_chassis_inventory.return_value = {}
+
+        collector.inventory(driver)
+
+        self.assertEqual(len(collector._ctx.entries), 0)
+        self.assertTrue(collector._report.entries.exists())
+
+
+class BulkNeighborReconciliationTest(CollectorTestMixin, TestCase):
+    """Tests for set-based reconciliation of ARP/NDP entries."""
+
+    def _run_arp(self, bulk=True):
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_ARP)
+        device = self._create_device(f"bulk-arp-dev-{id(self)}")
+        interface = Interface.objects.create(device=device, name="ge-0/0/0", type="1000base-t")
+        Prefix.objects.create(prefix="10.20.0.0/24")
+        existing_ip = IPAddress.objects.create(address="10.20.0.2/24")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_network_instances.return_value = {
+            "default": {
+                "name": "default",
+                "type": "DEFAULT_INSTANCE",
+                "state": {"route_distinguisher": ""},
+                "interfaces": {"interface": {"ge-0/0/0": {}}},
+            }
+        }
+        driver.get_interfaces_ip.return_value = {"ge-0/0/0": {"ipv4": {"10.20.0.1": {"prefix_length": 24}}}}
+        driver.get_arp_table.return_value = [
+            {"interface": "ge-0/0/0", "mac": "AA:BB:CC:20:00:02", "ip": "10.20.0.2", "age": 60.0},
+            {"interface": "ge-0/0/0", "mac": "AA:BB:CC:20:00:03", "ip": "10.20.0.3", "age": 60.0},
+        ]
+
+        with patch(
+            "netbox_facts.helpers.collector.get_plugin_config",
+            side_effect=lambda plugin, name, default=None: bulk if name == "bulk_reconciliation" else default,
+        ):
+            collector.arp(driver)
+        return interface, existing_ip
+
+    def test_links_macs_interfaces_and_ips(self):
+        existing_mac, _ = get_or_create_mac("AA:BB:CC:20:00:02")
+        interface, existing_ip = self._run_arp()
+
+        macs = MACAddress.objects.filter(interfaces=interface)
+        self.assertEqual(macs.count(), 2)
+        self.assertIn(existing_mac, macs)
+        self.assertIn(existing_ip, existing_mac.ip_addresses.all())
+        new_mac = MACAddress.objects.get(mac_address="AA:BB:CC:20:00:03")
+        self.assertTrue(new_mac.tags.filter(name=AUTO_D_TAG).exists())
+        self.assertEqual(str(new_mac.ip_addresses.get().address), "10.20.0.3/24")
+        self.assertFalse(macs.filter(last_seen__isnull=True).exists())
+
+    def test_created_ip_is_journaled(self):
+        self._run_arp()
+        new_ip = IPAddress.objects.get(address="10.20.0.3/24")
+        self.assertTrue(new_ip.tags.filter(name=AUTO_D_TAG).exists())
+        self.assertTrue(JournalEntry.objects.filter(assigned_object_id=new_ip.pk).exists())
+
+    def test_ips_are_created_in_bulk_by_default(self):
+        """Without bulk_reconciliation, MACs are saved one by one but IPs are still created in bulk."""
+        with patch("netbox_facts.helpers.collector.bulk_get_or_create_ips", wraps=bulk_get_or_create_ips) as mock_bulk:
+            interface, existing_ip = self._run_arp(bulk=False)
+        mock_bulk.assert_called_once()
+
+        new_ip = IPAddress.objects.get(address="10.20.0.3/24")
+        self.assertTrue(new_ip.tags.filter(name=AUTO_D_TAG).exists())
+        self.assertTrue(JournalEntry.objects.filter(assigned_object_id=new_ip.pk).exists())
+        existing_mac = MACAddress.objects.get(mac_address="AA:BB:CC:20:00:02")
+        self.assertIn(existing_ip, existing_mac.ip_addresses.all())
+        self.assertEqual(MACAddress.objects.filter(interfaces=interface).count(), 2)
+
+    def test_malformed_address_is_skipped(self):
+        """A malformed row is logged and skipped instead of aborting the device."""
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_ARP)
+        device = self._create_device(f"bad-arp-dev-{id(self)}")
+        interface = Interface.objects.create(device=device, name="ge-0/0/0", type="1000base-t")
+        Prefix.objects.create(prefix="10.23.0.0/24")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_network_instances.return_value = {
+            "default": {
+                "name": "default",
+                "type": "DEFAULT_INSTANCE",
+                "state": {"route_distinguisher": ""},
+                "interfaces": {"interface": {"ge-0/0/0": {}}},
+            }
+        }
+        driver.get_interfaces_ip.return_value = {"ge-0/0/0": {"ipv4": {"10.23.0.1": {"prefix_length": 24}}}}
+        driver.get_arp_table.return_value = [
+            {"interface": "ge-0/0/0", "mac": "AA:BB:CC:23:00:02", "ip": "10.23.0.256", "age": 60.0},
+            {"interface": "ge-0/0/0", "mac": "AA:BB:CC:23:00:03", "ip": "10.23.0.3", "age": 60.0},
+        ]
+        collector.arp(driver)
+
+        self.assertTrue(any("Invalid IP address `10.23.0.256`" in entry["message"] for entry in collector.plan.log))
+        new_mac = MACAddress.objects.get(interfaces=interface)
+        self.assertEqual(str(new_mac.ip_addresses.get().address), "10.23.0.3/24")
+
+    def test_unsorted_table_in_small_chunks(self):
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_ARP)
+        device = self._create_device(f"chunked-arp-dev-{id(self)}")
+        ge0 = Interface.objects.create(device=device, name="ge-0/0/0", type="1000base-t")
+        ge1 = Interface.objects.create(device=device, name="ge-0/0/1", type="1000base-t")
+        Prefix.objects.create(prefix="10.21.0.0/24")
+        Prefix.objects.create(prefix="10.22.0.0/24")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_network_instances.return_value = {
+            "default": {
+                "name": "default",
+                "type": "DEFAULT_INSTANCE",
+                "state": {"route_distinguisher": ""},
+                "interfaces": {"interface": {"ge-0/0/0": {}, "ge-0/0/1": {}}},
+            }
+        }
+        driver.get_interfaces_ip.return_value = {
+            "ge-0/0/0": {"ipv4": {"10.21.0.1": {"prefix_length": 24}}},
+            "ge-0/0/1": {"ipv4": {"10.22.0.1": {"prefix_length": 24}}},
+        }
+        driver.get_arp_table.return_value = iter(
+            [
+                {"interface": "ge-0/0/0", "mac": "AA:BB:CC:21:00:02", "ip": "10.21.0.2", "age": 60.0},
+                {"interface": "ge-0/0/1", "mac": "AA:BB:CC:22:00:02", "ip": "10.22.0.2", "age": 60.0},
+                {"interface": "ge-0/0/0", "mac": "AA:BB:CC:21:00:03", "ip": "10.21.0.3", "age": 60.0},
+                {"interface": "ge-0/0/1", "mac": "", "ip": "10.22.0.3", "age": 60.0},
+                {"interface": "ge-0/0/1", "mac": "AA:BB:CC:22:00:04", "ip": "10.22.0.4", "age": 60.0},
+            ]
+        )
+
+        settings = {"bulk_reconciliation": True, "neighbor_chunk_size": 2}
+        with patch(
+            "netbox_facts.helpers.collector.get_plugin_config",
+            side_effect=lambda plugin, name, default=None: settings.get(name, default),
+        ):
+            collector.arp(driver)
+
+        self.assertEqual(MACAddress.objects.filter(interfaces=ge0).count(), 2)
+        self.assertEqual(MACAddress.objects.filter(interfaces=ge1).count(), 2)
+        self.assertFalse(IPAddress.objects.filter(address="10.22.0.3/24").exists())
+        self.assertTrue(IPAddress.objects.filter(address="10.22.0.4/24").exists())
+
+    def test_missing_interface_warned_once_across_chunks(self):
+        plan = self._create_plan(collector_type=CollectionTypeChoices.TYPE_ARP)
+        device = self._create_device(f"chunked-noif-dev-{id(self)}")
+        collector = self._make_collector(plan)
+        collector._current_device = device
+
+        driver = MagicMock()
+        driver.get_network_instances.return_value = {
+            "default": {
+                "name": "default",
+                "type": "DEFAULT_INSTANCE",
+                "state": {"route_distinguisher": ""},
+                "interfaces": {"interface": {"ge-0/0/9": {}}},
+            }
+        }
+        driver.get_interfaces_ip.return_value = {"ge-0/0/9": {"ipv4": {"10.24.0.1": {"prefix_length": 24}}}}
+        driver.get_arp_table.return_value = iter(
+            {"interface": "ge-0/0/9", "mac": f"AA:BB:CC:24:00:0{i}", "ip": f"10.24.0.{i}", "age": 60.0}
+            for i in range(2, 7)
+        )
+
+        with (
+            patch(
+                "netbox_facts.helpers.collector.get_plugin_config",
+                side_effect=lambda plugin, name, default=None: 2 if name == "neighbor_chunk_size" else default,
+            ),
+            patch.object(collector, "_log_warning") as log_warning,
+        ):
+            collector.arp(driver)
+
+        warnings = [call.args[0] for call in log_warning.call_args_list]
+        self.assertEqual(len([warning for warning in warnings if "Could not find interface" in warning]), 1)
+
+
+class RaceConnectionsTest(CollectorTestMixin, TestCase):
+    """Tests for happy-eyeballs style connection racing."""
+
+    CANDIDATES = [("192.0.2.1", "primary"), ("198.51.100.1", "oob")]
+
+    def _race(self, open_driver, stagger):
+        collector = self._make_collector(self._create_plan())
+        collector._current_device = self._create_device(f"race-dev-{id(open_driver)}")
+        with (
+            patch("netbox_facts.helpers.collector.get_plugin_config", return_value=stagger),
+            patch.object(collector, "_open_driver", side_effect=open_driver),
+        ):
+            return collector._race_connections(self.CANDIDATES)
+
+    def test_fallback_wins_when_first_hangs(self):
+        released = threading.Event()
+        slow_driver = MagicMock(name="primary")
+
+        def open_driver(ip):
+            if ip == "192.0.2.1":
+                released.wait(5)
+                return slow_driver
+            return MagicMock(name="oob")
+
+        driver, ip, label = self._race(open_driver, stagger=0.01)
+        released.set()
+
+        self.assertEqual((ip, label), ("198.51.100.1", "oob"))
+        for _ in range(100):
+            if slow_driver.close.called:
+                break
+            threading.Event().wait(0.01)
+        slow_driver.close.assert_called_once()
+
+    def test_fallback_starts_immediately_on_failure(self):
+        from napalm.base.exceptions import ConnectionException
+
+        def open_driver(ip):
+            if ip == "192.0.2.1":
+                raise ConnectionException("refused")
+            return MagicMock(name="oob")
+
+        # A stagger longer than the test timeout proves we did not wait for it.
+        driver, ip, label = self._race(open_driver, stagger=600)
+        self.assertEqual(label, "oob")
+
+    def test_returns_none_when_all_attempts_fail(self):
+        from napalm.base.exceptions import ConnectionException
+
+        def open_driver(ip):
+            raise ConnectionException("unreachable")
+
+        self.assertIsNone(self._race(open_driver, stagger=0.01))
+
+
+class ReachabilityBackoffTest(CollectorTestMixin, TestCase):
+    """Tests for skipping devices that repeatedly failed to connect."""
+
+    CANDIDATES = [("192.0.2.1", "primary"), ("198.51.100.1", "oob")]
+
+    def setUp(self):
+        self.device = self._create_device("backoff-dev")
+        self.collector = self._make_collector(self._create_plan())
+        self.collector._current_device = self.device
+
+    def _fail(self, ip, times):
+        for _ in range(times):
+            record = DeviceReachability.objects.record_failure(self.device, ip, "timed out", now=self.collector._now)
+        return record
+
+    def test_backoff_starts_at_threshold_and_doubles(self):
+        record = self._fail("192.0.2.1", 2)
+        self.assertIsNone(record.next_attempt)
+        record = self._fail("192.0.2.1", 1)
+        self.assertEqual((record.next_attempt - self.collector._now).total_seconds(), 900)
+        record = self._fail("192.0.2.1", 1)
+        self.assertEqual((record.next_attempt - self.collector._now).total_seconds(), 1800)
+
+    def test_failure_locks_record_while_counting(self):
+        self._fail("192.0.2.1", 1)
+        with CaptureQueriesContext(connection) as queries:
+            record = self._fail("192.0.2.1", 1)
+        self.assertEqual(record.failure_count, 2)
+        self.assertTrue(any("FOR UPDATE" in query["sql"] for query in queries.captured_queries))
+
+    def test_success_clears_record(self):
+        self._fail("192.0.2.1", 3)
+        DeviceReachability.objects.record_success(self.device, "192.0.2.1")
+        self.assertFalse(DeviceReachability.objects.filter(device=self.device).exists())
+
+    def test_backed_off_ip_is_skipped_when_probe_fails(self):
+        self._fail("192.0.2.1", 3)
+        with patch.object(self.collector, "_probe", return_value=False):
+            result = self.collector._reachable_connection_ips(self.CANDIDATES)
+        self.assertEqual(result, [("198.51.100.1", "oob")])
+
+    def test_backed_off_ip_is_deprioritised_when_probe_succeeds(self):
+        self._fail("192.0.2.1", 3)
+        with patch.object(self.collector, "_probe", return_value=True):
+            result = self.collector._reachable_connection_ips(self.CANDIDATES)
+        self.assertEqual(result, [("198.51.100.1", "oob"), ("192.0.2.1", "primary")])
+
+    def test_device_skipped_when_every_ip_backs_off(self):
+        self._fail("192.0.2.1", 3)
+        self._fail("198.51.100.1", 3)
+        with patch.object(self.collector, "_probe", return_value=False):
+            result = self.collector._reachable_connection_ips(self.CANDIDATES)
+        self.assertEqual(result, [])
+        self.assertEqual(self.collector.plan.log[-1]["status"], LogLevelChoices.LOG_WARNING)
+
+    def test_async_probe_runs_for_backed_off_ips_only(self):
+        from asgiref.sync import async_to_sync
+
+        self._fail("192.0.2.1", 3)
+        healthy, backed_off = self.collector._backed_off_connection_ips(self.CANDIDATES, self.device)
+        self.assertEqual(healthy, [("198.51.100.1", "oob")])
+        ctx = MagicMock(log_prefix="")
+        with patch.object(self.collector, "_probe_async", AsyncMock(return_value=True)) as mock_probe:
+            result = async_to_sync(self.collector._reachable_connection_ips_async)(ctx, healthy, backed_off)
+        mock_probe.assert_awaited_once_with("192.0.2.1")
+        self.assertEqual(result, [("198.51.100.1", "oob"), ("192.0.2.1", "primary")])
+
+    def test_async_probe_skips_device_when_every_ip_backs_off(self):
+        from asgiref.sync import async_to_sync
+
+        self._fail("192.0.2.1", 3)
+        self._fail("198.51.100.1", 3)
+        healthy, backed_off = self.collector._backed_off_connection_ips(self.CANDIDATES, self.device)
+        with patch.object(self.collector, "_probe_async", AsyncMock(return_value=False)):
+            result = async_to_sync(self.collector._reachable_connection_ips_async)(
+                MagicMock(log_prefix=""), healthy, backed_off
+            )
+        self.assertEqual(result, [])
+        self.assertEqual(self.collector.plan.log[-1]["status"], LogLevelChoices.LOG_WARNING)
+
+    def test_connection_failure_is_recorded(self):
+        from napalm.base.exceptions import ConnectionException
+
+        self.collector._napalm_driver = MagicMock(side_effect=ConnectionException("refused"))
+        with patch(
+            "netbox_facts.helpers.collector.get_connection_ips",
+            return_value=[("192.0.2.1", "primary")],
+        ):
+            self.collector._collect_device(self.device)
+
+        record = DeviceReachability.objects.get(device=self.device, ip_address="192.0.2.1")
+        self.assertEqual(record.failure_count, 1)
+        self.assertEqual(record.last_error, "refused")
+
+    def test_dropped_session_is_retried_without_recording_failure(self):
+        from napalm.base.exceptions import ConnectionException
+
+        self._fail("192.0.2.1", 1)
+        self.collector._napalm_driver = MagicMock()
+        with (
+            patch(
+                "netbox_facts.helpers.collector.get_connection_ips",
+                return_value=[("192.0.2.1", "primary")],
+            ),
+            patch.object(
+                self.collector, "_run_collector", side_effect=[ConnectionException("reset"), None]
+            ) as run_collector,
+        ):
+            self.collector._collect_device(self.device)
+
+        self.assertEqual(self.collector._napalm_driver.call_count, 2)
+        self.assertEqual(run_collector.call_args_list[0].args[0], run_collector.call_args_list[1].args[0])
+        # The successful connection cleared the earlier failure and the drop recorded none
+        self.assertFalse(DeviceReachability.objects.filter(device=self.device).exists())
+
+    def test_clear_reachability_command(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        self._fail("192.0.2.1", 3)
+        out = StringIO()
+        call_command("clear_reachability", device=[self.device.name], stdout=out)
+        self.assertIn("Cleared 1", out.getvalue())
+        self.assertFalse(DeviceReachability.objects.exists())
+
+
+class ConcurrencyGovernorTest(TestCase):
+    """Tests for the per-site / per-platform session governor."""
+
+    @staticmethod
+    def _device(site_id=1, platform_id=1):
+        return MagicMock(site_id=site_id, platform_id=platform_id)
+
+    def test_site_limit(self):
+        governor = ConcurrencyGovernor(10, site_limit=2)
+        self.assertTrue(governor.try_acquire(self._device(site_id=1)))
+        self.assertTrue(governor.try_acquire(self._device(site_id=1)))
+        self.assertFalse(governor.try_acquire(self._device(site_id=1)))
+        self.assertTrue(governor.try_acquire(self._device(site_id=2)))
+
+    def test_platform_and_global_limits(self):
+        governor = ConcurrencyGovernor(3, platform_limit=1)
+        self.assertTrue(governor.try_acquire(self._device(site_id=1, platform_id=1)))
+        self.assertFalse(governor.try_acquire(self._device(site_id=2, platform_id=1)))
+        self.assertTrue(governor.try_acquire(self._device(site_id=2, platform_id=2)))
+        self.assertTrue(governor.try_acquire(self._device(site_id=3, platform_id=3)))
+        self.assertFalse(governor.try_acquire(self._device(site_id=4, platform_id=4)))
+
+    def test_release_frees_slot(self):
+        governor = ConcurrencyGovernor(1)
+        device = self._device()
+        self.assertTrue(governor.try_acquire(device))
+        governor.release(device)
+        self.assertTrue(governor.try_acquire(device))
+
+    def test_congestion_halves_then_success_recovers(self):
+        governor = ConcurrencyGovernor(8)
+        device = self._device()
+        lowered = governor.record_congestion(device)
+        self.assertEqual(lowered, [("site", 4), ("platform", 4)])
+        self.assertEqual(governor.limit(("site", 1)), 4)
+        self.assertEqual(governor.limit(("global", None)), 8)
+
+        for _ in range(50):
+            governor.record_success(device)
+        self.assertEqual(governor.limit(("site", 1)), 8)
+
+    def test_congestion_cooldown(self):
+        governor = ConcurrencyGovernor(8)
+        device = self._device()
+        governor.record_congestion(device)
+        self.assertEqual(governor.record_congestion(device), [])
+        self.assertEqual(governor.limit(("site", 1)), 4)
+
+    def test_non_adaptive_keeps_limits(self):
+        governor = ConcurrencyGovernor(8, adaptive=False)
+        self.assertEqual(governor.record_congestion(self._device()), [])
+        self.assertEqual(governor.limit(("site", 1)), 8)
+
+    def test_slot_blocks_until_release(self):
+        governor = ConcurrencyGovernor(1)
+        device = self._device()
+        entered = threading.Event()
+
+        def worker():
+            with governor.slot(device):
+                entered.set()
+
+        self.assertTrue(governor.try_acquire(device))
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(entered.wait(0.05))
+        governor.release(device)
+        thread.join(5)
+        self.assertTrue(entered.is_set())
+
+    def test_interleave_by_site(self):
+        devices = [self._device(site_id=site) for site in (1, 1, 1, 2, 3, 3)]
+        ordered = NapalmCollector._interleave_by_site(devices)
+        self.assertEqual([d.site_id for d in ordered], [1, 2, 3, 1, 3, 1])
@@ -1,13 +1,25 @@
-from unittest.mock import MagicMock, patch
+from datetime import timedelta
+from unittest.mock import ANY, MagicMock, patch
 
 from dcim.choices import DeviceStatusChoices
 from django.test import TestCase
+from django.utils import timezone
 
+from netbox_facts import metrics
 from netbox_facts.choices import CollectionTypeChoices
-from netbox_facts.jobs import CollectionJobRunner
+from netbox_facts.jobs import CollectionFinalizeJobRunner, CollectionJobRunner, CollectionShardJobRunner
 from netbox_facts.models import CollectionPlan
 
 
+def _make_job(name="Facts Collection", queued_for=0):
+    """Return a mock Job that started *queued_for* seconds after it was created."""
+    job = MagicMock()
+    job.name = name
+    job.created = timezone.now()
+    job.started = job.created + timedelta(seconds=queued_for)
+    return job
+
+
 class CollectionJobRunnerTest(TestCase):
     """Tests for CollectionJobRunner."""
 
@@ -50,7 +62,7 @@ class CollectionJobRunnerTest(TestCase):
         mock_plan.log = []
         mock_plan_cls.objects.get.return_value = mock_plan
 
-        mock_job = MagicMock()
+        mock_job = _make_job()
         mock_job.object_id = self.plan.pk
 
         runner = CollectionJobRunner(mock_job)
@@ -68,10 +80,83 @@ class CollectionJobRunnerTest(TestCase):
         mock_plan_cls.objects.get.return_value = mock_plan
         mock_request = MagicMock()
 
-        mock_job = MagicMock()
+        mock_job = _make_job()
         mock_job.object_id = self.plan.pk
 
         runner = CollectionJobRunner(mock_job)
         runner.run(request=mock_request)
 
         mock_plan.run.assert_called_once_with(request=mock_request)
+
+    @patch("netbox_facts.models.CollectionPlan")
+    def test_run_records_queue_wait(self, mock_plan_cls):
+        """run() should observe the time the job spent queued."""
+        mock_plan_cls.objects.get.return_value = MagicMock(log=[])
+        labels = {"job": "Facts Collection"}
+        before = metrics.REGISTRY.get_sample_value("netbox_facts_job_queue_wait_seconds_sum", labels) or 0
+
+        runner = CollectionJobRunner(_make_job(queued_for=42))
+        runner.run()
+
+        self.assertEqual(
+            metrics.REGISTRY.get_sample_value("netbox_facts_job_queue_wait_seconds_sum", labels), before + 42
+        )
+
+
+class CollectionShardJobRunnerTest(TestCase):
+    """Tests for CollectionShardJobRunner."""
+
+    def test_runner_name(self):
+        self.assertEqual(CollectionShardJobRunner.name, "Facts Collection Shard")
+
+    @patch("netbox_facts.models.facts_report.FactsReport")
+    @patch("netbox_facts.models.CollectionPlan")
+    def test_run_calls_plan_run_shard(self, mock_plan_cls, mock_report_cls):
+        """run() should collect the shard into the parent report and save the log and timings."""
+        mock_plan = MagicMock()
+        mock_plan.log = [{"message": "shard line"}]
+        mock_plan.run_shard.side_effect = lambda report, device_ids, request, timings: timings.update(
+            {"10": {"name": "dev10", "total": 1.5}}
+        )
+        mock_plan_cls.objects.get.return_value = mock_plan
+        mock_report = MagicMock()
+        mock_report_cls.objects.get.return_value = mock_report
+
+        runner = CollectionShardJobRunner(_make_job("Facts Collection Shard"))
+        runner.run(plan_id=1, report_id=2, device_ids=[10, 11])
+
+        mock_plan_cls.objects.get.assert_called_once_with(pk=1)
+        mock_report_cls.objects.get.assert_called_once_with(pk=2)
+        mock_plan.run_shard.assert_called_once_with(mock_report, [10, 11], request=None, timings=ANY)
+        self.assertEqual(
+            runner.job.data,
+            {"log": [{"message": "shard line"}], "timings": {"10": {"name": "dev10", "total": 1.5}}},
+        )
+
+
+class CollectionFinalizeJobRunnerTest(TestCase):
+    """Tests for CollectionFinalizeJobRunner."""
+
+    def test_runner_name(self):
+        self.assertEqual(CollectionFinalizeJobRunner.name, "Facts Collection Finalize")
+
+    @patch("netbox_facts.models.facts_report.FactsReport")
+    @patch("netbox_facts.models.CollectionPlan")
+    def test_run_finishes_sharded_run(self, mock_plan_cls, mock_report_cls):
+        """run() should merge the shards into the report and save the merged log, even on failure."""
+        mock_plan = MagicMock()
+        mock_plan.log = [{"message": "merged"}]
+        mock_plan.finish_sharded_run.side_effect = RuntimeError("shard failed")
+        mock_plan_cls.objects.get.return_value = mock_plan
+        mock_report = MagicMock()
+        mock_report_cls.objects.get.return_value = mock_report
+
+        job = _make_job("Facts Collection Finalize")
+        job.object_id = 1
+        runner = CollectionFinalizeJobRunner(job)
+        with self.assertRaises(RuntimeError):
+            runner.run(report_id=2, shard_job_ids=[10, 11])
+
+        mock_plan_cls.objects.get.assert_called_once_with(pk=1)
+        mock_plan.finish_sharded_run.assert_called_once_with(mock_report, [10, 11])
+        self.assertEqual(runner.job.data, {"log": [{"message": "merged"}]})
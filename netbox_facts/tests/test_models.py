@@ -1,3 +1,8 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+from core.choices import JobStatusChoices
+from core.models import Job
 from dcim.choices import DeviceStatusChoices
 from dcim.models import (
     Device,
@@ -7,14 +12,17 @@ from dcim.models import (
     Platform,
     Site,
 )
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 from netaddr import EUI
 
 from netbox_facts.choices import (
     CollectionTypeChoices,
     CollectorStatusChoices,
+    ReportStatusChoices,
 )
-from netbox_facts.models import CollectionPlan, MACAddress, MACVendor
+from netbox_facts.exceptions import CollectionFailed
+from netbox_facts.models import CollectionPlan, FactsReport, MACAddress, MACVendor
 
 
 class MACAddressModelTest(TestCase):
@@ -116,6 +124,27 @@ class MACAddressVendorSignalTest(TestCase):
         mac.refresh_from_db()
         self.assertEqual(mac.vendor_id, vendor.pk)
 
+    def test_vendor_change_matches_prefix_range_only(self):
+        """Only MACs within the vendor's 24-bit prefix, bounds included, should be re-pointed."""
+        inside = [
+            MACAddress.objects.create(mac_address="DD:EE:F1:00:00:00"),
+            MACAddress.objects.create(mac_address="DD:EE:F1:FF:FF:FF"),
+        ]
+        outside = [
+            MACAddress.objects.create(mac_address="DD:EE:F0:FF:FF:FF"),
+            MACAddress.objects.create(mac_address="DD:EE:F2:00:00:00"),
+        ]
+        vendor = MACVendor.objects.create(
+            vendor_name="Range Vendor",
+            mac_prefix=EUI("DD:EE:F1:00:00:00"),
+        )
+        for mac in inside:
+            mac.refresh_from_db()
+            self.assertEqual(mac.vendor_id, vendor.pk)
+        for mac in outside:
+            mac.refresh_from_db()
+            self.assertIsNone(mac.vendor_id)
+
 
 class CollectionPlanModelTest(TestCase):
     """Tests for the CollectionPlan model."""
@@ -233,6 +262,126 @@ class CollectionPlanModelTest(TestCase):
         args = plan.get_napalm_args()
         self.assertEqual(args["timeout"], 120)
 
+    def test_get_max_workers_defaults_to_plugin_setting(self):
+        plan = self._create_plan()
+        self.assertEqual(plan.get_max_workers(), 1)
+
+    def test_get_max_workers_plan_override(self):
+        plan = self._create_plan(max_workers=8)
+        self.assertEqual(plan.get_max_workers(), 8)
+
+    def test_get_collector_types_primary_first(self):
+        plan = self._create_plan(
+            extra_collector_types=[
+                CollectionTypeChoices.TYPE_LLDP,
+                CollectionTypeChoices.TYPE_ARP,
+                CollectionTypeChoices.TYPE_INVENTORY,
+            ]
+        )
+        self.assertEqual(plan.get_collector_types(), ["arp", "lldp", "inventory"])
+        self.assertEqual(plan.get_collector_types_display(), "ARP, LLDP, Inventory")
+
+    def test_get_collector_types_single(self):
+        plan = self._create_plan()
+        self.assertEqual(plan.get_collector_types(), ["arp"])
+
+    def test_get_device_shards_disabled_by_default(self):
+        self._create_device("shard-dev1")
+        plan = self._create_plan()
+        self.assertIsNone(plan.get_device_shards())
+
+    def test_get_device_shards_not_split_when_small(self):
+        self._create_device("shard-dev1")
+        self._create_device("shard-dev2")
+        plan = self._create_plan(shard_size=2)
+        self.assertIsNone(plan.get_device_shards())
+
+    def test_get_device_shards_batches_by_pk(self):
+        devices = [self._create_device(f"shard-dev{i}") for i in range(5)]
+        plan = self._create_plan(shard_size=2)
+        pks = [d.pk for d in devices]
+        self.assertEqual(
+            plan.get_device_shards(),
+            [tuple(pks[0:2]), tuple(pks[2:4]), tuple(pks[4:5])],
+        )
+
+    def test_sharded_run_chains_finalizer_without_waiting(self):
+        for i in range(3):
+            self._create_device(f"shard-dev{i}")
+        plan = self._create_plan(shard_size=2)
+        shard_jobs = [MagicMock(pk=10 + i, job_id=uuid.uuid4()) for i in range(2)]
+
+        with (
+            patch("netbox_facts.jobs.CollectionShardJobRunner.enqueue", side_effect=shard_jobs),
+            patch("netbox_facts.jobs.CollectionFinalizeJobRunner.enqueue") as finalize,
+        ):
+            plan.run()
+
+        kwargs = finalize.call_args.kwargs
+        self.assertEqual(kwargs["instance"], plan)
+        self.assertEqual(kwargs["shard_job_ids"], [10, 11])
+        self.assertTrue(kwargs["depends_on"].allow_failure)
+        plan.refresh_from_db()
+        self.assertEqual(plan.status, CollectorStatusChoices.WORKING)
+
+    def _shard_job(self, status, log_message, timings=None):
+        return Job.objects.create(
+            name="Facts Collection Shard",
+            status=status,
+            job_id=uuid.uuid4(),
+            data={"log": [{"message": log_message}], "timings": timings or {}},
+        )
+
+    def test_finish_sharded_run_merges_shards(self):
+        plan = self._create_plan(shard_size=2)
+        report = FactsReport.objects.create(collection_plan=plan)
+        jobs = [
+            self._shard_job(JobStatusChoices.STATUS_COMPLETED, "shard one", {"1": {"total": 1.0}}),
+            self._shard_job(JobStatusChoices.STATUS_COMPLETED, "shard two", {"2": {"total": 2.0}}),
+        ]
+
+        plan.finish_sharded_run(report, [job.pk for job in jobs])
+
+        self.assertEqual([line["message"] for line in plan.log], ["shard one", "shard two"])
+        report.refresh_from_db()
+        self.assertEqual(report.status, ReportStatusChoices.STATUS_APPLIED)
+        self.assertEqual(set(report.timings["devices"]), {"1", "2"})
+        plan.refresh_from_db()
+        self.assertEqual(plan.status, CollectorStatusChoices.COMPLETED)
+        self.assertIsNotNone(plan.last_run)
+
+    def test_finish_sharded_run_fails_on_failed_shard(self):
+        plan = self._create_plan(shard_size=2)
+        report = FactsReport.objects.create(collection_plan=plan)
+        jobs = [
+            self._shard_job(JobStatusChoices.STATUS_COMPLETED, "shard one"),
+            self._shard_job(JobStatusChoices.STATUS_ERRORED, "shard two"),
+        ]
+
+        with self.assertRaises(CollectionFailed):
+            plan.finish_sharded_run(report, [job.pk for job in jobs])
+
+        report.refresh_from_db()
+        self.assertEqual(report.status, ReportStatusChoices.STATUS_FAILED)
+        self.assertIn(f"job #{jobs[1].pk}", report.error_message)
+        plan.refresh_from_db()
+        self.assertEqual(plan.status, CollectorStatusChoices.FAILED)
+
+    def test_waiting_finalizer_is_current_job(self):
+        plan = self._create_plan(shard_size=2)
+        CollectionPlan.objects.filter(pk=plan.pk).update(status=CollectorStatusChoices.WORKING)
+        finalizer = Job.objects.create(
+            name="Facts Collection Finalize",
+            object_type=ContentType.objects.get_for_model(CollectionPlan),
+            object_id=plan.pk,
+            status=JobStatusChoices.STATUS_PENDING,
+            job_id=uuid.uuid4(),
+        )
+
+        plan = CollectionPlan.objects.get(pk=plan.pk)
+        self.assertEqual(plan.status, CollectorStatusChoices.WORKING)
+        self.assertEqual(plan.get_current_job(), finalizer)
+
     def test_clean_string_napalm_args(self):
         plan = self._create_plan()
         plan.napalm_args = "invalid"
@@ -401,6 +401,12 @@ class FactsReportView(generic.ObjectView):
         skipped_count = entries.filter(status=EntryStatusChoices.STATUS_SKIPPED).count()
         failed_count = entries.filter(status=EntryStatusChoices.STATUS_FAILED).count()
 
+        slowest_devices = []
+        for device_id, timing in instance.get_slowest_devices():
+            calls = timing.get("calls") or {}
+            slowest_call = max(calls.items(), key=lambda call: call[1]) if calls else None
+            slowest_devices.append((device_id, {**timing, "slowest_call": slowest_call}))
+
         return {
             "entry_stats": {
                 "pending": pending_count,
@@ -409,6 +415,7 @@ class FactsReportView(generic.ObjectView):
                 "failed": failed_count,
                 "total": entries.count(),
             },
+            "slowest_devices": slowest_devices,
         }
 
 